@@ -0,0 +1,65 @@
+"""
+Time to first message, total time and peak memory of the sync ``List()``
+handler against the chunked async one, for growing table sizes.
+"""
+import asyncio
+import time
+import tracemalloc
+
+from common import setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import AsyncPostService, PostService  # noqa: E402
+
+
+def measure_sync(servicer):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    for _ in servicer.List(posts_pb2.PostListRequest(), FakeContext()):
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, peak
+
+
+async def measure_async(servicer):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    async for _ in servicer.List(posts_pb2.PostListRequest(), FakeContext()):
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, peak
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    sync_servicer = PostService.as_servicer()
+    async_servicer = AsyncPostService.as_servicer()
+    rows = 0
+    print('%8s  %-6s %12s %10s %12s' % ('rows', 'List', 'first msg', 'total', 'peak memory'))
+    for size in (500, 2000, 8000):
+        Post.objects.bulk_create(
+            Post(title='post %d' % i, author=author) for i in range(size - rows)
+        )
+        rows = size
+        for label, (first, total, peak) in (
+            ('sync', measure_sync(sync_servicer)),
+            ('async', asyncio.run(measure_async(async_servicer))),
+        ):
+            print('%8d  %-6s %9.1f ms %7.0f ms %9.0f KiB' % (
+                size, label, first * 1e3, total * 1e3, peak / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Concurrent ``Retrieve`` calls against the sync mixins, run on a thread pool
+like the ``grpc.aio`` server does, and against the async mixins.
+"""
+import asyncio
+from concurrent import futures
+import time
+
+from common import setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import AsyncPostService, PostService  # noqa: E402
+
+
+CONCURRENCY = 200
+ROUNDS = 5
+
+
+async def run_sync(servicer, requests, pool):
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(
+        loop.run_in_executor(pool, servicer.Retrieve, request, FakeContext())
+        for request in requests
+    ))
+
+
+async def run_async(servicer, requests):
+    await asyncio.gather(*(
+        servicer.Retrieve(request, FakeContext()) for request in requests
+    ))
+
+
+def timed(coro_factory):
+    best = float('inf')
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        asyncio.run(coro_factory())
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    Post.objects.bulk_create(
+        Post(title='post %d' % i, author=author) for i in range(CONCURRENCY)
+    )
+    requests = [
+        posts_pb2.PostRetrieveRequest(id=pk)
+        for pk in Post.objects.values_list('pk', flat=True)
+    ]
+    pool = futures.ThreadPoolExecutor(max_workers=10)
+    sync_servicer = PostService.as_servicer()
+    async_servicer = AsyncPostService.as_servicer()
+    sync_time = timed(lambda: run_sync(sync_servicer, requests, pool))
+    async_time = timed(lambda: run_async(async_servicer, requests))
+    print('%d concurrent Retrieve calls' % CONCURRENCY)
+    print('  %-28s %8.1f ms  %8.0f rpc/s' % (
+        'sync mixins, 10 threads', sync_time * 1e3, CONCURRENCY / sync_time))
+    print('  %-28s %8.1f ms  %8.0f rpc/s' % (
+        'async mixins', async_time * 1e3, CONCURRENCY / async_time))
+    pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
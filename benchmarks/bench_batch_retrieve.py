@@ -0,0 +1,40 @@
+"""
+Retrieving 200 rows with one ``Retrieve`` call per row, and with one
+``BatchRetrieve`` call.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+ROWS = 200
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    posts = Post.objects.bulk_create(
+        Post(title='post %d' % i, author=author) for i in range(ROWS)
+    )
+    ids = [post.pk for post in reversed(posts)]
+    servicer = PostService.as_servicer(optimize_queryset=True)
+
+    def retrieve():
+        for pk in ids:
+            servicer.Retrieve(posts_pb2.PostRetrieveRequest(id=pk), FakeContext())
+
+    request = posts_pb2.PostBatchRetrieveRequest(id=ids)
+    report(
+        'retrieving %d posts' % ROWS,
+        ('Retrieve per row', bench(retrieve, number=5)),
+        ('BatchRetrieve', bench(
+            lambda: servicer.BatchRetrieve(request, FakeContext()), number=5)),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Creating rows with one ``Create`` call per message, and with one
+``BulkCreate`` stream of all of them.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+MESSAGES = 2000
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    messages = [
+        posts_pb2.Post(title='post %d' % i, author=author.pk, views=i)
+        for i in range(MESSAGES)
+    ]
+    servicer = PostService.as_servicer()
+
+    def create():
+        for message in messages:
+            servicer.Create(message, FakeContext())
+
+    def bulk_create():
+        servicer.BulkCreate(iter(messages), FakeContext())
+
+    report(
+        'creating %d posts' % MESSAGES,
+        ('Create per message', bench(create, number=1, repeat=3)),
+        ('BulkCreate stream', bench(bulk_create, number=1, repeat=3)),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Updating and deleting rows with one ``Update`` or ``Destroy`` call per
+message, and with one ``BulkUpdate`` or ``BulkDestroy`` stream of all of
+them.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+MESSAGES = 2000
+
+
+def create_posts(author):
+    Post.objects.all().delete()
+    return Post.objects.bulk_create(
+        Post(title='post %d' % i, author=author) for i in range(MESSAGES)
+    )
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    servicer = PostService.as_servicer()
+    posts = create_posts(author)
+    views = iter(range(1, 1000))
+
+    def update_messages():
+        count = next(views)
+        return [
+            posts_pb2.Post(
+                id=post.pk, title=post.title, author=author.pk, price='0.00',
+                views=count, is_public=True,
+            )
+            for post in posts
+        ]
+
+    def update():
+        for message in update_messages():
+            servicer.Update(message, FakeContext())
+
+    def bulk_update():
+        servicer.BulkUpdate(iter(update_messages()), FakeContext())
+
+    report(
+        'updating %d posts' % MESSAGES,
+        ('Update per message', bench(update, number=1, repeat=3)),
+        ('BulkUpdate stream', bench(bulk_update, number=1, repeat=3)),
+    )
+
+    def destroy():
+        for post in create_posts(author):
+            servicer.Destroy(posts_pb2.Post(id=post.pk), FakeContext())
+
+    def bulk_destroy():
+        requests = [posts_pb2.PostRetrieveRequest(id=post.pk) for post in create_posts(author)]
+        servicer.BulkDestroy(iter(requests), FakeContext())
+
+    report(
+        'deleting %d posts (including inserting them)' % MESSAGES,
+        ('Destroy per message', bench(destroy, number=1, repeat=3)),
+        ('BulkDestroy stream', bench(bulk_destroy, number=1, repeat=3)),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""
+``Retrieve`` of a row, queried and serialized on every call, and answered
+from the locmem cache with ``cache_retrieve``.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post, Tag  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    post = Post.objects.create(title='hot', content='x' * 500, author=author)
+    post.tags.set([Tag.objects.create(name='tag %d' % i) for i in range(5)])
+    request = posts_pb2.PostRetrieveRequest(id=post.pk)
+    uncached = PostService.as_servicer()
+    cached = PostService.as_servicer(cache_retrieve=True)
+    report(
+        'Retrieve',
+        ('query and serialize', bench(
+            lambda: uncached.Retrieve(request, FakeContext()), number=2000)),
+        ('cache_retrieve', bench(
+            lambda: cached.Retrieve(request, FakeContext()), number=2000)),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+200 concurrent ``Retrieve`` calls of an async service, each with its own
+query and with the lookups coalesced into one query.
+"""
+import asyncio
+
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import AsyncPostService  # noqa: E402
+
+
+CALLS = 200
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    posts = Post.objects.bulk_create(
+        Post(title='post %d' % i, author=author) for i in range(CALLS)
+    )
+    requests = [posts_pb2.PostRetrieveRequest(id=post.pk) for post in posts]
+    loop = asyncio.new_event_loop()
+
+    def retrieve_all(servicer):
+        async def gather():
+            await asyncio.gather(*[
+                servicer.Retrieve(request, FakeContext()) for request in requests
+            ])
+        return lambda: loop.run_until_complete(gather())
+
+    report(
+        '%d concurrent Retrieve calls' % CALLS,
+        ('query per call', bench(
+            retrieve_all(AsyncPostService.as_servicer()), number=5)),
+        ('coalesced lookups', bench(
+            retrieve_all(AsyncPostService.as_servicer(coalesce_lookups=True)), number=5)),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Serializing a 10k rows ``List`` with the ``ModelProtoSerializer``, which goes
+through ``to_representation()`` and ``ParseDict``, and with the
+``CompiledModelProtoSerializer``.
+"""
+from decimal import Decimal
+
+from django.utils import timezone
+
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from testapp.models import Author, Post, Tag  # noqa: E402
+from testapp.serializers import (  # noqa: E402
+    CompiledPostProtoSerializer, PostProtoSerializer,
+)
+
+
+ROWS = 10000
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    tag = Tag.objects.create(name='bench')
+    now = timezone.now()
+    Post.objects.bulk_create(
+        Post(title='post %d' % i, content='content', author=author,
+             price=Decimal('9.99'), published=now, views=i)
+        for i in range(ROWS)
+    )
+    for post in Post.objects.all():
+        post.tags.add(tag)
+    posts = list(Post.objects.prefetch_related('tags'))
+    expected = PostProtoSerializer(posts, many=True).message
+    assert CompiledPostProtoSerializer(posts, many=True).message == expected
+    report(
+        'serializing %d posts (instances already loaded)' % ROWS,
+        ('ModelProtoSerializer', bench(
+            lambda: PostProtoSerializer(posts, many=True).message,
+            number=1, repeat=3) / ROWS),
+        ('CompiledModelProtoSerializer', bench(
+            lambda: CompiledPostProtoSerializer(posts, many=True).message,
+            number=1, repeat=3) / ROWS),
+    )
+
+
+if __name__ == '__main__':
+    main()
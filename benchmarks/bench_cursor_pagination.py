@@ -0,0 +1,40 @@
+"""
+Fetching a page of 50 posts near the start and near the end of a large table,
+with ``OFFSET`` and with the keyset seeks of ``CursorPaginatedListMixin``.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework import pagination  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+
+
+ROWS = 200000
+PAGE_SIZE = 50
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    Post.objects.bulk_create(
+        (Post(title='post %d' % i, author=author) for i in range(ROWS)),
+        batch_size=5000,
+    )
+    queryset = Post.objects.all()
+    ordering = pagination.get_unique_ordering(Post, [])
+    pks = list(Post.objects.order_by('pk').values_list('pk', flat=True))
+    for label, offset in [('page 2', PAGE_SIZE), ('page %d' % (ROWS // PAGE_SIZE - 1), ROWS - 2 * PAGE_SIZE)]:
+        token = pagination.encode_token(ordering, [pks[offset - 1]], salt='')
+        report(
+            label,
+            ('OFFSET', bench(
+                lambda: list(queryset.order_by('pk')[offset:offset + PAGE_SIZE]),
+                number=50)),
+            ('keyset', bench(
+                lambda: pagination.paginate_queryset(queryset, ordering, PAGE_SIZE, token),
+                number=50)),
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+A runaway query of a call with a 200ms deadline, left to run and interrupted
+at the deadline, and the cost of propagating the deadline to a ``Retrieve``.
+"""
+import time
+
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django.db import connection  # noqa: E402
+
+from django_grpc_framework.services import Service  # noqa: E402
+from django_grpc_framework.test import FakeContext, FakeRpcError  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+class SlowService(Service):
+    def Slow(self, request, context):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n '
+                'WHERE i < 20000000) SELECT COUNT(*) FROM n'
+            )
+            return cursor.fetchone()[0]
+
+
+def run_slow(servicer):
+    start = time.monotonic()
+    try:
+        servicer.Slow(None, FakeContext(timeout=0.2))
+    except FakeRpcError:
+        pass
+    return time.monotonic() - start
+
+
+def main():
+    print('Query running past a 200ms deadline')
+    for label, servicer in [
+        ('left to run', SlowService.as_servicer(propagate_deadlines=False)),
+        ('interrupted at the deadline', SlowService.as_servicer()),
+    ]:
+        print('  %-28s %8.0f ms' % (label, run_slow(servicer) * 1000))
+    author = Author.objects.create(name='bench')
+    post = Post.objects.create(title='post', author=author)
+    request = posts_pb2.PostRetrieveRequest(id=post.pk)
+    plain = PostService.as_servicer(propagate_deadlines=False)
+    propagated = PostService.as_servicer()
+    report(
+        'Retrieve with a deadline',
+        ('not propagated', bench(
+            lambda: plain.Retrieve(request, FakeContext(timeout=10)), number=2000)),
+        ('propagated', bench(
+            lambda: propagated.Retrieve(request, FakeContext(timeout=10)), number=2000)),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Dispatch overhead of a trivial unary method, comparing the precompiled
+handlers of ``Service.as_servicer`` with the previous per-lookup closures.
+"""
+import asyncio
+from functools import update_wrapper
+import inspect
+
+from common import bench, report, setup_django
+
+setup_django()
+
+from django_grpc_framework import hooks  # noqa: E402
+from django_grpc_framework.services import Service  # noqa: E402
+from django_grpc_framework.signals import (  # noqa: E402
+    grpc_request_started, grpc_request_finished,
+)
+
+
+class PingService(Service):
+    def Ping(self, request, context):
+        return request
+
+
+def legacy_as_servicer(cls, **initkwargs):
+    """The closure-per-lookup servicer ``as_servicer`` used to return."""
+    class Servicer:
+        def __getattr__(self, action):
+            controller_fn = getattr(cls, action)
+
+            async def handler_async(request, context):
+                grpc_request_started.send(sender=handler_async, request=request, context=context)
+                try:
+                    self = cls(**initkwargs)
+                    self.request = request
+                    self.context = context
+                    self.action = action
+                    result = getattr(self, action)(request, context)
+                    if inspect.isawaitable(result):
+                        return await result
+                    return result
+                finally:
+                    grpc_request_finished.send(sender=handler_async)
+
+            def handler_sync(request, context):
+                grpc_request_started.send(sender=handler_sync, request=request, context=context)
+                try:
+                    self = cls(**initkwargs)
+                    self.request = request
+                    self.context = context
+                    self.action = action
+                    result = getattr(self, action)(request, context)
+                    if inspect.isawaitable(result):
+                        return asyncio.run(result)
+                    return result
+                finally:
+                    grpc_request_finished.send(sender=handler_sync)
+
+            if inspect.iscoroutinefunction(controller_fn):
+                update_wrapper(handler_async, controller_fn)
+                return handler_async
+            update_wrapper(handler_sync, controller_fn)
+            return handler_sync
+
+    return Servicer()
+
+
+def main():
+    # Disable the db housekeeping so only dispatch is measured.
+    grpc_request_started.receivers.clear()
+    grpc_request_finished.receivers.clear()
+    hooks.housekeeping.enabled = False
+    legacy = legacy_as_servicer(PingService)
+    current = PingService.as_servicer()
+    request = object()
+    report(
+        'lookup + call of a unary handler',
+        ('per-lookup closures', bench(lambda: legacy.Ping(request, None))),
+        ('precompiled handlers', bench(lambda: current.Ping(request, None))),
+    )
+    report(
+        'attribute lookup only',
+        ('per-lookup closures', bench(lambda: legacy.Ping)),
+        ('precompiled handlers', bench(lambda: current.Ping)),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Per-call latency of a sync handler returning an awaitable, comparing a new
+event loop per call (``asyncio.run``) with the per-thread loop runner.
+"""
+import asyncio
+
+from common import bench, report, setup_django
+
+setup_django()
+
+from django_grpc_framework import hooks  # noqa: E402
+from django_grpc_framework.services import Service  # noqa: E402
+from django_grpc_framework.signals import (  # noqa: E402
+    grpc_request_started, grpc_request_finished,
+)
+from django_grpc_framework.utils.loops import ThreadLoopRunner  # noqa: E402
+
+
+async def ping(request):
+    return request
+
+
+class PingService(Service):
+    def Ping(self, request, context):
+        return ping(request)
+
+
+def main():
+    grpc_request_started.receivers.clear()
+    grpc_request_finished.receivers.clear()
+    hooks.housekeeping.enabled = False
+    runner = ThreadLoopRunner()
+    handler = PingService.as_servicer().Ping
+    request = object()
+    report(
+        'running a trivial coroutine',
+        ('asyncio.run', bench(lambda: asyncio.run(ping(request)), number=5000)),
+        ('ThreadLoopRunner.run', bench(lambda: runner.run(ping(request)), number=5000)),
+    )
+    report(
+        'sync handler returning an awaitable',
+        ('handler', bench(lambda: handler(request, None), number=5000)),
+    )
+    runner.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Per call cost of the request lifecycle of a trivial unary method: sending
+the ``grpc_request_started`` and ``grpc_request_finished`` signals to the
+connection housekeeping receivers, and running the compiled hooks, every
+call and on a cadence.
+"""
+from common import bench, report, setup_django
+
+setup_django()
+
+from django.db import close_old_connections, connection, reset_queries  # noqa: E402
+from django.test import override_settings  # noqa: E402
+
+from django_grpc_framework import hooks  # noqa: E402
+from django_grpc_framework.services import Service  # noqa: E402
+from django_grpc_framework.signals import (  # noqa: E402
+    grpc_request_started, grpc_request_finished,
+)
+
+
+class PingService(Service):
+    def Ping(self, request, context):
+        return request
+
+
+def signal_handler(servicer):
+    """The handler wrapped in the signals the services used to send."""
+    def handler(request, context):
+        grpc_request_started.send(sender=handler, request=request, context=context)
+        try:
+            return servicer.Ping(request, context)
+        finally:
+            grpc_request_finished.send(sender=handler)
+
+    return handler
+
+
+def main():
+    # An open connection, for the housekeeping to look at.
+    connection.ensure_connection()
+    request = object()
+    servicer = PingService.as_servicer()
+    grpc_request_started.connect(reset_queries)
+    grpc_request_started.connect(close_old_connections)
+    grpc_request_finished.connect(close_old_connections)
+    signals = signal_handler(servicer)
+    with hooks.housekeeping.disabled():
+        signals_time = bench(lambda: signals(request, None))
+    for receiver in (reset_queries, close_old_connections):
+        grpc_request_started.disconnect(receiver)
+    grpc_request_finished.disconnect(close_old_connections)
+    with override_settings(GRPC_FRAMEWORK={'CONNECTION_HOUSEKEEPING_INTERVAL': 1}):
+        cadence_time = bench(lambda: servicer.Ping(request, None))
+    report(
+        'unary call with connection housekeeping',
+        ('signals', signals_time),
+        ('hooks, every call', bench(lambda: servicer.Ping(request, None))),
+        ('hooks, every second', cadence_time),
+    )
+
+
+if __name__ == '__main__':
+    main()
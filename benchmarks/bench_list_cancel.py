@@ -0,0 +1,54 @@
+"""
+Work left to a server streaming ``List`` of many rows once the client is
+gone after the first message, when its iterator keeps being drained, as by
+an interceptor wrapping the responses: without checking
+``context.is_active()``, and checking it between chunks.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+ROWS = 20000
+
+
+class UncheckedPostService(PostService):
+    def List(self, request, context):
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer(queryset, many=True)
+        yield from serializer.iter_message(chunk_size=self.get_list_chunk_size())
+
+
+def cancelled_list(servicer):
+    context = FakeContext()
+    responses = servicer.List(posts_pb2.PostListRequest(), context)
+    next(responses)
+    context.cancel()
+    return 1 + sum(1 for _ in responses)
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    Post.objects.bulk_create(
+        (Post(title='post %d' % i, content='content ' * 10, author=author)
+         for i in range(ROWS)),
+        batch_size=1000,
+    )
+    unchecked = UncheckedPostService.as_servicer(optimize_queryset=True)
+    checked = PostService.as_servicer(optimize_queryset=True)
+    print('messages built: unchecked %d, checked %d' % (
+        cancelled_list(unchecked), cancelled_list(checked)))
+    report(
+        'List of %d posts cancelled after the first message' % ROWS,
+        ('unchecked', bench(lambda: cancelled_list(unchecked), number=3)),
+        ('is_active() between chunks', bench(lambda: cancelled_list(checked), number=3)),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Peak memory of a server streaming ``List`` of many rows, building all the
+messages up front with ``serializer.message`` and streaming them with
+``serializer.iter_message()``.
+"""
+import tracemalloc
+
+from common import setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+ROWS = 50000
+
+
+class MessageListPostService(PostService):
+    def List(self, request, context):
+        queryset = self.filter_queryset(self.get_queryset())
+        yield from self.get_serializer(queryset, many=True).message
+
+
+def peak_memory(servicer):
+    tracemalloc.start()
+    count = 0
+    for _ in servicer.List(posts_pb2.PostListRequest(), FakeContext()):
+        count += 1
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert count == ROWS
+    return peak
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    Post.objects.bulk_create(
+        (Post(title='post %d' % i, content='content ' * 10, author=author)
+         for i in range(ROWS)),
+        batch_size=1000,
+    )
+    print('List of %d posts, peak memory' % ROWS)
+    for label, servicer_class in [
+        ('serializer.message', MessageListPostService),
+        ('serializer.iter_message()', PostService),
+    ]:
+        peak = peak_memory(servicer_class.as_servicer())
+        print('  %-28s %8.1f MiB' % (label, peak / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
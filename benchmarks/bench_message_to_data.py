@@ -0,0 +1,62 @@
+"""
+Per-request cost of turning an incoming ``Post`` message into validated data,
+with ``MessageToDict`` (JSON values that DRF re-parses), with the native
+converter, and with the native converter and ``Meta.trust_proto_types``.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.protobuf.json_format import message_to_dict  # noqa: E402
+from django_grpc_framework.protobuf.native import message_to_native  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.serializers import PostProtoSerializer  # noqa: E402
+
+
+# The primary key lookups of ``author`` and ``tags`` dominate validation,
+# leave them out to compare the conversion and coercion costs.
+class NativePostProtoSerializer(PostProtoSerializer):
+    class Meta(PostProtoSerializer.Meta):
+        fields = ['title', 'content', 'price', 'views', 'is_public']
+
+
+class JSONPostProtoSerializer(NativePostProtoSerializer):
+    def message_to_data(self, message):
+        return message_to_dict(message)
+
+
+class TrustedPostProtoSerializer(NativePostProtoSerializer):
+    class Meta(NativePostProtoSerializer.Meta):
+        trust_proto_types = True
+
+
+def validate(serializer_class, message):
+    def run():
+        serializer = serializer_class(message=message)
+        serializer.is_valid(raise_exception=True)
+    return run
+
+
+def main():
+    message = posts_pb2.Post(
+        title='title', content='content', price='9.99', views=2 ** 40,
+        is_public=True,
+    )
+    report(
+        'converting a Post message',
+        ('MessageToDict', bench(lambda: message_to_dict(message))),
+        ('message_to_native', bench(lambda: message_to_native(message))),
+    )
+    report(
+        'validating a Post message',
+        ('MessageToDict', bench(
+            validate(JSONPostProtoSerializer, message), number=2000)),
+        ('message_to_native', bench(
+            validate(NativePostProtoSerializer, message), number=2000)),
+        ('message_to_native + trust_proto_types', bench(
+            validate(TrustedPostProtoSerializer, message), number=2000)),
+    )
+
+
+if __name__ == '__main__':
+    main()
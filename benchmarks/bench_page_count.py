@@ -0,0 +1,48 @@
+"""
+``List`` of a page of a large table with ``PageNumberPaginatedListMixin``,
+counting the rows on every request and with the cached count.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework import pagination  # noqa: E402
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import NumberedPostService  # noqa: E402
+
+
+ROWS = 200000
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    Post.objects.bulk_create(
+        (Post(title='post %d' % i, author=author) for i in range(ROWS)),
+        batch_size=5000,
+    )
+    queryset = Post.objects.all()
+    report(
+        'counting %d rows' % ROWS,
+        ('COUNT(*)', bench(lambda: pagination.get_count(queryset), number=20)),
+        ('cached count', bench(
+            lambda: pagination.get_count(queryset, cache_timeout=60), number=20)),
+    )
+    request = posts_pb2.ListNumberedPostsRequest(page=2)
+    # Tags are prefetched, so that the count is what differs.
+    uncached = NumberedPostService.as_servicer(
+        count_cache_timeout=None, optimize_queryset=True,
+    )
+    cached = NumberedPostService.as_servicer(optimize_queryset=True)
+    report(
+        'List page 2 of %d rows' % ROWS,
+        ('COUNT(*) per request', bench(
+            lambda: uncached.List(request, FakeContext()), number=20)),
+        ('cached count', bench(
+            lambda: cached.List(request, FakeContext()), number=20)),
+    )
+
+
+if __name__ == '__main__':
+    main()
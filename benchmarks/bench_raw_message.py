@@ -0,0 +1,61 @@
+"""
+Cached ``Retrieve`` followed by the response serializer of the method, as
+gRPC runs it: the cached bytes parsed into a message and serialized again,
+and passed through as a ``RawMessage`` on a ``RawMessageServer``.  Then the
+replay of a feed of stored messages through the response serializer alone.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.protobuf.raw import (  # noqa: E402
+    RawMessage, RawMessageServer, raw_serializer,
+)
+from django_grpc_framework.test import FakeContext, FakeServer  # noqa: E402
+from testapp import posts_pb2, posts_pb2_grpc  # noqa: E402
+from testapp.models import Author, Post, Tag  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+def get_retrieve(raw):
+    server = FakeServer()
+    posts_pb2_grpc.add_PostControllerServicer_to_server(
+        PostService.as_servicer(cache_retrieve=True),
+        RawMessageServer(server) if raw else server,
+    )
+    handler = server._find_method_handler('/testapp.PostController/Retrieve')
+
+    def retrieve(request):
+        return handler.response_serializer(handler.unary_unary(request, FakeContext()))
+
+    return retrieve
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    post = Post.objects.create(title='hot', content='x' * 4000, author=author)
+    post.tags.set([Tag.objects.create(name='tag %d' % i) for i in range(50)])
+    request = posts_pb2.PostRetrieveRequest(id=post.pk)
+    parsed, raw = get_retrieve(raw=False), get_retrieve(raw=True)
+    assert parsed(request) == raw(request)
+    report(
+        'cached Retrieve + response_serializer',
+        ('parse and serialize', bench(lambda: parsed(request), number=5000)),
+        ('RawMessage', bench(lambda: raw(request), number=5000)),
+    )
+    feed = [
+        posts_pb2.Post(id=i, title='post %d' % i, content='x' * 500).SerializeToString()
+        for i in range(1000)
+    ]
+    serialize = raw_serializer(posts_pb2.Post.SerializeToString)
+    report(
+        'replay of 1000 stored messages',
+        ('parse and serialize', bench(
+            lambda: [serialize(posts_pb2.Post.FromString(data)) for data in feed], number=20)),
+        ('RawMessage', bench(
+            lambda: [serialize(RawMessage(data)) for data in feed], number=20)),
+    )
+
+
+if __name__ == '__main__':
+    main()
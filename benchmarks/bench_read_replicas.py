@@ -0,0 +1,41 @@
+"""
+Per call cost of routing ``Retrieve`` to read replicas, here two aliases of
+the same SQLite file, with the round robin and least connections policies.
+"""
+import os
+import tempfile
+
+from common import bench, report, setup_testapp
+
+path = os.path.join(tempfile.mkdtemp(), 'db.sqlite3')
+setup_testapp(DATABASES={
+    alias: {'ENGINE': 'django.db.backends.sqlite3', 'NAME': path}
+    for alias in ('default', 'replica1', 'replica2')
+})
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    post = Post.objects.create(title='post', author=author)
+    request = posts_pb2.PostRetrieveRequest(id=post.pk)
+    replicas = ['replica1', 'replica2']
+    servicers = [
+        ('default database', PostService.as_servicer()),
+        ('round_robin', PostService.as_servicer(read_databases=replicas)),
+        ('least_connections', PostService.as_servicer(
+            read_databases=replicas, read_database_policy='least_connections')),
+    ]
+    report('Retrieve', *[
+        (label, bench(lambda servicer=servicer: servicer.Retrieve(request, FakeContext()),
+                      number=2000))
+        for label, servicer in servicers
+    ])
+
+
+if __name__ == '__main__':
+    main()
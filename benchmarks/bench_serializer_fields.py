@@ -0,0 +1,56 @@
+"""
+Unary ``Retrieve`` and ``Update`` calls on a ``ModelService``, building the
+serializer fields from the model for every call and with the per-class fields
+cache of ``ModelProtoSerializer``.
+"""
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.serializers import PostProtoSerializer  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+class UncachedPostProtoSerializer(PostProtoSerializer):
+    def get_fields_cache_key(self):
+        return None
+
+
+class UncachedPostService(PostService):
+    serializer_class = UncachedPostProtoSerializer
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    post = Post.objects.create(title='post', author=author)
+    retrieve = posts_pb2.PostRetrieveRequest(id=post.pk)
+    update = posts_pb2.Post(
+        id=post.pk, title='post', author=author.pk, price='1', views=1,
+    )
+    servicers = [
+        ('building fields per call', UncachedPostService.as_servicer()),
+        ('cached fields', PostService.as_servicer()),
+    ]
+    serializers = [
+        ('building fields per call', UncachedPostProtoSerializer),
+        ('cached fields', PostProtoSerializer),
+    ]
+    report('instantiating the serializer and its fields', *(
+        (label, bench(lambda: serializer_class(post).fields, number=2000))
+        for label, serializer_class in serializers
+    ))
+    report('Retrieve', *(
+        (label, bench(lambda: servicer.Retrieve(retrieve, FakeContext()), number=500))
+        for label, servicer in servicers
+    ))
+    report('Update', *(
+        (label, bench(lambda: servicer.Update(update, FakeContext()), number=200))
+        for label, servicer in servicers
+    ))
+
+
+if __name__ == '__main__':
+    main()
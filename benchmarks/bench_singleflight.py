@@ -0,0 +1,50 @@
+"""
+100 concurrent ``Retrieve`` calls of the same object from a thread pool,
+each one running its query and serialization, and collapsed by
+``singleflight_actions``.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from common import bench, report, setup_testapp
+
+setup_testapp()
+
+from django_grpc_framework.test import FakeContext  # noqa: E402
+from django_grpc_framework.utils import singleflight  # noqa: E402
+from testapp import posts_pb2  # noqa: E402
+from testapp.models import Author, Post  # noqa: E402
+from testapp.services import PostService  # noqa: E402
+
+
+CALLS = 100
+
+
+def main():
+    author = Author.objects.create(name='bench')
+    post = Post.objects.create(title='hot', author=author)
+    request = posts_pb2.PostRetrieveRequest(id=post.pk)
+    executor = ThreadPoolExecutor(max_workers=10)
+
+    def retrieve_all(servicer):
+        def run():
+            futures = [
+                executor.submit(servicer.Retrieve, request, FakeContext())
+                for _ in range(CALLS)
+            ]
+            for future in futures:
+                future.result()
+        return run
+
+    report(
+        '%d concurrent Retrieve calls of one post' % CALLS,
+        ('query per call', bench(retrieve_all(PostService.as_servicer()), number=10)),
+        ('singleflight', bench(retrieve_all(
+            PostService.as_servicer(singleflight_actions=('Retrieve',))), number=10)),
+    )
+    metrics = singleflight.group.metrics()
+    print('  collapsed %(collapsed)d of %(calls)d calls' % metrics)
+    executor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import tempfile
+import timeit
+
+import django
+from django.conf import settings
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup_django(**overrides):
+    """Configure a minimal Django project for benchmarking."""
+    sys.path.insert(0, ROOT)
+    options = dict(
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            },
+        },
+        SECRET_KEY='benchmarks',
+        USE_TZ=True,
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'django.contrib.auth',
+            'django_grpc_framework',
+        ],
+    )
+    options.update(overrides)
+    settings.configure(**options)
+    django.setup()
+
+
+def setup_testapp(**overrides):
+    """
+    Configure Django with the test app of the test suite, on a migrated
+    SQLite database file so that it can be shared between threads.
+    """
+    from django.core.management import call_command
+
+    sys.path.insert(0, os.path.join(ROOT, 'tests'))
+    options = dict(
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': os.path.join(tempfile.mkdtemp(), 'db.sqlite3'),
+            },
+        },
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'django.contrib.auth',
+            'django_grpc_framework',
+            'testapp',
+        ],
+    )
+    options.update(overrides)
+    setup_django(**options)
+    call_command('migrate', run_syncdb=True, verbosity=0)
+
+
+def bench(func, number=100000, repeat=5):
+    """Return the best time per call of ``func`` in microseconds."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def report(name, *results):
+    """Print ``(label, usec)`` results, relative to the first one."""
+    print(name)
+    baseline = results[0][1]
+    for label, usec in results:
+        print('  %-28s %10.3f us/call  %6.2fx' % (label, usec, baseline / usec))
@@ -0,0 +1,236 @@
+"""
+Caching of the messages of ``Retrieve()``.
+
+The serialized messages of an object are cached under keys scoped by the
+service, its queryset and its serializer version, so that services with
+different querysets never answer each other's objects.  The keys of a row
+include its generation, a random token held under one key per model and
+primary key: ``post_save`` and ``post_delete`` invalidate all the messages of
+the row by deleting it.  A message computed before the invalidation is stored
+under the previous generation, which is never read again, so a ``set()``
+racing the invalidation cannot bring back a stale message.  A cache hit is
+answered from the bytes of the message, without touching the ORM or the
+serializer, and sent as they are on servers that accept ``RawMessage``
+responses.
+"""
+import threading
+import uuid
+
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.db.models import signals
+
+from django_grpc_framework.protobuf.raw import RawMessage
+from django_grpc_framework.settings import grpc_settings
+from django_grpc_framework.utils.compat import md5
+
+
+_lock = threading.Lock()
+_aliases = {}
+_counters = {}
+
+
+def get_cache_key(model, pk):
+    """
+    Return the cache key of the generation of the messages of the ``model``
+    row ``pk``.
+    """
+    return 'django_grpc_framework.retrieve.%s.%s' % (model._meta.label_lower, pk)
+
+
+def register(model, alias='default'):
+    """
+    Invalidate the cached messages of ``model`` in the ``alias`` cache when
+    its instances are saved or deleted.  Services register their model when
+    ``as_servicer()`` is called, other processes changing the rows of a
+    shared cache, like a web server, must register it too.
+    """
+    if alias in _aliases.get(model, ()):
+        return
+    with _lock:
+        aliases = _aliases.setdefault(model, set())
+        if not aliases:
+            signals.post_save.connect(
+                _invalidate, sender=model, dispatch_uid='django_grpc_framework.retrieve',
+            )
+            signals.post_delete.connect(
+                _invalidate, sender=model, dispatch_uid='django_grpc_framework.retrieve',
+            )
+        aliases.add(alias)
+
+
+def _invalidate(sender, instance, **kwargs):
+    key = get_cache_key(sender, instance.pk)
+    for alias in _aliases.get(sender, ()):
+        caches[alias].delete(key)
+
+
+def get_scope(service_class, queryset, serializer_class, version):
+    """
+    Return the scope of the cached messages of ``service_class``, serializing
+    the rows of ``queryset`` with the ``version`` of ``serializer_class``, or
+    ``None`` when the queryset can match no row.  The database alias is left
+    out, replicas share the messages.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    return md5(repr((
+        service_class.__module__, service_class.__qualname__, sql, params,
+        serializer_class.__module__, serializer_class.__qualname__, version,
+    )).encode(), usedforsecurity=False).hexdigest()
+
+
+def get_servicer_scope(service_class, initkwargs):
+    """
+    Return the scope of the cached messages of the servicers of
+    ``service_class`` built with ``initkwargs``, computed once by
+    ``as_servicer()``, or ``None`` when the queryset or the serializer of a
+    call may depend on the request, the scope then being computed for each
+    call.
+    """
+    from django_grpc_framework.generics import GenericService
+
+    def get(name):
+        return initkwargs.get(name, getattr(service_class, name))
+
+    if any(
+        getattr(service_class, name) is not getattr(GenericService, name)
+        for name in ('get_queryset', 'filter_queryset', 'get_serializer_class')
+    ):
+        return None
+    filter_backends = get('filter_backends')
+    if filter_backends is None:
+        filter_backends = grpc_settings.DEFAULT_FILTER_BACKENDS
+    queryset, serializer_class = get('queryset'), get('serializer_class')
+    if filter_backends or queryset is None or serializer_class is None:
+        return None
+    return get_scope(
+        service_class, queryset.all(), serializer_class, get('cache_retrieve_version'),
+    )
+
+
+class RetrieveCache:
+    """
+    The cached ``Retrieve()`` message of the request of ``service``, which
+    must look up objects by primary key.
+    """
+    def __init__(self, service):
+        self.service = service
+        self.scope = service._cache_retrieve_scope
+        serializer_class = service.get_serializer_class()
+        if self.scope is not None:
+            model = service.queryset.model
+        else:
+            queryset = service.filter_queryset(service.get_queryset())
+            model = queryset.model
+            self.scope = get_scope(
+                service.__class__, queryset, serializer_class,
+                service.cache_retrieve_version,
+            )
+        lookup_field, lookup_request_field = service.get_lookup_fields(model)
+        assert lookup_field in ('pk', model._meta.pk.name), (
+            "'%s' can only cache the Retrieve() of lookups by primary key."
+            % service.__class__.__name__
+        )
+        self.cache = caches[service.cache_retrieve_alias]
+        self.timeout = service.cache_retrieve_timeout
+        self.proto_class = serializer_class.Meta.proto_class
+        self.key = None
+        if self.scope is not None:
+            try:
+                pk = model._meta.pk.to_python(getattr(service.request, lookup_request_field))
+            except ValidationError:
+                pass
+            else:
+                self.key = get_cache_key(model, pk)
+        self.generation = None
+        register(model, service.cache_retrieve_alias)
+
+    def get_message_key(self):
+        return '%s.%s.%s' % (self.key, self.generation, self.scope)
+
+    def get(self):
+        """
+        Return the cached message, or ``None``.  The message is a
+        ``RawMessage`` when the service may respond with one.
+        """
+        if self.key is None:
+            return None
+        self.generation = self.cache.get(self.key)
+        if self.generation is None:
+            # Start a generation, which the messages computed from now on
+            # are stored under until the row is invalidated.
+            self.cache.add(self.key, uuid.uuid4().hex, self.timeout)
+            self.generation = self.cache.get(self.key)
+            return self._hit(None)
+        return self._hit(self.cache.get(self.get_message_key()))
+
+    def set(self, message):
+        """
+        Cache ``message`` under the generation read by ``get()``, which must
+        be called first.
+        """
+        if self.generation is not None:
+            self.cache.set(self.get_message_key(), message.SerializeToString(), self.timeout)
+
+    async def aget(self):
+        """Async version of ``get()``."""
+        if self.key is None:
+            return None
+        self.generation = await self.cache.aget(self.key)
+        if self.generation is None:
+            await self.cache.aadd(self.key, uuid.uuid4().hex, self.timeout)
+            self.generation = await self.cache.aget(self.key)
+            return self._hit(None)
+        return self._hit(await self.cache.aget(self.get_message_key()))
+
+    async def aset(self, message):
+        """Async version of ``set()``."""
+        if self.generation is not None:
+            await self.cache.aset(
+                self.get_message_key(), message.SerializeToString(), self.timeout,
+            )
+
+    def _hit(self, data):
+        _count(self.service.__class__, 'hits' if data is not None else 'misses')
+        if data is None:
+            return None
+        if self.service.raw_responses:
+            return RawMessage(data)
+        return self.proto_class.FromString(data)
+
+
+def _count(service_class, counter):
+    with _lock:
+        counts = _counters.get(service_class)
+        if counts is None:
+            counts = _counters[service_class] = {'hits': 0, 'misses': 0}
+        counts[counter] += 1
+
+
+def metrics():
+    """
+    Return the number of cache hits and misses of ``Retrieve()``, in total
+    and by service class::
+
+        {'hits': 1130, 'misses': 74, 'hit_ratio': 0.94,
+         'by_service': {PostService: {'hits': 1130, 'misses': 74}}}
+    """
+    with _lock:
+        by_service = {cls: dict(counts) for cls, counts in _counters.items()}
+    hits = sum(counts['hits'] for counts in by_service.values())
+    misses = sum(counts['misses'] for counts in by_service.values())
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hits / (hits + misses) if hits + misses else 0.0,
+        'by_service': by_service,
+    }
+
+
+def reset_metrics():
+    """Reset the counters of ``metrics()``."""
+    with _lock:
+        _counters.clear()
@@ -0,0 +1,151 @@
+"""
+Propagation of the deadline of calls to the database.
+
+A client giving up after 200ms should not leave a 30 seconds query behind.
+While a sync handler runs, the queries of each database connection are
+bounded by the time left to the call: SQLite interrupts them from a progress
+handler, PostgreSQL gets a ``statement_timeout``.  No query is started once
+the deadline has passed, and the call is aborted with ``DEADLINE_EXCEEDED``.
+"""
+from contextlib import ExitStack, contextmanager
+import inspect
+import time
+
+from django.db import DatabaseError, connections
+import grpc
+
+from django_grpc_framework.utils.contexts import abort
+
+
+#: The number of SQLite virtual machine instructions between two checks of
+#: the deadline.
+SQLITE_PROGRESS_STEPS = 1000
+
+
+class DeadlineExceeded(Exception):
+    """A query was not run, or was interrupted, as the deadline passed."""
+
+
+def get_deadline(context):
+    """
+    Return the ``time.monotonic()`` deadline of the call of ``context``, or
+    ``None`` when the client set no deadline.
+    """
+    time_remaining = getattr(context, 'time_remaining', None)
+    remaining = time_remaining() if time_remaining is not None else None
+    if remaining is None:
+        return None
+    return time.monotonic() + remaining
+
+
+class StatementTimeout:
+    """
+    An ``execute_wrapper()`` of ``connection`` bounding its queries by
+    ``deadline``.  The statement timeout is set on the first query, to the
+    time left then, and the deadline is checked again before each query.
+    """
+    def __init__(self, connection, deadline):
+        self.connection = connection
+        self.deadline = deadline
+        self.applied = False
+        self.local = False
+
+    def __call__(self, execute, sql, params, many, context):
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded('Deadline exceeded before running the query.')
+        if not self.applied:
+            self.apply(context['cursor'].cursor, remaining)
+        try:
+            return execute(sql, params, many, context)
+        except DatabaseError as exc:
+            if time.monotonic() >= self.deadline:
+                raise DeadlineExceeded('Deadline exceeded while running the query.') from exc
+            raise
+
+    def apply(self, cursor, remaining):
+        self.applied = True
+        vendor = self.connection.vendor
+        if vendor == 'sqlite':
+            deadline = self.deadline
+            self.connection.connection.set_progress_handler(
+                lambda: time.monotonic() >= deadline, SQLITE_PROGRESS_STEPS,
+            )
+        elif vendor == 'postgresql':
+            # SET LOCAL ends with the transaction, which cannot run RESET
+            # once a query was cancelled.
+            self.local = self.connection.in_atomic_block
+            cursor.execute('SET %sstatement_timeout = %d' % (
+                'LOCAL ' if self.local else '', max(int(remaining * 1000), 1),
+            ))
+
+    def reset(self):
+        """Remove the statement timeout from the connection."""
+        if not self.applied or self.connection.connection is None:
+            return
+        vendor = self.connection.vendor
+        if vendor == 'sqlite':
+            self.connection.connection.set_progress_handler(None, 0)
+        elif vendor == 'postgresql' and not self.local:
+            try:
+                with self.connection.cursor() as cursor:
+                    cursor.execute('RESET statement_timeout')
+            except DatabaseError:
+                # Do not leave the timeout to the next calls of the thread.
+                self.connection.close()
+
+
+@contextmanager
+def statement_timeout(deadline, using):
+    """Bound the queries of the ``using`` connection by ``deadline``."""
+    connection = connections[using]
+    timeout = StatementTimeout(connection, deadline)
+    try:
+        with connection.execute_wrapper(timeout):
+            yield timeout
+    finally:
+        timeout.reset()
+
+
+@contextmanager
+def deadline_scope(context):
+    """
+    Run a sync handler within the deadline of its call: abort it at once
+    when the time is already spent, bound the queries of every database
+    connection by the deadline, and abort it with ``DEADLINE_EXCEEDED``
+    when one of them exceeds it.
+    """
+    deadline = get_deadline(context)
+    if deadline is None:
+        yield
+        return
+    if deadline <= time.monotonic():
+        abort(
+            context, grpc.StatusCode.DEADLINE_EXCEEDED, 'Deadline exceeded.',
+            DeadlineExceeded,
+        )
+    try:
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(statement_timeout(deadline, alias))
+            yield
+    except DeadlineExceeded:
+        abort(
+            context, grpc.StatusCode.DEADLINE_EXCEEDED, 'Deadline exceeded.',
+            DeadlineExceeded,
+        )
+
+
+async def acheck(context):
+    """
+    Abort the call of an async handler when its deadline has passed.  The
+    queries of async handlers share connections between calls, their
+    statements are not bounded.
+    """
+    deadline = get_deadline(context)
+    if deadline is None or deadline > time.monotonic():
+        return
+    if inspect.iscoroutinefunction(context.abort):
+        await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, 'Deadline exceeded.')
+    else:
+        context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, 'Deadline exceeded.')
@@ -0,0 +1,359 @@
+"""
+Filter backends, and the parsing of the ``filter`` and ``order_by`` fields of
+list requests.
+
+The filter language is a small subset of the one of
+`AIP-160 <https://google.aip.dev/160>`_::
+
+    title = "hello" AND (views >= 10 OR NOT is_public) author.name : "tom"
+
+Comparisons are ``field op value`` with the ``=``, ``!=``, ``<``, ``<=``,
+``>``, ``>=`` operators, and ``:`` for "contains".  Values are quoted
+strings, numbers, ``true``, ``false``, ``null`` or bare words.  Comparisons
+are combined with ``AND`` (or just a space), ``OR``, ``NOT`` (or ``-``) and
+parentheses, ``OR`` binding tighter than ``AND`` as in AIP-160.  Dotted
+field names follow relations.
+"""
+from functools import lru_cache, reduce
+import operator
+import re
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q
+
+
+#: The maximum nesting of parentheses and ``NOT`` in a filter.
+MAX_DEPTH = 32
+
+
+class InvalidFilter(Exception):
+    """Raised for invalid ``filter`` or ``order_by`` expressions."""
+
+
+class BaseFilterBackend:
+    """
+    A base class from which all filter backend classes should inherit.
+    """
+    def filter_queryset(self, request, queryset, service):
+        """
+        Return a filtered queryset, or raise ``InvalidFilter``.
+        """
+        raise NotImplementedError('.filter_queryset() must be overridden.')
+
+
+class ExpressionFilterBackend(BaseFilterBackend):
+    """
+    Filter the queryset with the ``filter`` field of the request, limited to
+    the ``get_filter_fields()`` of the service.  With ``require_index`` set
+    on the service, filters that cannot use a database index are rejected.
+    """
+    request_field = 'filter'
+
+    def filter_queryset(self, request, queryset, service):
+        expression = getattr(request, self.request_field, '')
+        if not expression:
+            return queryset
+        node, fields = parse_filter(expression)
+        check_fields(fields, service.get_filter_fields())
+        if getattr(service, 'require_index', False) and not uses_index(node, queryset.model):
+            raise InvalidFilter('The filter must use an indexed field.')
+        try:
+            return queryset.filter(to_q(node))
+        except (TypeError, ValueError, ValidationError) as exc:
+            raise InvalidFilter('Invalid filter value: %s' % exc)
+
+
+class OrderingFilter(BaseFilterBackend):
+    """
+    Order the queryset by the ``order_by`` field of the request, limited to
+    the ``get_ordering_fields()`` of the service.  With ``require_index``
+    set on the service, the first field must be indexed.
+    """
+    request_field = 'order_by'
+
+    def filter_queryset(self, request, queryset, service):
+        order_by = getattr(request, self.request_field, '')
+        if not order_by:
+            return queryset
+        ordering = parse_order_by(order_by)
+        check_fields([path for path, descending in ordering], service.get_ordering_fields())
+        if getattr(service, 'require_index', False):
+            check_ordering_index(queryset.model, ordering)
+        return queryset.order_by(*[
+            F(path).desc() if descending else F(path).asc()
+            for path, descending in ordering
+        ])
+
+
+_TOKEN_RE = re.compile(r'''
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op><=|>=|!=|[=<>:])
+      | (?P<paren>[()])
+      | (?P<word>[^\s()=<>!:"']+)
+    )''', re.VERBOSE)
+_NUMBER_RE = re.compile(r'-?\d+(\.\d+)?([eE][-+]?\d+)?$')
+_FIELD_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$')
+_LOOKUPS = {'=': 'exact', '<': 'lt', '<=': 'lte', '>': 'gt', '>=': 'gte', ':': 'contains'}
+_KEYWORDS = {'AND', 'OR', 'NOT'}
+
+
+@lru_cache(maxsize=1024)
+def parse_filter(expression):
+    """
+    Parse a filter expression into ``(node, fields)``, ``fields`` being the
+    lookup paths it references.  Nodes are tuples:
+    ``('cmp', path, op, value)``, ``('and', nodes)``, ``('or', nodes)`` and
+    ``('not', node)``.  Parsed expressions are cached.
+    """
+    parser = _FilterParser(expression)
+    node = parser.parse()
+    return node, frozenset(parser.fields)
+
+
+@lru_cache(maxsize=1024)
+def parse_order_by(order_by):
+    """
+    Parse an ``order_by`` string like ``"published desc, title"`` into a
+    tuple of ``(lookup path, descending)`` pairs.  Dotted field names follow
+    relations.
+    """
+    ordering = []
+    for item in order_by.split(','):
+        words = item.split()
+        if not words:
+            if order_by.strip():
+                raise InvalidFilter('Invalid order_by: %r.' % order_by)
+            continue
+        if (len(words) > 2 or not _FIELD_RE.match(words[0]) or
+                (len(words) == 2 and words[1].lower() not in ('asc', 'desc'))):
+            raise InvalidFilter('Invalid order_by: %r.' % item.strip())
+        descending = len(words) == 2 and words[1].lower() == 'desc'
+        ordering.append((words[0].replace('.', '__'), descending))
+    return tuple(ordering)
+
+
+def check_fields(paths, allowed_fields):
+    """
+    Raise ``InvalidFilter`` unless all the lookup ``paths`` are in
+    ``allowed_fields``, given as field names with dots.
+    """
+    allowed = {name.replace('.', '__') for name in allowed_fields}
+    for path in paths:
+        if path not in allowed:
+            raise InvalidFilter('Cannot filter or order by %r.' % path.replace('__', '.'))
+
+
+def check_ordering_index(model, ordering):
+    """Raise ``InvalidFilter`` unless the first field of ``ordering`` is indexed."""
+    if ordering and not is_indexed(model, ordering[0][0]):
+        raise InvalidFilter(
+            'Cannot order by %r, it is not indexed.' % ordering[0][0].replace('__', '.')
+        )
+
+
+def to_q(node):
+    """Return the ``Q`` object of a parsed filter node."""
+    kind = node[0]
+    if kind == 'cmp':
+        _, path, op, value = node
+        if value is None and op in ('=', '!='):
+            return Q(**{path + '__isnull': op == '='})
+        if op == '!=':
+            return ~Q(**{path: value})
+        return Q(**{'%s__%s' % (path, _LOOKUPS[op]): value})
+    if kind == 'not':
+        return ~to_q(node[1])
+    combine = operator.and_ if kind == 'and' else operator.or_
+    return reduce(combine, [to_q(child) for child in node[1]])
+
+
+def uses_index(node, model):
+    """
+    Return whether the database can use an index to evaluate the filter
+    ``node``: a comparison on an indexed field, a conjunction with such a
+    term, or a disjunction of such terms.  Negations cannot use an index.
+    """
+    kind = node[0]
+    if kind == 'cmp':
+        return node[2] != '!=' and is_indexed(model, node[1])
+    if kind == 'and':
+        return any(uses_index(child, model) for child in node[1])
+    if kind == 'or':
+        return all(uses_index(child, model) for child in node[1])
+    return False
+
+
+def is_indexed(model, path):
+    """
+    Return whether the lookup ``path`` from ``model`` is indexed: each
+    relation followed and the final field are the first column of an index.
+    """
+    for name in path.split('__'):
+        if name == 'pk':
+            return True
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        if field.concrete and not field.many_to_many:
+            if field.name not in _indexed_fields(model):
+                return False
+        # Reverse and many-to-many relations join on foreign keys, which
+        # are indexed.
+        if field.related_model is not None:
+            model = field.related_model
+    return True
+
+
+@lru_cache(maxsize=None)
+def _indexed_fields(model):
+    """Return the names of the fields of ``model`` leading an index."""
+    opts = model._meta
+    names = {
+        field.name for field in opts.concrete_fields
+        if field.primary_key or field.unique or field.db_index
+    }
+    for index in opts.indexes:
+        if index.fields:
+            names.add(index.fields[0].lstrip('-'))
+    for fields in opts.unique_together:
+        names.add(fields[0])
+    for constraint in opts.constraints:
+        fields = getattr(constraint, 'fields', None)
+        if fields:
+            names.add(fields[0])
+    return frozenset(names)
+
+
+def get_model_fields(serializer, model):
+    """
+    Return the names of the readable fields of ``serializer`` reading a
+    concrete model field of the same name, the default fields services
+    allow to filter and order by.
+    """
+    fields = []
+    for field_name, field in serializer.fields.items():
+        if field.write_only or field.source != field_name:
+            continue
+        try:
+            model_field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            continue
+        if model_field.concrete and not model_field.many_to_many:
+            fields.append(field_name)
+    return fields
+
+
+class _FilterParser:
+    def __init__(self, expression):
+        self.tokens = self.tokenize(expression)
+        self.position = 0
+        self.depth = 0
+        self.fields = set()
+
+    def tokenize(self, expression):
+        tokens = []
+        position = 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = _TOKEN_RE.match(expression, position)
+            if match is None:
+                raise InvalidFilter('Invalid filter at %r.' % expression[position:].strip())
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            position = match.end()
+        return tokens
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def next(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise InvalidFilter('Empty filter.')
+        node = self.parse_and()
+        if self.position < len(self.tokens):
+            raise InvalidFilter('Unexpected %r in filter.' % self.peek()[1])
+        return node
+
+    def parse_and(self):
+        nodes = [self.parse_or()]
+        while True:
+            kind, value = self.peek()
+            if kind is None or (kind == 'paren' and value == ')'):
+                break
+            if kind == 'word' and value == 'AND':
+                self.next()
+            nodes.append(self.parse_or())
+        return nodes[0] if len(nodes) == 1 else ('and', tuple(nodes))
+
+    def parse_or(self):
+        nodes = [self.parse_unary()]
+        while self.peek() == ('word', 'OR'):
+            self.next()
+            nodes.append(self.parse_unary())
+        return nodes[0] if len(nodes) == 1 else ('or', tuple(nodes))
+
+    def parse_unary(self):
+        kind, value = self.peek()
+        if kind == 'word' and (value == 'NOT' or value == '-'):
+            self.next()
+            return ('not', self.nested(self.parse_unary))
+        if kind == 'word' and value.startswith('-') and not _NUMBER_RE.match(value):
+            # "-field = value" is a negation too.
+            self.tokens[self.position] = ('word', value[1:])
+            return ('not', self.nested(self.parse_unary))
+        if (kind, value) == ('paren', '('):
+            self.next()
+            node = self.nested(self.parse_and)
+            if self.next() != ('paren', ')'):
+                raise InvalidFilter('Missing ")" in filter.')
+            return node
+        return self.parse_comparison()
+
+    def nested(self, parse):
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise InvalidFilter('The filter is nested too deeply.')
+        try:
+            return parse()
+        finally:
+            self.depth -= 1
+
+    def parse_comparison(self):
+        kind, field = self.next()
+        if kind != 'word' or field in _KEYWORDS or not _FIELD_RE.match(field):
+            raise InvalidFilter('Expected a field name in filter, got %r.' % field)
+        kind, op = self.next()
+        if kind != 'op':
+            raise InvalidFilter('Expected an operator after %r in filter.' % field)
+        kind, token = self.next()
+        if kind == 'string':
+            value = re.sub(r'\\(.)', r'\1', token[1:-1])
+        elif kind == 'word' and token not in _KEYWORDS:
+            value = self.parse_word(token)
+        else:
+            raise InvalidFilter('Expected a value after %r in filter.' % op)
+        if value is None and op not in ('=', '!='):
+            raise InvalidFilter('null can only be compared with = and !=.')
+        path = field.replace('.', '__')
+        self.fields.add(path)
+        return ('cmp', path, op, value)
+
+    def parse_word(self, word):
+        if word == 'true':
+            return True
+        if word == 'false':
+            return False
+        if word == 'null':
+            return None
+        if _NUMBER_RE.match(word):
+            return float(word) if any(c in word for c in '.eE') else int(word)
+        return word
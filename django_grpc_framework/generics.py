@@ -4,8 +4,10 @@ from django.core.exceptions import ValidationError
 from django.http import Http404
 import grpc
 
-from django_grpc_framework.utils import model_meta
-from django_grpc_framework import mixins, services
+from django_grpc_framework.settings import grpc_settings
+from django_grpc_framework.utils import model_meta, optimizer
+from django_grpc_framework.utils.contexts import abort
+from django_grpc_framework import caching, filters, loaders, mixins, routing, services
 
 
 class GenericService(services.Service):
@@ -19,6 +21,56 @@ class GenericService(services.Service):
     # Set this if you want to use object lookups other than id
     lookup_field = None
     lookup_request_field = None
+    # The filter backend classes, defaults to the DEFAULT_FILTER_BACKENDS
+    # setting.
+    filter_backends = None
+    # The fields the ``filter`` and ``order_by`` of requests may use, default
+    # to the serializer fields reading a model field of the same name.
+    filter_fields = None
+    ordering_fields = None
+    # Set this to reject filters and orderings that cannot use an index.
+    require_index = False
+    # Set this to derive ``select_related()``, ``prefetch_related()`` and
+    # ``only()`` from the serializer fields.
+    optimize_queryset = False
+    # The actions whose querysets only load the columns the serializer reads.
+    optimize_only_actions = ('List', 'Retrieve', 'BatchRetrieve')
+    # Set this to cache the messages of ``Retrieve()`` by primary key in the
+    # ``cache_retrieve_alias`` cache, for ``cache_retrieve_timeout`` seconds.
+    # Saving or deleting an instance invalidates its messages, bump
+    # ``cache_retrieve_version`` when the serializer changes.
+    cache_retrieve = False
+    cache_retrieve_alias = 'default'
+    cache_retrieve_timeout = 300
+    cache_retrieve_version = 1
+    _cache_retrieve_scope = None
+    # The queries of ``read_actions`` go to one of the ``read_databases``,
+    # defaulting to the READ_DATABASES setting, chosen for each call by
+    # ``read_database_policy``: 'round_robin' or 'least_connections'.  The
+    # reads of a client stay on the default database for
+    # ``read_your_writes_window`` seconds after the time of the
+    # ``x-last-write-at`` metadata of its calls.
+    read_actions = ('List', 'Retrieve', 'BatchRetrieve')
+    read_databases = None
+    read_database_policy = 'round_robin'
+    read_your_writes_window = 0
+
+    @classmethod
+    def as_servicer(cls, **initkwargs):
+        if initkwargs.get('cache_retrieve', cls.cache_retrieve):
+            # Scope the cached messages once rather than on every call.
+            initkwargs['_cache_retrieve_scope'] = caching.get_servicer_scope(cls, initkwargs)
+        servicer = super().as_servicer(**initkwargs)
+        if initkwargs.get('cache_retrieve', cls.cache_retrieve):
+            # Invalidate the cached messages from the start, even before
+            # the first Retrieve() call.
+            queryset = initkwargs.get('queryset', cls.queryset)
+            if queryset is not None:
+                caching.register(
+                    queryset.model,
+                    initkwargs.get('cache_retrieve_alias', cls.cache_retrieve_alias),
+                )
+        return servicer
 
     def get_queryset(self):
         """
@@ -46,8 +98,41 @@ class GenericService(services.Service):
         if isinstance(queryset, QuerySet):
             # Ensure queryset is re-evaluated on each request.
             queryset = queryset.all()
+            database = self.get_database()
+            if database is not None:
+                queryset = queryset.using(database)
         return queryset
 
+    def get_read_databases(self):
+        if self.read_databases is None:
+            return grpc_settings.READ_DATABASES
+        return self.read_databases
+
+    def get_database(self):
+        """
+        Return the database alias of the queries of the call, one of the
+        read databases for the read actions, or ``None`` for the default
+        routing.  The alias is chosen once per call.
+        """
+        try:
+            return self._database
+        except AttributeError:
+            pass
+        self._database = None
+        if getattr(self, 'action', None) in self.read_actions:
+            aliases = tuple(self.get_read_databases())
+            if aliases and not routing.reads_own_writes(
+                    getattr(self, 'context', None), self.read_your_writes_window):
+                self._database = routing.balancer.choose(aliases, self.read_database_policy)
+        return self._database
+
+    def finalize(self):
+        super().finalize()
+        database = self.__dict__.get('_database')
+        if database is not None:
+            routing.balancer.release(database)
+            self._database = None
+
     def get_serializer_class(self):
         """
         Return the class to use for the serializer. Defaults to using
@@ -67,17 +152,7 @@ class GenericService(services.Service):
         queryset.
         """
         queryset = self.filter_queryset(self.get_queryset())
-        lookup_field = (
-            self.lookup_field
-            or model_meta.get_model_pk(queryset.model).name
-        )
-        lookup_request_field = self.lookup_request_field or lookup_field
-        assert hasattr(self.request, lookup_request_field), (
-            'Expected service %s to be called with request that has a field '
-            'named "%s". Fix your request protocol definition, or set the '
-            '`.lookup_field` attribute on the service correctly.' %
-            (self.__class__.__name__, lookup_request_field)
-        )
+        lookup_field, lookup_request_field = self.get_lookup_fields(queryset.model)
         lookup_value = getattr(self.request, lookup_request_field)
         filter_kwargs = {lookup_field: lookup_value}
         try:
@@ -88,6 +163,27 @@ class GenericService(services.Service):
                 (queryset.model.__name__, lookup_value)
             ))
 
+    def get_lookup_fields(self, model, request=None):
+        """
+        Return the ``(lookup_field, lookup_request_field)`` pair used to look
+        up a single instance of ``model`` from ``request``, defaulting to the
+        request of the call.
+        """
+        if request is None:
+            request = self.request
+        lookup_field = (
+            self.lookup_field
+            or model_meta.get_model_pk(model).name
+        )
+        lookup_request_field = self.lookup_request_field or lookup_field
+        assert hasattr(request, lookup_request_field), (
+            'Expected service %s to be called with request that has a field '
+            'named "%s". Fix your request protocol definition, or set the '
+            '`.lookup_field` attribute on the service correctly.' %
+            (self.__class__.__name__, lookup_request_field)
+        )
+        return lookup_field, lookup_request_field
+
     def get_serializer(self, *args, **kwargs):
         """
         Return the serializer instance that should be used for validating and
@@ -108,10 +204,100 @@ class GenericService(services.Service):
             'service': self,
         }
 
+    def get_filter_backends(self):
+        if self.filter_backends is None:
+            return grpc_settings.DEFAULT_FILTER_BACKENDS
+        return self.filter_backends
+
+    def get_filter_fields(self):
+        """Return the names of the fields requests may filter by."""
+        if self.filter_fields is not None:
+            return self.filter_fields
+        return filters.get_model_fields(self.get_serializer(), self.get_queryset().model)
+
+    def get_ordering_fields(self):
+        """Return the names of the fields requests may order by."""
+        if self.ordering_fields is not None:
+            return self.ordering_fields
+        return filters.get_model_fields(self.get_serializer(), self.get_queryset().model)
+
     def filter_queryset(self, queryset):
-        """Given a queryset, filter it, returning a new queryset."""
+        """
+        Given a queryset, filter it with the filter backends, returning a
+        new queryset.  Invalid filters abort the call with
+        ``INVALID_ARGUMENT``.
+        """
+        try:
+            for backend in self.get_filter_backends():
+                queryset = backend().filter_queryset(self.request, queryset, self)
+        except filters.InvalidFilter as exc:
+            abort(
+                self.context, grpc.StatusCode.INVALID_ARGUMENT, str(exc),
+                filters.InvalidFilter,
+            )
+        if self.optimize_queryset:
+            queryset = self.get_optimized_queryset(queryset)
         return queryset
 
+    def get_optimized_queryset(self, queryset):
+        """
+        Given a queryset, return it with the ``select_related()``,
+        ``prefetch_related()`` and ``only()`` calls the serializer fields
+        need.  ``only()`` is limited to ``optimize_only_actions``, saving an
+        instance with deferred fields would skip fields like ``auto_now``
+        ones.
+        """
+        return optimizer.optimize_queryset(
+            queryset, self.get_serializer(),
+            only=getattr(self, 'action', None) in self.optimize_only_actions,
+        )
+
+
+class AsyncGenericService(GenericService):
+    """
+    Base class for generic services with ``async`` handlers, using Django's
+    async ORM interface so that the handlers do not block the event loop of
+    the ``grpc.aio`` server.
+    """
+    # Set this to fetch the objects of the concurrent calls of
+    # ``coalesce_actions`` with one query.  The querysets of these calls must
+    # not depend on the request, and ``lookup_field`` must be unique.
+    coalesce_lookups = False
+    coalesce_actions = ('Retrieve',)
+    # The seconds to wait for more lookups before querying, by default the
+    # lookups issued in the same iteration of the event loop are coalesced.
+    coalesce_window = 0
+
+    async def aget_object(self):
+        """
+        Async version of ``get_object()``.  With ``coalesce_lookups``, the
+        lookups of concurrent calls are batched by a
+        ``loaders.ObjectLoader``.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_field, lookup_request_field = self.get_lookup_fields(queryset.model)
+        lookup_value = getattr(self.request, lookup_request_field)
+        key = None
+        if self.coalesce_lookups and getattr(self, 'action', None) in self.coalesce_actions:
+            key = loaders.get_loader_key(queryset, lookup_field)
+        if key is not None:
+            loader = loaders.get_loader(key, lookup_field, window=self.coalesce_window)
+            instance = await loader.load(queryset, lookup_value)
+            if instance is None:
+                await self.context.abort(grpc.StatusCode.NOT_FOUND, (
+                    '%s: %s not found!' %
+                    (queryset.model.__name__, lookup_value)
+                ))
+            return instance
+        filter_kwargs = {lookup_field: lookup_value}
+        try:
+            return await queryset.aget(**filter_kwargs)
+        except (TypeError, ValueError, ValidationError, queryset.model.DoesNotExist):
+            await self.context.abort(grpc.StatusCode.NOT_FOUND, (
+                '%s: %s not found!' %
+                (queryset.model.__name__, lookup_value)
+            ))
+
 
 class CreateService(mixins.CreateModelMixin,
                     GenericService):
@@ -178,3 +364,71 @@ class ModelService(mixins.CreateModelMixin,
     ``Update()``, ``Destroy()`` and ``List()`` handlers.
     """
     pass
+
+
+class AsyncCreateService(mixins.AsyncCreateModelMixin,
+                         AsyncGenericService):
+    """
+    Concrete async service for creating a model instance that provides a
+    ``Create()`` handler.
+    """
+    pass
+
+
+class AsyncListService(mixins.AsyncListModelMixin,
+                       AsyncGenericService):
+    """
+    Concrete async service for listing a queryset that provides a ``List()``
+    handler.
+    """
+    pass
+
+
+class AsyncRetrieveService(mixins.AsyncRetrieveModelMixin,
+                           AsyncGenericService):
+    """
+    Concrete async service for retrieving a model instance that provides a
+    ``Retrieve()`` handler.
+    """
+    pass
+
+
+class AsyncDestroyService(mixins.AsyncDestroyModelMixin,
+                          AsyncGenericService):
+    """
+    Concrete async service for deleting a model instance that provides a
+    ``Destroy()`` handler.
+    """
+    pass
+
+
+class AsyncUpdateService(mixins.AsyncUpdateModelMixin,
+                         AsyncGenericService):
+    """
+    Concrete async service for updating a model instance that provides a
+    ``Update()`` handler.
+    """
+    pass
+
+
+class AsyncReadOnlyModelService(mixins.AsyncRetrieveModelMixin,
+                                mixins.AsyncListModelMixin,
+                                AsyncGenericService):
+    """
+    Concrete async service that provides default ``List()`` and
+    ``Retrieve()`` handlers.
+    """
+    pass
+
+
+class AsyncModelService(mixins.AsyncCreateModelMixin,
+                        mixins.AsyncRetrieveModelMixin,
+                        mixins.AsyncUpdateModelMixin,
+                        mixins.AsyncDestroyModelMixin,
+                        mixins.AsyncListModelMixin,
+                        AsyncGenericService):
+    """
+    Concrete async service that provides default ``Create()``,
+    ``Retrieve()``, ``Update()``, ``Destroy()`` and ``List()`` handlers.
+    """
+    pass
@@ -0,0 +1,154 @@
+"""
+Hooks run when each call of a service starts and finishes.
+
+Hooks are registered at import time, like signal receivers::
+
+    @hooks.request_started
+    def log_call(sender, request, context):
+        ...
+
+    @hooks.request_finished
+    async def flush_metrics(sender):
+        ...
+
+``as_servicer()`` compiles the hooks registered then into flat tuples of
+callables, so that running them is one call each, without the lock and the
+allocations of ``Signal.send()``.  The ``grpc_request_started`` and
+``grpc_request_finished`` signals are still sent by a hook when they have
+receivers.
+"""
+from contextlib import contextmanager
+import inspect
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+from django_grpc_framework.settings import grpc_settings
+from django_grpc_framework.signals import grpc_request_started, grpc_request_finished
+from django_grpc_framework.utils.loops import loop_runner
+
+
+_started = []
+_finished = []
+
+
+def request_started(hook):
+    """
+    Register ``hook(sender, request, context)`` to be called when a call
+    starts, ``sender`` being the handler of the call.  Usable as a decorator.
+    """
+    _started.append(hook)
+    return hook
+
+
+def request_finished(hook):
+    """
+    Register ``hook(sender)`` to be called when a call finishes, whether it
+    succeeded or not.  Usable as a decorator.
+    """
+    _finished.append(hook)
+    return hook
+
+
+def compile_hooks(is_async=False):
+    """
+    Return the ``(started, finished, astarted, afinished)`` tuples of the
+    hooks registered now, for a handler.  Sync handlers run the coroutine
+    hooks on the event loop of their thread and get empty ``astarted`` and
+    ``afinished``.  Async handlers get the coroutine hooks in ``astarted``
+    and ``afinished``, awaited after the other hooks.
+    """
+    if not is_async:
+        return (
+            tuple(_run_sync(hook) for hook in _started),
+            tuple(_run_sync(hook) for hook in _finished),
+            (), (),
+        )
+    return (
+        tuple(hook for hook in _started if not inspect.iscoroutinefunction(hook)),
+        tuple(hook for hook in _finished if not inspect.iscoroutinefunction(hook)),
+        tuple(hook for hook in _started if inspect.iscoroutinefunction(hook)),
+        tuple(hook for hook in _finished if inspect.iscoroutinefunction(hook)),
+    )
+
+
+def _run_sync(hook):
+    if not inspect.iscoroutinefunction(hook):
+        return hook
+
+    def run(*args):
+        loop_runner.run(hook(*args))
+
+    return run
+
+
+class ConnectionHousekeeping:
+    """
+    Closes the database connections of the thread that errored or are past
+    their ``CONN_MAX_AGE`` when a call starts and finishes, like Django does
+    at the start and the end of each request, so that a call does not reuse
+    a connection that expired while the thread was idle.  It runs at most
+    once every ``CONNECTION_HOUSEKEEPING_INTERVAL`` seconds on each thread,
+    twice a call by default.
+    """
+    def __init__(self):
+        self.enabled = True
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._disabled = 0
+
+    def __call__(self, sender, *args):
+        if not self.enabled or self._disabled:
+            return
+        interval = grpc_settings.CONNECTION_HOUSEKEEPING_INTERVAL
+        if interval:
+            now = time.monotonic()
+            if now < getattr(self._local, 'next_run', 0):
+                return
+            self._local.next_run = now + interval
+        close_old_connections()
+
+    @contextmanager
+    def disabled(self):
+        """
+        Do not close connections, like in the atomic blocks of tests.  The
+        scopes may be nested and interleaved, like the ones of the streams
+        of tests being iterated together.
+        """
+        with self._lock:
+            self._disabled += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._disabled -= 1
+
+
+#: The housekeeping of the database connections, run when calls finish.
+housekeeping = ConnectionHousekeeping()
+
+
+@request_started
+def reset_queries(sender, request, context):
+    """Clear the queries logged in ``DEBUG`` mode."""
+    if settings.DEBUG:
+        for connection in connections.all(initialized_only=True):
+            connection.queries_log.clear()
+
+
+@request_started
+def send_request_started(sender, request, context):
+    if grpc_request_started.receivers:
+        grpc_request_started.send(sender=sender, request=request, context=context)
+
+
+@request_finished
+def send_request_finished(sender):
+    if grpc_request_finished.receivers:
+        grpc_request_finished.send(sender=sender)
+
+
+request_started(housekeeping)
+request_finished(housekeeping)
@@ -0,0 +1,127 @@
+"""
+Coalescing of the concurrent object lookups of async services.
+
+On a ``grpc.aio`` server, the ``Retrieve()`` calls arriving together each
+look up one row.  An ``ObjectLoader`` collects the lookups issued in the
+same iteration of the event loop, or within a small time window, and runs
+them as one ``WHERE field IN (...)`` query, handing each waiter its own
+instance, or ``None`` when there is no such row.
+"""
+import asyncio
+import weakref
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import EmptyResultSet, ValidationError
+
+
+#: The maximum number of lookup values of a query, more pending lookups are
+#: split in several queries.
+MAX_BATCH_SIZE = 1000
+
+_loaders = weakref.WeakKeyDictionary()
+
+
+def get_loader_key(queryset, field_name):
+    """
+    Return the key of the loader of the lookups of ``queryset`` on
+    ``field_name``, or ``None`` when the queryset can match no row.  The
+    lookups of querysets with different SQL, like the ones of servicers
+    restricted to different rows, are never batched together.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    return (queryset.model, queryset.db, sql, repr(params), field_name)
+
+
+def get_loader(key, field_name, window=0, max_batch_size=MAX_BATCH_SIZE):
+    """
+    Return the pending ``ObjectLoader`` of ``key`` for the running event
+    loop, creating it if needed.  Loaders are not shared between loops, and
+    are forgotten once their batch is dispatched.
+    """
+    loaders = _loaders.setdefault(asyncio.get_running_loop(), {})
+    try:
+        return loaders[key]
+    except KeyError:
+        loader = loaders[key] = ObjectLoader(field_name, window, max_batch_size)
+        loader._registry = (loaders, key)
+        return loader
+
+
+class ObjectLoader:
+    """
+    Batches the lookups of ``load()`` on the unique model field
+    ``field_name``.  The lookups are run ``window`` seconds after the first
+    pending one, at the end of the current iteration of the event loop by
+    default.
+    """
+    def __init__(self, field_name, window=0, max_batch_size=MAX_BATCH_SIZE):
+        self.field_name = field_name
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._queryset = None
+        self._pending = {}
+        self._handle = None
+        self._tasks = set()
+        self._registry = None
+
+    async def load(self, queryset, value):
+        """
+        Return the instance of ``queryset`` with ``value`` in ``field_name``,
+        or ``None``.  The batch is fetched from the queryset of its first
+        lookup, so the lookups of a loader must use the same queryset, which
+        the key of ``get_loader_key()`` ensures.
+        """
+        field = queryset.model._meta.get_field(self.field_name)
+        try:
+            value = field.to_python(value)
+        except ValidationError:
+            return None
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._pending:
+            self._queryset = queryset
+            if self.window:
+                self._handle = loop.call_later(self.window, self._dispatch)
+            else:
+                self._handle = loop.call_soon(self._dispatch)
+        self._pending.setdefault(value, []).append(future)
+        if len(self._pending) >= self.max_batch_size:
+            self._handle.cancel()
+            self._dispatch()
+        return await future
+
+    def _dispatch(self):
+        queryset, pending = self._queryset, self._pending
+        self._queryset, self._pending, self._handle = None, {}, None
+        if self._registry is not None:
+            # The next lookups start a new loader, so that the loaders of
+            # querysets seen once do not pile up.
+            loaders, key = self._registry
+            if loaders.get(key) is self:
+                del loaders[key]
+            self._registry = None
+        task = asyncio.ensure_future(self._resolve(queryset, pending))
+        # Keep a reference to the task until it is done.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, queryset, pending):
+        try:
+            instances = await sync_to_async(self.fetch)(queryset, list(pending))
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        for value, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(instances.get(value))
+
+    def fetch(self, queryset, values):
+        """Return the instances of ``queryset`` by their ``field_name``."""
+        return queryset.in_bulk(values, field_name=self.field_name)
@@ -22,6 +22,13 @@ class Command(BaseCommand):
             '--file', dest='file', default=None, type=str,
             help='the generated proto file path'
         )
+        parser.add_argument(
+            '--bulk', dest='bulk', action='store_true',
+            help=(
+                'also generate the BatchRetrieve rpc and the client streaming '
+                'BulkCreate, BulkUpdate and BulkDestroy rpcs'
+            ),
+        )
 
     def handle(self, *args, **options):
         model = import_string(options['model'])
@@ -37,6 +44,7 @@ class Command(BaseCommand):
             model=model,
             field_names=fields,
             package=package,
+            bulk=options['bulk'],
         )
         proto = generator.get_proto()
         if filepath:
@@ -3,19 +3,78 @@ import asyncio
 from concurrent import futures
 from datetime import datetime
 import logging
+import signal
 import sys
 import errno
+import inspect
 import os
+import threading
+import time
 
 import grpc
 from django import get_version
 
 from django.utils import autoreload
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 
 # import aiohttp_autoreload as autoreload
+from django_grpc_framework.protobuf.raw import RawMessageServer
 from django_grpc_framework.settings import grpc_settings
+from django_grpc_framework.utils.executors import MeteredThreadPoolExecutor
+from django_grpc_framework.utils.loops import loop_runner
+
+
+class PendingLimitInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Reject the calls of sync handlers with ``RESOURCE_EXHAUSTED`` while
+    ``max_pending`` calls are waiting for a worker of ``executor``, a
+    ``MeteredThreadPoolExecutor``.
+    """
+
+    def __init__(self, executor, max_pending):
+        self.executor = executor
+        self.max_pending = max_pending
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        behavior = (
+            handler.unary_unary
+            or handler.unary_stream
+            or handler.stream_unary
+            or handler.stream_stream
+        )
+        if inspect.iscoroutinefunction(behavior) or inspect.isasyncgenfunction(
+            behavior
+        ):
+            return handler
+        if self.executor.metrics()["pending"] < self.max_pending:
+            return handler
+        return _reject_handler(handler)
+
+
+def _reject_handler(handler):
+    async def reject(request_or_iterator, context):
+        await context.abort(
+            grpc.StatusCode.RESOURCE_EXHAUSTED, "Too many pending calls."
+        )
+
+    if handler.request_streaming and handler.response_streaming:
+        make_handler = grpc.stream_stream_rpc_method_handler
+    elif handler.request_streaming:
+        make_handler = grpc.stream_unary_rpc_method_handler
+    elif handler.response_streaming:
+        make_handler = grpc.unary_stream_rpc_method_handler
+    else:
+        make_handler = grpc.unary_unary_rpc_method_handler
+    return make_handler(
+        reject,
+        request_deserializer=handler.request_deserializer,
+        response_serializer=handler.response_serializer,
+    )
 
 
 class Command(BaseCommand):
@@ -39,7 +98,58 @@ class Command(BaseCommand):
             type=int,
             default=10,
             dest="max_workers",
-            help="Number of maximum worker threads.",
+            help="Number of maximum worker threads running sync handlers.",
+        )
+        parser.add_argument(
+            "--max-pending",
+            type=int,
+            default=None,
+            dest="max_pending",
+            help=(
+                "Number of maximum calls of sync handlers waiting for a worker "
+                "thread, further calls are rejected with RESOURCE_EXHAUSTED.  "
+                "Unbounded by default."
+            ),
+        )
+        parser.add_argument(
+            "--metrics-interval",
+            type=float,
+            default=None,
+            dest="metrics_interval",
+            help=(
+                "Log the usage of the worker pool every given seconds.  Only "
+                "logged when the server stops by default."
+            ),
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            dest="sync_mode",
+            help=(
+                "Run the threaded grpc.server instead of grpc.aio.server, "
+                "for deployments where all handlers are sync."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            dest="workers",
+            help=(
+                "Number of server processes.  With more than one, a master "
+                "process forks the workers, which all listen on the same port "
+                "with SO_REUSEPORT, and restarts them if they die."
+            ),
+        )
+        parser.add_argument(
+            "--grace",
+            type=float,
+            default=10.0,
+            dest="grace",
+            help=(
+                "Seconds given to in-flight RPCs when a worker process is "
+                "asked to stop."
+            ),
         )
         parser.add_argument(
             "--dev",
@@ -55,6 +165,14 @@ class Command(BaseCommand):
         self.address = options["address"]
         self.development_mode = options["development_mode"]
         self.max_workers = options["max_workers"]
+        self.max_pending = options["max_pending"]
+        self.metrics_interval = options["metrics_interval"]
+        self.sync_mode = options["sync_mode"]
+        self.workers = options["workers"]
+        self.grace = options["grace"]
+        self.is_worker = False
+        if self.workers > 1 and self.development_mode:
+            raise CommandError("--workers cannot be used with --dev.")
         self.run(**options)
 
     def run(self, **options):
@@ -72,10 +190,113 @@ class Command(BaseCommand):
                     "address": self.address,
                 }
             )
-            asyncio.run(self._serve())
+            if self.workers > 1:
+                self.serve_forked()
+            else:
+                self.serve()
 
-    async def _serve(self):
-        interceptors = [
+    def serve(self):
+        """Run the threaded or the asyncio server until it terminates."""
+        self.executor = MeteredThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="grpc-worker",
+        )
+        stopped = threading.Event()
+        if self.metrics_interval:
+            threading.Thread(
+                target=self._log_metrics,
+                args=(stopped,),
+                name="grpc-metrics",
+                daemon=True,
+            ).start()
+        try:
+            if self.sync_mode:
+                self._serve_sync()
+            else:
+                asyncio.run(self._serve())
+        finally:
+            stopped.set()
+            self.executor.shutdown(wait=False)
+            loop_runner.close()
+            logging.info("Worker pool usage: %s", self.executor.metrics())
+
+    def _log_metrics(self, stopped):
+        while not stopped.wait(self.metrics_interval):
+            logging.info("Worker pool usage: %s", self.executor.metrics())
+
+    def serve_forked(self):
+        """
+        Fork the worker processes and supervise them, restarting the ones
+        that die until the master is asked to stop with SIGINT or SIGTERM.
+        """
+        # Import the handlers hook and the interceptors once in the master,
+        # the workers inherit them.  Nothing may have started grpc or opened
+        # a database connection before forking.
+        grpc_settings.ROOT_HANDLERS_HOOK
+        grpc_settings.SERVER_INTERCEPTORS
+        connections.close_all()
+
+        self.worker_pids = {}
+        self.stopping = False
+        signal.signal(signal.SIGINT, self._stop_workers)
+        signal.signal(signal.SIGTERM, self._stop_workers)
+        signal.signal(signal.SIGALRM, self._kill_workers)
+        for _ in range(self.workers):
+            self._spawn_worker()
+        while self.worker_pids:
+            pid, status = os.wait()
+            started_at = self.worker_pids.pop(pid, None)
+            if started_at is None or self.stopping:
+                continue
+            logging.warning(
+                "Worker %s exited with status %s, restarting it.", pid, status
+            )
+            if time.monotonic() - started_at < 1:
+                # Do not spin if workers die right after starting.
+                time.sleep(1)
+                if self.stopping:
+                    continue
+            self._spawn_worker()
+        signal.alarm(0)
+
+    def _spawn_worker(self):
+        pid = os.fork()
+        if pid:
+            self.worker_pids[pid] = time.monotonic()
+            return
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGALRM):
+            signal.signal(signum, signal.SIG_DFL)
+        self.is_worker = True
+        code = 0
+        try:
+            self.serve()
+        except BaseException:
+            logging.exception("Worker %s crashed.", os.getpid())
+            code = 1
+        finally:
+            os._exit(code)
+
+    def _stop_workers(self, signum, frame):
+        if self.stopping:
+            return
+        self.stopping = True
+        logging.info("Stopping %d workers.", len(self.worker_pids))
+        for pid in self.worker_pids:
+            os.kill(pid, signal.SIGTERM)
+        # Kill the workers that are still around once the grace is over.
+        signal.alarm(int(self.grace) + 5)
+
+    def _kill_workers(self, signum, frame):
+        for pid in self.worker_pids:
+            os.kill(pid, signal.SIGKILL)
+
+    def get_server_options(self):
+        if self.is_worker:
+            return [("grpc.so_reuseport", 1)]
+        return None
+
+    def get_interceptors(self):
+        return [
             interceptor()
             for interceptor in (
                 grpc_settings.SERVER_INTERCEPTORS
@@ -83,11 +304,62 @@ class Command(BaseCommand):
                 else []
             )
         ]
-        server = grpc.aio.server(interceptors=interceptors)
-        grpc_settings.ROOT_HANDLERS_HOOK(server)
+
+    def get_maximum_concurrent_rpcs(self):
+        """
+        Return the bound of the RPCs of the threaded server, which all run
+        on the worker pool: the busy workers and the pending calls.
+        """
+        if self.max_pending is None:
+            return None
+        return self.max_workers + self.max_pending
+
+    def _serve_sync(self):
+        server = grpc.server(
+            self.executor,
+            interceptors=self.get_interceptors(),
+            maximum_concurrent_rpcs=self.get_maximum_concurrent_rpcs(),
+            options=self.get_server_options(),
+        )
+        grpc_settings.ROOT_HANDLERS_HOOK(RawMessageServer(server))
+        server.add_insecure_port(self.address)
+        server.start()
+        if self.is_worker:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, lambda *args: server.stop(self.grace))
+        try:
+            server.wait_for_termination()
+        finally:
+            server.stop(None)
+
+    async def _serve(self):
+        # Sync handlers run on the executor, coroutine handlers on the loop.
+        interceptors = self.get_interceptors()
+        if self.max_pending is not None:
+            # Coroutine handlers do not wait for a worker, only the calls of
+            # sync handlers are bounded.
+            interceptors.insert(
+                0, PendingLimitInterceptor(self.executor, self.max_pending)
+            )
+        server = grpc.aio.server(
+            migration_thread_pool=self.executor,
+            interceptors=interceptors,
+            options=self.get_server_options(),
+        )
+        grpc_settings.ROOT_HANDLERS_HOOK(RawMessageServer(server))
         server.add_insecure_port(self.address)
         await server.start()
-        await server.wait_for_termination()
+        if self.is_worker:
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(
+                    signum,
+                    lambda: asyncio.ensure_future(server.stop(self.grace)),
+                )
+        try:
+            await server.wait_for_termination()
+        finally:
+            await server.stop(None)
 
     def inner_run(self, *args, **options):
         # If an exception was silenced in ManagementUtility.execute in order
@@ -116,7 +388,7 @@ class Command(BaseCommand):
             }
         )
         try:
-            asyncio.run(self._serve())
+            self.serve()
         except OSError as e:
             # Use helpful error messages instead of ugly tracebacks.
             ERRORS = {
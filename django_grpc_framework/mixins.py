@@ -1,5 +1,19 @@
+import asyncio
+from itertools import islice
+import json
+
+from asgiref.sync import sync_to_async
+import django
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import DatabaseError, router, transaction
+from django.db.models import signals
+import grpc
 from google.protobuf import empty_pb2
 
+from django_grpc_framework import caching, filters, pagination
+from django_grpc_framework.protobuf.native import is_repeated
+from django_grpc_framework.settings import grpc_settings
+
 
 class CreateModelMixin:
     def Create(self, request, context):
@@ -20,11 +34,36 @@ class CreateModelMixin:
         serializer.save()
 
 
+def _get_is_active(context):
+    """
+    Return a function telling whether the call of ``context`` is still
+    active.  The contexts given to the sync handlers of ``grpc.aio`` servers
+    have no ``is_active()``, only the deadline of their call is checked: on
+    cancellation the server stops iterating the handler itself.
+    """
+    is_active = getattr(context, 'is_active', None)
+    if is_active is not None:
+        return is_active
+    time_remaining = getattr(context, 'time_remaining', None)
+
+    def check():
+        remaining = time_remaining() if time_remaining is not None else None
+        return remaining is None or remaining > 0
+    return check
+
+
 class ListModelMixin:
+    #: The number of rows fetched from the database, and serialized, at a
+    #: time by ``List()``, defaults to the ``LIST_CHUNK_SIZE`` setting.
+    list_chunk_size = None
+
     def List(self, request, context):
         """
         List a queryset.  This sends a sequence of messages of
-        ``serializer.Meta.proto_class`` to the client.
+        ``serializer.Meta.proto_class`` to the client.  The queryset is
+        iterated in chunks of ``list_chunk_size`` rows, so only one chunk is
+        held in memory at a time, and the iteration stops as soon as the
+        client is gone.
 
         .. note::
 
@@ -32,8 +71,23 @@ class ListModelMixin:
         """
         queryset = self.filter_queryset(self.get_queryset())
         serializer = self.get_serializer(queryset, many=True)
-        for message in serializer.message:
-            yield message
+        chunks = serializer.iter_message_chunks(chunk_size=self.get_list_chunk_size())
+        is_active = _get_is_active(context)
+        try:
+            for chunk in chunks:
+                yield from chunk
+                if not is_active():
+                    # Cancelled or past its deadline, do not fetch the next
+                    # chunk for nobody.
+                    return
+        finally:
+            # Close the database cursor now rather than when collected.
+            chunks.close()
+
+    def get_list_chunk_size(self):
+        if self.list_chunk_size is None:
+            return grpc_settings.LIST_CHUNK_SIZE
+        return self.list_chunk_size
 
 
 class RetrieveModelMixin:
@@ -43,8 +97,16 @@ class RetrieveModelMixin:
 
         The request have to include a field corresponding to
         ``lookup_request_field``.  If an object can be retrieved this returns
-        a proto message of ``serializer.Meta.proto_class``.
+        a proto message of ``serializer.Meta.proto_class``.  With
+        ``cache_retrieve``, the messages are cached.
         """
+        if self.cache_retrieve:
+            cache = caching.RetrieveCache(self)
+            message = cache.get()
+            if message is None:
+                message = self.get_serializer(self.get_object()).message
+                cache.set(message)
+            return message
         instance = self.get_object()
         serializer = self.get_serializer(instance)
         return serializer.message
@@ -119,3 +181,709 @@ class DestroyModelMixin:
     def perform_destroy(self, instance):
         """Delete an object instance."""
         instance.delete()
+
+
+class BatchRetrieveModelMixin:
+    #: The response message class, with a repeated ``results`` field of
+    #: messages of ``serializer.Meta.proto_class`` and a repeated
+    #: ``missing`` field of lookup values, like the
+    #: ``<Model>BatchRetrieveResponse`` of ``generateproto --bulk``.
+    batch_retrieve_response_class = None
+    #: The maximum number of lookup values of a request.
+    batch_retrieve_max_size = 1000
+
+    def BatchRetrieve(self, request, context):
+        """
+        Retrieve model instances.
+
+        The request have to include a repeated field corresponding to
+        ``lookup_request_field``.  The instances are fetched with one
+        ``in_bulk()`` query, so ``lookup_field`` must be unique.  This returns
+        a message of ``batch_retrieve_response_class`` with the messages of
+        the instances in the order of the request, and the lookup values
+        matching no instance, or invalid for ``lookup_field``, in ``missing``.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        model = queryset.model
+        lookup_field, lookup_request_field = self.get_lookup_fields(model)
+        field = model._meta.get_field(lookup_field)
+        requested = getattr(request, lookup_request_field)
+        if len(requested) > self.batch_retrieve_max_size:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, (
+                'At most %d %s values can be retrieved at a time.'
+                % (self.batch_retrieve_max_size, lookup_request_field)
+            ))
+        lookup_values = [_to_lookup_value(field, value) for value in requested]
+        instances = queryset.in_bulk(
+            {value for value in lookup_values if value is not _INVALID},
+            field_name=lookup_field,
+        )
+        found, missing = [], []
+        for value, lookup_value in zip(requested, lookup_values):
+            instance = instances.get(lookup_value)
+            if instance is None:
+                missing.append(value)
+            else:
+                found.append(instance)
+        serializer = self.get_serializer(found, many=True)
+        return self.get_batch_retrieve_response(serializer.message, missing)
+
+    def get_batch_retrieve_response(self, messages, missing):
+        """Return the ``BatchRetrieve()`` response."""
+        assert self.batch_retrieve_response_class is not None, (
+            "'%s' should include a `batch_retrieve_response_class` attribute."
+            % self.__class__.__name__
+        )
+        return self.batch_retrieve_response_class(results=messages, missing=missing)
+
+
+class BulkCreateModelMixin:
+    #: The response message class, with ``created`` and ``failed`` counts and
+    #: a repeated ``errors`` field of messages with ``index`` and ``details``
+    #: fields, like the ``<Model>BulkCreateResponse`` of ``generateproto
+    #: --bulk``.
+    bulk_create_response_class = None
+    #: The number of messages validated and written at a time.
+    bulk_create_batch_size = 500
+
+    def BulkCreate(self, request_iterator, context):
+        """
+        Create model instances from a stream of proto messages of
+        ``serializer.Meta.proto_class``.
+
+        Each message is validated by the serializer, the valid ones are
+        written ``bulk_create_batch_size`` at a time by
+        ``perform_bulk_create()``, each batch in a transaction.  This returns
+        a message of ``bulk_create_response_class`` with the number of
+        created instances, and the errors of the other messages by their
+        index in the stream.
+
+        .. note::
+
+            This is a client streaming RPC.
+        """
+        created, errors = 0, []
+        for batch in _batches(request_iterator, self.bulk_create_batch_size):
+            serializers = []
+            for index, message in batch:
+                serializer = self.get_serializer(message=message)
+                if serializer.is_valid():
+                    serializers.append((index, serializer))
+                else:
+                    errors.append((index, json.dumps(serializer.errors)))
+            created += _save_batch(self, self.perform_bulk_create, serializers, errors)
+        return self.get_bulk_create_response(created, errors)
+
+    def perform_bulk_create(self, serializers):
+        """
+        Save the instances of a batch of validated serializers with one
+        ``bulk_create()``, and one more per many-to-many field set.  The
+        many-to-many relations need a database returning the primary keys
+        of the inserted rows.
+        """
+        model = self.get_queryset().model
+        using = router.db_for_write(model)
+        instances, related = [], []
+        for serializer in serializers:
+            data = dict(serializer.validated_data)
+            many_to_many = {
+                field.name: data.pop(field.name)
+                for field in model._meta.many_to_many if field.name in data
+            }
+            serializer.instance = model(**data)
+            instances.append(serializer.instance)
+            related.append(many_to_many)
+        model._default_manager.using(using).bulk_create(instances)
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+            rows = [
+                through(**{
+                    field.m2m_field_name(): instance,
+                    field.m2m_reverse_field_name(): target,
+                })
+                for instance, many_to_many in zip(instances, related)
+                for target in many_to_many.get(field.name, ())
+            ]
+            if rows:
+                through._default_manager.using(using).bulk_create(rows)
+
+    def get_bulk_create_response(self, created, errors):
+        """
+        Return the ``BulkCreate()`` response, for ``errors`` given as
+        ``(index, details)`` pairs.
+        """
+        return _get_bulk_response(
+            self, 'bulk_create_response_class', errors, created=created,
+        )
+
+
+class BulkUpdateModelMixin:
+    #: The response message class, with ``updated`` and ``failed`` counts and
+    #: ``errors`` like ``bulk_create_response_class``.
+    bulk_update_response_class = None
+    #: The number of messages fetched, validated and written at a time.
+    bulk_update_batch_size = 500
+
+    def BulkUpdate(self, request_iterator, context):
+        """
+        Update model instances from a stream of proto messages of
+        ``serializer.Meta.proto_class``.
+
+        The instances of ``bulk_update_batch_size`` messages are fetched
+        with one ``in_bulk()`` query on their ``lookup_request_field``, each
+        message is validated by the serializer, and the valid ones are
+        written by ``perform_bulk_update()`` in a transaction.  This returns
+        a message of ``bulk_update_response_class`` with the number of
+        updated instances, and the errors of the other messages by their
+        index in the stream.
+
+        .. note::
+
+            This is a client streaming RPC.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        model = queryset.model
+        writable = {
+            field.source for field in self.get_serializer().fields.values()
+            if not field.read_only
+        }
+        queryset = queryset.prefetch_related(*[
+            field.name for field in model._meta.many_to_many if field.name in writable
+        ])
+        updated, errors = 0, []
+        for batch in _batches(request_iterator, self.bulk_update_batch_size):
+            lookup_field, lookup_request_field = self.get_lookup_fields(model, batch[0][1])
+            lookup_values = _get_lookup_values(model, lookup_field, lookup_request_field, batch)
+            instances = queryset.in_bulk(set(lookup_values.values()), field_name=lookup_field)
+            serializers = []
+            for index, message in batch:
+                instance = instances.get(lookup_values.get(index, _INVALID))
+                if instance is None:
+                    errors.append((index, '%s: %s not found!' % (
+                        model.__name__, getattr(message, lookup_request_field),
+                    )))
+                    continue
+                serializer = self.get_serializer(instance, message=message)
+                if serializer.is_valid():
+                    serializers.append((index, serializer))
+                else:
+                    errors.append((index, json.dumps(serializer.errors)))
+            updated += _save_batch(self, self.perform_bulk_update, serializers, errors)
+        return self.get_bulk_update_response(updated, errors)
+
+    def perform_bulk_update(self, serializers):
+        """
+        Save the instances of a batch of validated serializers with one
+        ``bulk_update()`` of the fields that changed, and ``set()`` the
+        many-to-many relations that changed.  When the model has
+        ``pre_save`` or ``post_save`` receivers, the instances are saved one
+        by one instead, so that the signals are sent.
+        """
+        model = self.get_queryset().model
+        instances, update_fields = [], set()
+        for serializer in serializers:
+            instance = serializer.instance
+            changed = _apply_changes(instance, serializer.validated_data)
+            if changed:
+                instances.append(instance)
+                update_fields.update(changed)
+        if not update_fields:
+            return
+        if _has_receivers(model, signals.pre_save, signals.post_save):
+            for instance in instances:
+                instance.save(update_fields=update_fields)
+        else:
+            using = router.db_for_write(model)
+            model._default_manager.using(using).bulk_update(instances, update_fields)
+
+    def get_bulk_update_response(self, updated, errors):
+        """Return the ``BulkUpdate()`` response."""
+        return _get_bulk_response(
+            self, 'bulk_update_response_class', errors, updated=updated,
+        )
+
+
+class BulkDestroyModelMixin:
+    #: The response message class, with ``deleted`` and ``failed`` counts and
+    #: ``errors`` like ``bulk_create_response_class``.
+    bulk_destroy_response_class = None
+    #: The number of messages deleted at a time.
+    bulk_destroy_batch_size = 500
+
+    def BulkDestroy(self, request_iterator, context):
+        """
+        Destroy model instances from a stream of messages including a field
+        corresponding to ``lookup_request_field``.
+
+        The instances of ``bulk_destroy_batch_size`` messages are deleted
+        at a time by ``perform_bulk_destroy()``, each batch in a
+        transaction.  This returns a message of
+        ``bulk_destroy_response_class`` with the number of deleted
+        instances, and the errors of the messages matching no instance by
+        their index in the stream.
+
+        .. note::
+
+            This is a client streaming RPC.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        model = queryset.model
+        deleted, errors = 0, []
+        for batch in _batches(request_iterator, self.bulk_destroy_batch_size):
+            lookup_field, lookup_request_field = self.get_lookup_fields(model, batch[0][1])
+            lookup_values = _get_lookup_values(model, lookup_field, lookup_request_field, batch)
+            existing = set(queryset.filter(
+                **{lookup_field + '__in': set(lookup_values.values())}
+            ).values_list(lookup_field, flat=True))
+            found = []
+            for index, message in batch:
+                lookup_value = lookup_values.get(index, _INVALID)
+                if lookup_value in existing:
+                    found.append((index, lookup_value))
+                else:
+                    errors.append((index, '%s: %s not found!' % (
+                        model.__name__, getattr(message, lookup_request_field),
+                    )))
+
+            def destroy(values):
+                self.perform_bulk_destroy(queryset.filter(**{lookup_field + '__in': values}))
+
+            deleted += _save_batch(self, destroy, found, errors)
+        return self.get_bulk_destroy_response(deleted, errors)
+
+    def perform_bulk_destroy(self, queryset):
+        """
+        Delete the instances of ``queryset``.  Django sends the deletion
+        signals and cascades as usual, rows are only fetched before the
+        ``DELETE ... WHERE pk IN`` query when there are receivers or
+        relations to collect.
+        """
+        queryset.delete()
+
+    def get_bulk_destroy_response(self, deleted, errors):
+        """Return the ``BulkDestroy()`` response."""
+        return _get_bulk_response(
+            self, 'bulk_destroy_response_class', errors, deleted=deleted,
+        )
+
+
+class PaginatedListMixin:
+    """
+    Base class of the paginated ``List()`` mixins, returning a message of
+    ``list_response_class`` holding the messages of a page of the queryset
+    in its repeated message field.
+    """
+    #: The response message class, like ``ListPostsResponse``.
+    list_response_class = None
+    #: The number of rows of a page when the request does not set it.
+    page_size = pagination.DEFAULT_PAGE_SIZE
+    #: The default ordering, as an ``order_by`` string.  The primary key is
+    #: always appended to make the order total.
+    ordering = ''
+
+    def get_ordering(self, request, model):
+        """
+        Return the ``(lookup path, descending)`` pairs ordering the rows,
+        from the ``order_by`` of the request, limited to
+        ``get_ordering_fields()``, or ``ordering``.
+        """
+        order_by = getattr(request, 'order_by', '')
+        if order_by:
+            ordering = filters.parse_order_by(order_by)
+            filters.check_fields(
+                [path for path, descending in ordering], self.get_ordering_fields()
+            )
+            if self.require_index:
+                filters.check_ordering_index(model, ordering)
+        else:
+            ordering = filters.parse_order_by(self.ordering)
+        return pagination.get_unique_ordering(model, ordering)
+
+    def get_list_response(self, messages, **kwargs):
+        assert self.list_response_class is not None, (
+            "'%s' should include a `list_response_class` attribute."
+            % self.__class__.__name__
+        )
+        repeated_field = next(
+            field.name for field in self.list_response_class.DESCRIPTOR.fields
+            if field.message_type is not None and is_repeated(field)
+        )
+        return self.list_response_class(**{repeated_field: messages}, **kwargs)
+
+
+class CursorPaginatedListMixin(PaginatedListMixin):
+    """
+    ``List()`` returning a page of a queryset, for requests with
+    ``page_size``, ``page_token`` and ``order_by`` fields, and responses with
+    a repeated field of messages and a ``next_page_token`` field.  Pages are
+    fetched with keyset seeks on the ordering, never with ``OFFSET``.
+    """
+    #: The maximum number of rows of a page.
+    max_page_size = pagination.MAX_PAGE_SIZE
+
+    def List(self, request, context):
+        """
+        List a page of a queryset.  This returns a message of
+        ``list_response_class`` with the messages of the page, and the
+        ``next_page_token`` to send to get the next page, empty on the last
+        page.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            page_size = pagination.get_page_size(
+                request.page_size, self.page_size, self.max_page_size
+            )
+            ordering = self.get_ordering(request, queryset.model)
+            page, next_page_token = pagination.paginate_queryset(
+                queryset, ordering, page_size,
+                page_token=request.page_token,
+                salt=self.get_page_token_salt(queryset.model),
+            )
+        except (pagination.InvalidPage, filters.InvalidFilter) as exc:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+        serializer = self.get_serializer(page, many=True)
+        return self.get_list_response(
+            serializer.message, next_page_token=next_page_token,
+        )
+
+    def get_page_token_salt(self, model):
+        """Page tokens are only valid for the same model."""
+        return 'django_grpc_framework.pagination.%s' % model._meta.label_lower
+
+
+class PageNumberPaginatedListMixin(PaginatedListMixin):
+    """
+    ``List()`` returning a numbered page of a queryset, for requests with
+    ``page`` and ``order_by`` fields, and responses with a repeated field of
+    messages and ``count``, ``next_page`` and ``prev_page`` fields.
+
+    Counting the rows of large tables is expensive, counts are cached for
+    ``count_cache_timeout`` seconds per query.  With
+    ``count_estimate_threshold`` set, counts above it are the estimate of
+    the query planner, on PostgreSQL.
+    """
+    #: Seconds the count of the rows of a query is cached, ``None`` to count
+    #: them on every request.
+    count_cache_timeout = 60
+    #: The alias of the cache the counts are stored in.
+    count_cache_alias = 'default'
+    #: Use the estimate of the query planner when it is above this number of
+    #: rows, instead of counting them.
+    count_estimate_threshold = None
+
+    def List(self, request, context):
+        """
+        List a page of a queryset.  This returns a message of
+        ``list_response_class`` with the messages of the page ``page`` (the
+        first one when unset), the ``count`` of rows and the numbers of the
+        next and previous pages, ``0`` when there are none.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            page_queryset, page = self.get_page_queryset(request, queryset)
+        except (pagination.InvalidPage, filters.InvalidFilter) as exc:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+        instances = list(page_queryset)
+        if instances and len(instances) < self.page_size:
+            # The last page tells the count.
+            count = (page - 1) * self.page_size + len(instances)
+        else:
+            count = self.get_count(queryset)
+        serializer = self.get_serializer(instances, many=True)
+        return self.get_page_response(serializer.message, page, count)
+
+    def get_page_queryset(self, request, queryset):
+        """Return the queryset of the rows of the page, and its number."""
+        page = pagination.get_page_number(request.page)
+        ordering = self.get_ordering(request, queryset.model)
+        offset = (page - 1) * self.page_size
+        queryset = queryset.order_by(
+            *pagination.order_by_expressions(queryset.model, ordering)
+        )
+        return queryset[offset:offset + self.page_size], page
+
+    def get_count(self, queryset):
+        return pagination.get_count(
+            queryset, cache_timeout=self.count_cache_timeout,
+            cache_alias=self.count_cache_alias,
+            estimate_threshold=self.count_estimate_threshold,
+        )
+
+    def get_page_response(self, messages, page, count):
+        has_next = page * self.page_size < count
+        return self.get_list_response(
+            messages, count=count,
+            next_page=page + 1 if has_next else 0,
+            prev_page=page - 1,
+        )
+
+
+class AsyncPageNumberPaginatedListMixin(PageNumberPaginatedListMixin):
+    """
+    Async version of ``PageNumberPaginatedListMixin``, the count and the
+    page are queried concurrently.
+    """
+    async def List(self, request, context):
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            page_queryset, page = self.get_page_queryset(request, queryset)
+        except (pagination.InvalidPage, filters.InvalidFilter) as exc:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+
+        async def fetch_page():
+            return [instance async for instance in page_queryset]
+
+        count, instances = await asyncio.gather(
+            self.aget_count(queryset), fetch_page(),
+        )
+        serializer = self.get_serializer(instances, many=True)
+        return self.get_page_response(await serializer.amessage(), page, count)
+
+    async def aget_count(self, queryset):
+        # Counting outside of the thread running the ORM calls of the event
+        # loop, so that it does not wait for the page query.
+        return await sync_to_async(self.get_count, thread_sensitive=False)(queryset)
+
+
+def _batches(request_iterator, size):
+    """Yield lists of at most ``size`` ``(index, message)`` pairs."""
+    iterator = enumerate(request_iterator)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _save_batch(service, save, batch, errors):
+    """
+    Call ``save`` with the items of the ``(index, item)`` pairs of ``batch``
+    in a transaction, returning the number of items saved.  When the
+    database rejects the batch, an error is added for each of its indexes.
+    """
+    if not batch:
+        return 0
+    model = service.get_queryset().model
+    try:
+        with transaction.atomic(using=router.db_for_write(model)):
+            save([item for index, item in batch])
+    except DatabaseError as exc:
+        errors.extend((index, str(exc)) for index, item in batch)
+        return 0
+    return len(batch)
+
+
+def _get_bulk_response(service, response_class_attr, errors, **counts):
+    response_class = getattr(service, response_class_attr)
+    assert response_class is not None, (
+        "'%s' should include a `%s` attribute."
+        % (service.__class__.__name__, response_class_attr)
+    )
+    response = response_class(failed=len(errors), **counts)
+    for index, details in sorted(errors):
+        response.errors.add(index=index, details=details)
+    return response
+
+
+def _get_lookup_values(model, lookup_field, lookup_request_field, batch):
+    """
+    Return the values of ``lookup_field`` of the messages of ``batch`` by
+    their index, converted to the Python type of the model field.  The
+    messages whose value is invalid for the field are left out.
+    """
+    field = model._meta.get_field(lookup_field)
+    lookup_values = {}
+    for index, message in batch:
+        value = _to_lookup_value(field, getattr(message, lookup_request_field))
+        if value is not _INVALID:
+            lookup_values[index] = value
+    return lookup_values
+
+
+#: The lookup value of message values invalid for the model field, which
+#: match no instance.
+_INVALID = object()
+
+
+def _to_lookup_value(field, value):
+    """
+    Return the message ``value`` converted to the Python type of the model
+    ``field``, so that it matches the keys of ``in_bulk()``, or ``_INVALID``
+    when it cannot be, like a malformed UUID.
+    """
+    try:
+        return field.to_python(value)
+    except (TypeError, ValueError, ValidationError):
+        return _INVALID
+
+
+def _apply_changes(instance, validated_data):
+    """
+    Set the ``validated_data`` that differs on ``instance``, returning the
+    names of the changed fields.  Changed many-to-many relations are
+    ``set()`` directly.
+    """
+    opts = instance._meta
+    changed = []
+    for attr, value in validated_data.items():
+        try:
+            field = opts.get_field(attr)
+        except FieldDoesNotExist:
+            setattr(instance, attr, value)
+            continue
+        if field.many_to_many:
+            if set(getattr(instance, attr).all()) != set(value):
+                getattr(instance, attr).set(value)
+            continue
+        if field.is_relation:
+            current = getattr(instance, field.attname)
+            new = None if value is None else getattr(value, field.target_field.attname)
+        else:
+            current, new = getattr(instance, attr), value
+        if current != new:
+            setattr(instance, attr, value)
+            changed.append(field.name)
+    return changed
+
+
+def _has_receivers(model, *model_signals):
+    return any(signal.has_listeners(model) for signal in model_signals)
+
+
+class AsyncCreateModelMixin:
+    async def Create(self, request, context):
+        """
+        Async version of ``CreateModelMixin.Create()``.
+        """
+        serializer = self.get_serializer(message=request)
+        await serializer.ais_valid(raise_exception=True)
+        await self.perform_create(serializer)
+        return await serializer.amessage()
+
+    async def perform_create(self, serializer):
+        """Save a new object instance."""
+        await serializer.asave()
+
+
+class AsyncListModelMixin(ListModelMixin):
+    async def List(self, request, context):
+        """
+        Async version of ``ListModelMixin.List()``.  The queryset is iterated
+        in chunks of ``list_chunk_size`` rows, and the messages of each chunk
+        are sent before the next one is fetched.  The ``grpc.aio`` server
+        cancels the handler when the client is gone, which stops the
+        iteration.
+
+        .. note::
+
+            This is a server streaming RPC.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        chunks = _aiter_chunks(queryset, self.get_list_chunk_size())
+        try:
+            async for chunk in chunks:
+                for message in await self.get_serializer(chunk, many=True).amessage():
+                    yield message
+        finally:
+            await chunks.aclose()
+
+
+async def _aiter_chunks(queryset, chunk_size):
+    """Iterate over lists of at most ``chunk_size`` instances of ``queryset``."""
+    if queryset._prefetch_related_lookups and django.VERSION < (5, 0):
+        # aiterator() cannot prefetch before Django 5.0, fetch the chunks of
+        # iterator() from a thread instead.
+        iterator = queryset.iterator(chunk_size=chunk_size)
+        next_chunk = sync_to_async(lambda: list(islice(iterator, chunk_size)))
+        try:
+            while True:
+                chunk = await next_chunk()
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            await sync_to_async(iterator.close)()
+        return
+    chunk = []
+    async for instance in queryset.aiterator(chunk_size=chunk_size):
+        chunk.append(instance)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class AsyncRetrieveModelMixin:
+    async def Retrieve(self, request, context):
+        """
+        Async version of ``RetrieveModelMixin.Retrieve()``.
+        """
+        if self.cache_retrieve:
+            cache = caching.RetrieveCache(self)
+            message = await cache.aget()
+            if message is None:
+                message = await self.get_serializer(await self.aget_object()).amessage()
+                await cache.aset(message)
+            return message
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return await serializer.amessage()
+
+
+class AsyncUpdateModelMixin:
+    async def Update(self, request, context):
+        """
+        Async version of ``UpdateModelMixin.Update()``.
+        """
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance, message=request)
+        await serializer.ais_valid(raise_exception=True)
+        await self.perform_update(serializer)
+
+        if getattr(instance, '_prefetched_objects_cache', None):
+            # If 'prefetch_related' has been applied to a queryset, we need to
+            # forcibly invalidate the prefetch cache on the instance.
+            instance._prefetched_objects_cache = {}
+
+        return await serializer.amessage()
+
+    async def perform_update(self, serializer):
+        """Save an existing object instance."""
+        await serializer.asave()
+
+
+class AsyncPartialUpdateModelMixin:
+    async def PartialUpdate(self, request, context):
+        """
+        Async version of ``PartialUpdateModelMixin.PartialUpdate()``.
+        """
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance, message=request, partial=True)
+        await serializer.ais_valid(raise_exception=True)
+        await self.perform_partial_update(serializer)
+
+        if getattr(instance, '_prefetched_objects_cache', None):
+            # If 'prefetch_related' has been applied to a queryset, we need to
+            # forcibly invalidate the prefetch cache on the instance.
+            instance._prefetched_objects_cache = {}
+
+        return await serializer.amessage()
+
+    async def perform_partial_update(self, serializer):
+        """Save an existing object instance."""
+        await serializer.asave()
+
+
+class AsyncDestroyModelMixin:
+    async def Destroy(self, request, context):
+        """
+        Async version of ``DestroyModelMixin.Destroy()``.
+        """
+        instance = await self.aget_object()
+        await self.perform_destroy(instance)
+        return empty_pb2.Empty()
+
+    async def perform_destroy(self, instance):
+        """Delete an object instance."""
+        await instance.adelete()
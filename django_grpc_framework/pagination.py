@@ -0,0 +1,239 @@
+"""
+Pagination of querysets for ``List`` methods.
+
+Keyset (cursor) pagination follows the ``page_size`` / ``page_token`` /
+``order_by`` request convention, ``order_by`` being parsed by
+``filters.parse_order_by()``.  Pages are fetched with ``WHERE (key) > (last
+key)`` seeks on the ordering instead of ``OFFSET``, so a deep page costs the
+same as the first one.  The ``page_token`` is an opaque
+signed value holding the ordering and the key of the last row of the
+previous page.
+
+Page number pagination follows the ``page`` / ``order_by`` convention, with
+the count of rows cached, or estimated by the query planner.
+"""
+import datetime
+from functools import reduce
+import json
+import operator
+
+from django.core import signing
+from django.core.cache import caches
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F, Q
+
+from django_grpc_framework.utils.compat import md5
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+
+class InvalidPage(Exception):
+    """Raised for invalid ``page_size``, ``page`` or ``page_token``."""
+
+
+class _TokenEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # Keep the microseconds that DjangoJSONEncoder drops, the key must be
+        # exact.
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class _TokenSerializer(signing.JSONSerializer):
+    def dumps(self, obj):
+        return _TokenEncoder(separators=(',', ':')).encode(obj).encode('latin-1')
+
+
+def get_page_size(page_size, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """
+    Return the number of rows of a page: ``default`` when ``page_size`` is
+    unset, at most ``maximum``.
+    """
+    if page_size < 0:
+        raise InvalidPage('page_size must not be negative.')
+    if not page_size:
+        return default
+    return min(page_size, maximum)
+
+
+def get_page_number(page):
+    """Return the number of the requested page, the first one when unset."""
+    if page < 0:
+        raise InvalidPage('page must not be negative.')
+    return page or 1
+
+
+def get_unique_ordering(model, ordering):
+    """
+    Return ``ordering`` with the primary key appended, unless it is already
+    part of it, so that it gives a total order of the rows.
+    """
+    pk_name = model._meta.pk.name
+    if any(path in (pk_name, 'pk') for path, descending in ordering):
+        return list(ordering)
+    return [*ordering, (pk_name, False)]
+
+
+def encode_token(ordering, values, salt):
+    """Return the signed ``page_token`` for the rows after ``values``."""
+    return signing.dumps(
+        {'o': ordering, 'v': values}, salt=salt, serializer=_TokenSerializer,
+    )
+
+
+def decode_token(token, ordering, salt):
+    """
+    Return the key values of the last row of the previous page held by
+    ``token``, which must have been issued for the same ``ordering``.
+    """
+    try:
+        data = signing.loads(token, salt=salt)
+    except signing.BadSignature:
+        raise InvalidPage('Invalid page_token.')
+    ordering = [[path, descending] for path, descending in ordering]
+    if data.get('o') != ordering or len(data.get('v', ())) != len(ordering):
+        raise InvalidPage(
+            'page_token does not match the other parameters of the request.'
+        )
+    return data['v']
+
+
+def keyset_filter(model, ordering, values):
+    """
+    Return the ``Q`` object selecting the rows strictly after the row with
+    the key ``values`` in ``ordering``.  ``NULL`` sorts after every other
+    value, see ``order_by_expressions()``.
+    """
+    conditions = []
+    equal = Q()
+    for (path, descending), value in zip(ordering, values):
+        nullable = _is_nullable(model, path)
+        if value is None:
+            after = Q(**{path + '__isnull': False}) if descending else None
+        elif descending:
+            after = Q(**{path + '__lt': value})
+        else:
+            after = Q(**{path + '__gt': value})
+            if nullable:
+                after |= Q(**{path + '__isnull': True})
+        if after is not None:
+            conditions.append(equal & after)
+        equal &= Q(**{path + '__isnull': True}) if value is None else Q(**{path: value})
+    condition = reduce(operator.or_, conditions, Q(pk__in=[]))
+    first_path, first_descending = ordering[0]
+    first_value = values[0]
+    if first_value is not None and not _is_nullable(model, first_path):
+        # The bound on the leading key lets the database seek an index.
+        lookup = '__lte' if first_descending else '__gte'
+        condition &= Q(**{first_path + lookup: first_value})
+    return condition
+
+
+def order_by_expressions(model, ordering):
+    """
+    Return the ``order_by()`` expressions of ``ordering``, sorting ``NULL``
+    after every other value on all databases.  The ``NULL`` placement is
+    only given for nullable fields, it can keep some databases from using an
+    index.
+    """
+    expressions = []
+    for path, descending in ordering:
+        if not _is_nullable(model, path):
+            expressions.append(F(path).desc() if descending else F(path).asc())
+        elif descending:
+            expressions.append(F(path).desc(nulls_first=True))
+        else:
+            expressions.append(F(path).asc(nulls_last=True))
+    return expressions
+
+
+def paginate_queryset(queryset, ordering, page_size, page_token='', salt=''):
+    """
+    Return the ``(rows, next_page_token)`` of the page of ``queryset``
+    after ``page_token``.  ``ordering`` must give a total order of the rows,
+    see ``get_unique_ordering()``.  ``next_page_token`` is empty on the last
+    page.
+    """
+    model = queryset.model
+    if page_token:
+        values = decode_token(page_token, ordering, salt)
+        queryset = queryset.filter(keyset_filter(model, ordering, values))
+    keys = {'_cursor_%d' % index: F(path) for index, (path, _) in enumerate(ordering)}
+    queryset = queryset.annotate(**keys).order_by(*order_by_expressions(model, ordering))
+    rows = list(queryset[:page_size + 1])
+    if len(rows) <= page_size:
+        return rows, ''
+    rows = rows[:page_size]
+    values = [getattr(rows[-1], key) for key in keys]
+    return rows, encode_token(ordering, values, salt)
+
+
+def _is_nullable(model, path):
+    """Return whether following ``path`` from ``model`` may give ``NULL``."""
+    nullable = False
+    for name in path.split('__'):
+        if name == 'pk':
+            return nullable
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return True
+        nullable = nullable or field.null or not field.concrete or field.many_to_many
+        if field.related_model is not None:
+            model = field.related_model
+    return nullable
+
+
+def get_count(queryset, cache_timeout=None, cache_alias='default',
+              estimate_threshold=None):
+    """
+    Return the number of rows of ``queryset``.  With ``cache_timeout``, the
+    count is cached for that many seconds under a fingerprint of the SQL
+    query.  With ``estimate_threshold``, the estimate of the query planner
+    is returned when it is above the threshold, on PostgreSQL.
+    """
+    queryset = queryset.order_by()
+    if queryset.query.is_empty():
+        return 0
+    if cache_timeout is None:
+        return _count(queryset, estimate_threshold)
+    cache = caches[cache_alias]
+    key = get_count_cache_key(queryset)
+    count = cache.get(key)
+    if count is None:
+        count = _count(queryset, estimate_threshold)
+        cache.set(key, count, cache_timeout)
+    return count
+
+
+def get_count_cache_key(queryset):
+    """Return the cache key of the count of ``queryset``."""
+    sql, params = queryset.query.sql_with_params()
+    fingerprint = md5(
+        repr((queryset.db, sql, params)).encode(), usedforsecurity=False,
+    ).hexdigest()
+    return 'django_grpc_framework.count.%s' % fingerprint
+
+
+def get_count_estimate(queryset):
+    """
+    Return the number of rows of ``queryset`` estimated by the query planner,
+    or ``None`` when the database backend does not support it.
+    """
+    if connections[queryset.db].vendor != 'postgresql':
+        return None
+    plan = json.loads(queryset.explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _count(queryset, estimate_threshold):
+    if estimate_threshold is not None:
+        estimate = get_count_estimate(queryset)
+        if estimate is not None and estimate > estimate_threshold:
+            return estimate
+    return queryset.count()
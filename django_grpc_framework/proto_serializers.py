@@ -1,12 +1,25 @@
+import copy
+from itertools import islice
+import math
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from google.protobuf.descriptor import FieldDescriptor
+from rest_framework import fields as drf_fields
+from rest_framework.fields import SkipField
+from rest_framework.relations import (
+    ManyRelatedField, PKOnlyObject, PrimaryKeyRelatedField,
+)
 from rest_framework.serializers import (
     BaseSerializer, Serializer, ListSerializer, ModelSerializer,
-    LIST_SERIALIZER_KWARGS,
+    LIST_SERIALIZER_KWARGS, raise_errors_on_nested_writes,
 )
 from rest_framework.settings import api_settings
 from rest_framework.exceptions import ValidationError
-from django_grpc_framework.protobuf.json_format import (
-    message_to_dict, parse_dict
-)
+from rest_framework.utils import model_meta
+from django_grpc_framework.protobuf.json_format import parse_dict
+from django_grpc_framework.protobuf.native import is_repeated, message_to_native
 
 
 class BaseProtoSerializer(BaseSerializer):
@@ -31,6 +44,55 @@ class BaseProtoSerializer(BaseSerializer):
             self._message = self.data_to_message(self.data)
         return self._message
 
+    async def amessage(self):
+        """
+        Async version of ``message``.  Serializing may need to query the
+        database, so this runs in a thread.
+        """
+        if not hasattr(self, '_message'):
+            await sync_to_async(lambda: self.message)()
+        return self._message
+
+    async def ais_valid(self, raise_exception=False):
+        """
+        Async version of ``is_valid()``.  Validators may need to query the
+        database, so this runs in a thread.
+        """
+        return await sync_to_async(self.is_valid)(raise_exception=raise_exception)
+
+    async def asave(self, **kwargs):
+        """
+        Async version of ``save()``, calling ``acreate()`` or ``aupdate()``.
+        """
+        assert hasattr(self, '_errors'), (
+            'You must call `.is_valid()` before calling `.save()`.'
+        )
+        assert not self.errors, (
+            'You cannot call `.save()` on a serializer with invalid data.'
+        )
+        validated_data = {**self.validated_data, **kwargs}
+        if self.instance is not None:
+            self.instance = await self.aupdate(self.instance, validated_data)
+            assert self.instance is not None, (
+                '`aupdate()` did not return an object instance.'
+            )
+        else:
+            self.instance = await self.acreate(validated_data)
+            assert self.instance is not None, (
+                '`acreate()` did not return an object instance.'
+            )
+        return self.instance
+
+    def instance_to_message(self, instance):
+        """Protobuf message <- Object instance."""
+        return self.data_to_message(self.to_representation(instance))
+
+    async def acreate(self, validated_data):
+        return await sync_to_async(self.create)(validated_data)
+
+    async def aupdate(self, instance, validated_data):
+        return await sync_to_async(self.update)(instance, validated_data)
+
     @classmethod
     def many_init(cls, *args, **kwargs):
         allow_empty = kwargs.pop('allow_empty', None)
@@ -51,10 +113,17 @@ class BaseProtoSerializer(BaseSerializer):
 
 
 class ProtoSerializer(BaseProtoSerializer, Serializer):
+    def get_fields(self):
+        fields = super().get_fields()
+        meta = getattr(self, 'Meta', None)
+        if getattr(meta, 'trust_proto_types', False):
+            trust_proto_types(fields, meta.proto_class.DESCRIPTOR)
+        return fields
+
     def message_to_data(self, message):
         """Protobuf message -> Dict of python primitive datatypes.
         """
-        return message_to_dict(message)
+        return message_to_native(message)
 
     def data_to_message(self, data):
         """Protobuf message <- Dict of python primitive datatypes."""
@@ -71,6 +140,74 @@ class ProtoSerializer(BaseProtoSerializer, Serializer):
         return parse_dict(data, self.Meta.proto_class())
 
 
+_INTEGER_TYPES = {
+    FieldDescriptor.TYPE_INT32, FieldDescriptor.TYPE_INT64,
+    FieldDescriptor.TYPE_UINT32, FieldDescriptor.TYPE_UINT64,
+    FieldDescriptor.TYPE_SINT32, FieldDescriptor.TYPE_SINT64,
+    FieldDescriptor.TYPE_FIXED32, FieldDescriptor.TYPE_FIXED64,
+    FieldDescriptor.TYPE_SFIXED32, FieldDescriptor.TYPE_SFIXED64,
+}
+_FLOAT_TYPES = {FieldDescriptor.TYPE_FLOAT, FieldDescriptor.TYPE_DOUBLE}
+
+
+def trust_proto_types(fields, descriptor):
+    """
+    Skip the coercion of values that protobuf already typed.  Integer, float
+    and boolean serializer fields mapped to a proto field of the same type
+    accept values of the exact python type as they are; validators still
+    run.  Fields overriding ``to_internal_value()`` are left alone.
+    """
+    for field_name, field in fields.items():
+        proto_field = descriptor.fields_by_name.get(field_name)
+        if proto_field is None or is_repeated(proto_field):
+            continue
+        field_class = type(field)
+        if (proto_field.type in _INTEGER_TYPES and
+                field_class.to_internal_value is drf_fields.IntegerField.to_internal_value):
+            field.__class__ = _trusted_class(field_class, int)
+        elif (proto_field.type in _FLOAT_TYPES and
+                field_class.to_internal_value is drf_fields.FloatField.to_internal_value):
+            field.__class__ = _trusted_class(field_class, float, math.isfinite)
+        elif (proto_field.type == FieldDescriptor.TYPE_BOOL and
+                field_class.to_internal_value is drf_fields.BooleanField.to_internal_value):
+            field.__class__ = _trusted_class(field_class, bool)
+
+
+_trusted_classes = {}
+_trusted_bases = {}
+
+
+def _trusted_class(field_class, python_type, check=None):
+    """
+    Return a subclass of ``field_class`` accepting values of ``python_type``
+    as they are.  Swapping the class rather than wrapping the bound method
+    keeps the fields copyable.
+    """
+    try:
+        return _trusted_classes[field_class, python_type]
+    except KeyError:
+        pass
+    coerce = field_class.to_internal_value
+
+    def to_internal_value(self, data):
+        if type(data) is python_type and (check is None or check(data)):
+            return data
+        return coerce(self, data)
+
+    trusted_class = type(field_class.__name__, (field_class,), {
+        '__module__': field_class.__module__,
+        'to_internal_value': to_internal_value,
+    })
+    _trusted_bases[trusted_class] = field_class
+    _trusted_classes[field_class, python_type] = trusted_class
+    return trusted_class
+
+
+#: Rows fetched from the database at a time when iterating over a queryset,
+#: the default of ``QuerySet.iterator()``.
+DEFAULT_CHUNK_SIZE = 2000
+
+
 class ListProtoSerializer(BaseProtoSerializer, ListSerializer):
     def message_to_data(self, message):
         """
@@ -95,6 +232,328 @@ class ListProtoSerializer(BaseProtoSerializer, ListSerializer):
             self.child.data_to_message(item) for item in data
         ]
 
+    @property
+    def message(self):
+        if not hasattr(self, '_message'):
+            if self.instance is not None and not getattr(self, '_errors', None):
+                iterable = self.instance
+                if isinstance(iterable, models.manager.BaseManager):
+                    iterable = iterable.all()
+                self._message = [
+                    self.child.instance_to_message(item) for item in iterable
+                ]
+            else:
+                self._message = self.data_to_message(self.data)
+        return self._message
+
+    def iter_message(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Iterate over the messages of the instances, building them one at a
+        time.  An unevaluated queryset is read with ``iterator()`` in chunks
+        of ``chunk_size`` rows, so the whole result set is never held in
+        memory.
+        """
+        for chunk in self.iter_message_chunks(chunk_size):
+            yield from chunk
+
+    def iter_message_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Iterate over lists of at most ``chunk_size`` messages of the
+        instances, see ``iter_message()``.  Closing the generator closes the
+        database cursor of the queryset.
+        """
+        assert self.instance is not None, (
+            'You must pass the instances to the serializer to iterate over '
+            'their messages.'
+        )
+        iterable = self.instance
+        if isinstance(iterable, models.manager.BaseManager):
+            iterable = iterable.all()
+        if isinstance(iterable, models.QuerySet) and iterable._result_cache is None:
+            iterable = iterable.iterator(chunk_size=chunk_size)
+        iterator = iter(iterable)
+        instance_to_message = self.child.instance_to_message
+        try:
+            while True:
+                chunk = [
+                    instance_to_message(instance)
+                    for instance in islice(iterator, chunk_size)
+                ]
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            # Closing the queryset iterator closes its database cursor.
+            if hasattr(iterator, 'close'):
+                iterator.close()
+
 
 class ModelProtoSerializer(ProtoSerializer, ModelSerializer):
-    pass
\ No newline at end of file
+    def get_fields(self):
+        """
+        Building the fields from the model is done once per serializer class
+        and cache key, each serializer gets copies of these fields.
+        """
+        key = self.get_fields_cache_key()
+        if key is None:
+            return super().get_fields()
+        key = (self.__class__, key)
+        try:
+            fields = _fields_cache[key]
+        except KeyError:
+            fields = _fields_cache[key] = super().get_fields()
+        return {
+            field_name: _copy_field(field) for field_name, field in fields.items()
+        }
+
+    def get_fields_cache_key(self):
+        """
+        Return the key the fields are cached under for this serializer class,
+        or ``None`` to build them for every serializer.  Override it when
+        the fields depend on the serializer context or instance.
+        """
+        return getattr(self, 'Meta', None)
+
+    @classmethod
+    def clear_fields_cache(cls):
+        """
+        Forget the cached fields of this serializer class and its subclasses,
+        for example after changing ``Meta`` in tests.
+        """
+        for key in list(_fields_cache):
+            if issubclass(key[0], cls):
+                _fields_cache.pop(key, None)
+        for klass in [cls, *_subclasses(cls)]:
+            if '_compiled_fields_cache' in klass.__dict__:
+                klass._compiled_fields_cache.clear()
+
+    async def acreate(self, validated_data):
+        """
+        Async version of ``create()`` using the async ORM interface.
+        """
+        raise_errors_on_nested_writes('create', self, validated_data)
+        ModelClass = self.Meta.model
+
+        # Remove many-to-many relationships from validated_data, they are
+        # set once the instance has been saved.
+        info = model_meta.get_field_info(ModelClass)
+        many_to_many = {}
+        for field_name, relation_info in info.relations.items():
+            if relation_info.to_many and (field_name in validated_data):
+                many_to_many[field_name] = validated_data.pop(field_name)
+
+        instance = await ModelClass._default_manager.acreate(**validated_data)
+
+        for field_name, value in many_to_many.items():
+            await getattr(instance, field_name).aset(value)
+        return instance
+
+    async def aupdate(self, instance, validated_data):
+        """
+        Async version of ``update()`` using the async ORM interface.
+        """
+        raise_errors_on_nested_writes('update', self, validated_data)
+        info = model_meta.get_field_info(instance)
+
+        m2m_fields = []
+        for attr, value in validated_data.items():
+            if attr in info.relations and info.relations[attr].to_many:
+                m2m_fields.append((attr, value))
+            else:
+                setattr(instance, attr, value)
+
+        await instance.asave()
+
+        for attr, value in m2m_fields:
+            await getattr(instance, attr).aset(value)
+        return instance
+
+
+class CompiledModelProtoSerializer(ModelProtoSerializer):
+    """
+    A ``ModelProtoSerializer`` that builds messages straight from model
+    instances, instead of building the ``data`` dict and parsing it into a
+    message.  How each message field is filled is worked out once per
+    serializer class from ``Meta.model``, the serializer fields and the
+    ``Meta.proto_class`` descriptor.  Messages are the same as the ones the
+    ``ModelProtoSerializer`` builds.
+    """
+    @property
+    def message(self):
+        if not hasattr(self, '_message'):
+            if self.instance is not None and not getattr(self, '_errors', None):
+                self._message = self.instance_to_message(self.instance)
+            else:
+                self._message = self.data_to_message(self.data)
+        return self._message
+
+    def instance_to_message(self, instance):
+        """Protobuf message <- Model instance."""
+        message = self.Meta.proto_class()
+        fields = self.fields
+        pending = {}
+        for name, field_name, kind, get_value in self.get_compiled_fields():
+            value = get_value(fields, instance)
+            if value is _SKIP:
+                continue
+            if kind is _OTHER:
+                pending[field_name] = value
+                continue
+            if value is None:
+                continue
+            try:
+                if kind is _SCALAR:
+                    setattr(message, name, value)
+                else:
+                    getattr(message, name).extend(value)
+            except (TypeError, ValueError):
+                # Let the json format parser coerce the value, or complain.
+                message.ClearField(name)
+                pending[field_name] = value
+        if pending:
+            parse_dict(pending, message)
+        return message
+
+    def get_compiled_fields(self):
+        """
+        Return the ``(proto field name, serializer field name, kind, getter)``
+        tuples used by ``instance_to_message()``.
+        """
+        if not hasattr(self, '_compiled_fields'):
+            cls = self.__class__
+            if '_compiled_fields_cache' not in cls.__dict__:
+                cls._compiled_fields_cache = {}
+            key = tuple(self.fields)
+            compiled = cls._compiled_fields_cache.get(key)
+            if compiled is None:
+                compiled = _compile_fields(self)
+                cls._compiled_fields_cache[key] = compiled
+            self._compiled_fields = compiled
+        return self._compiled_fields
+
+
+_fields_cache = {}
+
+
+def _copy_field(field):
+    """
+    Copy a cached field for a new serializer.  Fields only hold their options
+    so a shallow copy is enough, the children of list and many related
+    fields are copied too and attached to the copy.  Nested serializers are
+    copied deeply.
+    """
+    if isinstance(field, BaseSerializer):
+        return copy.deepcopy(field)
+    clone = object.__new__(field.__class__)
+    clone.__dict__.update(field.__dict__)
+    for attr in ('child_relation', 'child'):
+        child = getattr(field, attr, None)
+        if isinstance(child, drf_fields.Field):
+            child = _copy_field(child)
+            child.parent = clone
+            setattr(clone, attr, child)
+    return clone
+
+
+def _subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+_SKIP = object()
+_SCALAR, _REPEATED, _OTHER = 'scalar', 'repeated', 'other'
+_SIMPLE_FIELDS = {
+    drf_fields.BooleanField, drf_fields.CharField, drf_fields.EmailField,
+    drf_fields.FloatField, drf_fields.IntegerField, drf_fields.SlugField,
+    drf_fields.URLField,
+}
+_NON_SCALAR_TYPES = {
+    FieldDescriptor.TYPE_BYTES, FieldDescriptor.TYPE_ENUM,
+    FieldDescriptor.TYPE_GROUP, FieldDescriptor.TYPE_MESSAGE,
+}
+
+
+def _compile_fields(serializer):
+    descriptor = serializer.Meta.proto_class.DESCRIPTOR
+    by_json_name = {f.json_name: f for f in descriptor.fields}
+    compiled = []
+    for field in serializer._readable_fields:
+        proto_field = (
+            descriptor.fields_by_name.get(field.field_name)
+            or by_json_name.get(field.field_name)
+        )
+        if proto_field is None:
+            # Unknown fields are ignored, like the json format parser does.
+            continue
+        if proto_field.type in _NON_SCALAR_TYPES:
+            kind = _OTHER
+        elif is_repeated(proto_field):
+            kind = _REPEATED
+        else:
+            kind = _SCALAR
+        compiled.append((
+            proto_field.name, field.field_name, kind,
+            _compile_getter(serializer.Meta.model, field),
+        ))
+    return tuple(compiled)
+
+
+def _compile_getter(model, field):
+    """
+    Return a ``getter(fields, instance)`` giving the representation of
+    ``field`` for a model instance, ``None`` for null values and ``_SKIP``
+    for skipped fields, like ``Serializer.to_representation()`` does.
+    """
+    model_field = None
+    if len(field.source_attrs) == 1:
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            pass
+    if model_field is not None and model_field.concrete:
+        attname = model_field.attname
+        field_class = type(field)
+        if (_trusted_bases.get(field_class, field_class) in _SIMPLE_FIELDS
+                and not model_field.is_relation
+                and attname == field.source):
+            return lambda fields, instance: getattr(instance, attname)
+        if (type(field) is PrimaryKeyRelatedField
+                and field.pk_field is None
+                and model_field.is_relation
+                and not model_field.many_to_many
+                and model_field.target_field.primary_key):
+            return lambda fields, instance: getattr(instance, attname)
+        if (type(field) is ManyRelatedField
+                and type(field.child_relation) is PrimaryKeyRelatedField
+                and field.child_relation.pk_field is None
+                and model_field.many_to_many):
+            name = model_field.name
+
+            def get_pks(fields, instance):
+                if instance.pk is None:
+                    return []
+                try:
+                    # Skip building a related manager when prefetched.
+                    related = instance._prefetched_objects_cache[name]
+                except (AttributeError, KeyError):
+                    related = getattr(instance, name).all()
+                return [obj.pk for obj in related]
+            return get_pks
+
+    field_name = field.field_name
+
+    def get_representation(fields, instance):
+        field = fields[field_name]
+        try:
+            attribute = field.get_attribute(instance)
+        except SkipField:
+            return _SKIP
+        if isinstance(attribute, PKOnlyObject):
+            check_for_none = attribute.pk
+        else:
+            check_for_none = attribute
+        if check_for_none is None:
+            return None
+        return field.to_representation(attribute)
+    return get_representation
@@ -7,6 +7,13 @@ from rest_framework.utils.field_mapping import ClassLookupDict
 
 
 class ModelProtoGenerator:
+    """
+    Generates the proto of the service of ``model``, with the messages of its
+    ``field_names`` and the rpcs of ``ModelService``.  With ``bulk``, the
+    ``BatchRetrieve`` rpc, the client streaming ``BulkCreate``,
+    ``BulkUpdate`` and ``BulkDestroy`` rpcs, and their messages, are
+    generated too.
+    """
     type_mapping = {
         # Numeric
         models.AutoField: 'int32',
@@ -38,9 +45,10 @@ class ModelProtoGenerator:
         models.Field: 'string',
     }
 
-    def __init__(self, model, field_names=None, package=None):
+    def __init__(self, model, field_names=None, package=None, bulk=False):
         self.model = model
         self.field_names = field_names
+        self.bulk = bulk
         if not package:
             package = model.__name__.lower()
         self.package = package
@@ -84,6 +92,25 @@ class ModelProtoGenerator:
                 'rpc Destroy(%s) returns (google.protobuf.Empty) {}' %
                 self.model.__name__
             )
+            if self.bulk:
+                self._writer.write_line(
+                    'rpc BatchRetrieve(%sBatchRetrieveRequest) '
+                    'returns (%sBatchRetrieveResponse) {}' %
+                    (self.model.__name__, self.model.__name__)
+                )
+                self._writer.write_line(
+                    'rpc BulkCreate(stream %s) returns (%sBulkCreateResponse) {}' %
+                    (self.model.__name__, self.model.__name__)
+                )
+                self._writer.write_line(
+                    'rpc BulkUpdate(stream %s) returns (%sBulkUpdateResponse) {}' %
+                    (self.model.__name__, self.model.__name__)
+                )
+                self._writer.write_line(
+                    'rpc BulkDestroy(stream %sRetrieveRequest) '
+                    'returns (%sBulkDestroyResponse) {}' %
+                    (self.model.__name__, self.model.__name__)
+                )
         self._writer.write_line('}')
 
     def _generate_message(self):
@@ -100,6 +127,44 @@ class ModelProtoGenerator:
             )
             self._writer.write_line(f'{pk_proto_type} {pk_field_name} = 1;')
         self._writer.write_line('}')
+        if self.bulk:
+            self._generate_bulk_messages()
+
+    def _generate_bulk_messages(self):
+        # The messages of BatchRetrieveModelMixin and of the bulk mixins.
+        pk_field_name = self.field_info.pk.name
+        pk_proto_type = self.build_proto_type(pk_field_name, self.field_info, self.model)
+        self._writer.write_line('')
+        self._writer.write_line('message %sBatchRetrieveRequest {' % self.model.__name__)
+        with self._writer.indent():
+            self._writer.write_line(f'repeated {pk_proto_type} {pk_field_name} = 1;')
+        self._writer.write_line('}')
+        self._writer.write_line('')
+        self._writer.write_line('message %sBatchRetrieveResponse {' % self.model.__name__)
+        with self._writer.indent():
+            self._writer.write_line(f'repeated {self.model.__name__} results = 1;')
+            self._writer.write_line(f'repeated {pk_proto_type} missing = 2;')
+        self._writer.write_line('}')
+        self._writer.write_line('')
+        self._writer.write_line('message %sBulkError {' % self.model.__name__)
+        with self._writer.indent():
+            self._writer.write_line('int32 index = 1;')
+            self._writer.write_line('string details = 2;')
+        self._writer.write_line('}')
+        for operation, count_field in [
+            ('Create', 'created'), ('Update', 'updated'), ('Destroy', 'deleted'),
+        ]:
+            self._writer.write_line('')
+            self._writer.write_line(
+                'message %sBulk%sResponse {' % (self.model.__name__, operation)
+            )
+            with self._writer.indent():
+                self._writer.write_line(f'int32 {count_field} = 1;')
+                self._writer.write_line('int32 failed = 2;')
+                self._writer.write_line(
+                    'repeated %sBulkError errors = 3;' % self.model.__name__
+                )
+            self._writer.write_line('}')
 
     # TODO Rename this here and in `_generate_message`
     def _extracted_from__generate_message_6(self, arg0):
@@ -0,0 +1,106 @@
+import base64
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.internal.type_checkers import ToShortestFloat
+from google.protobuf.json_format import MessageToDict
+
+
+_WRAPPER_TYPES = {
+    'google.protobuf.BoolValue', 'google.protobuf.BytesValue',
+    'google.protobuf.DoubleValue', 'google.protobuf.FloatValue',
+    'google.protobuf.Int32Value', 'google.protobuf.Int64Value',
+    'google.protobuf.StringValue', 'google.protobuf.UInt32Value',
+    'google.protobuf.UInt64Value',
+}
+
+_converters = {}
+
+
+def message_to_native(message):
+    """
+    Protobuf message -> Dict of python primitive datatypes.
+
+    This is like ``json_format.MessageToDict()`` with
+    ``preserving_proto_field_name=True``, only set fields are included, but
+    values are native python values rather than JSON ones: 64-bit integers
+    stay integers and map keys keep their type.  Enums are still converted
+    to their names, bytes to base64 strings, and the well-known types to
+    their JSON representation, which is what rest framework fields expect.
+    The converter of each message type is compiled once from its descriptor.
+    """
+    descriptor = message.DESCRIPTOR
+    try:
+        converters = _converters[descriptor]
+    except KeyError:
+        converters = _converters[descriptor] = _compile_message(descriptor)
+    data = {}
+    for field, value in message.ListFields():
+        try:
+            name, convert = converters[field.number]
+        except KeyError:
+            # Extensions are not part of the message descriptor.
+            continue
+        data[name] = value if convert is None else convert(value)
+    return data
+
+
+def _compile_message(descriptor):
+    return {
+        field.number: (field.name, _compile_field(field))
+        for field in descriptor.fields
+    }
+
+
+def _compile_field(field):
+    """
+    Return the function converting the value of ``field``, or ``None`` when
+    the value can be used as it is.
+    """
+    message_type = field.message_type
+    if message_type is not None and message_type.GetOptions().map_entry:
+        convert_value = _compile_field(message_type.fields_by_name['value'])
+        if convert_value is None:
+            return dict
+        return lambda value: {k: convert_value(v) for k, v in value.items()}
+    convert = _compile_scalar(field)
+    if is_repeated(field):
+        if convert is None:
+            return list
+        return lambda value: [convert(item) for item in value]
+    return convert
+
+
+def _compile_scalar(field):
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        full_name = field.message_type.full_name
+        if full_name in _WRAPPER_TYPES:
+            convert_value = _compile_scalar(field.message_type.fields_by_name['value'])
+            if convert_value is None:
+                return lambda value: value.value
+            return lambda value: convert_value(value.value)
+        if full_name.startswith('google.protobuf.'):
+            return lambda value: MessageToDict(value, preserving_proto_field_name=True)
+        return message_to_native
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        values_by_number = field.enum_type.values_by_number
+
+        def convert_enum(value):
+            enum_value = values_by_number.get(value)
+            return value if enum_value is None else enum_value.name
+        return convert_enum
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return lambda value: base64.b64encode(value).decode('utf-8')
+    if field.type == FieldDescriptor.TYPE_FLOAT:
+        return ToShortestFloat
+    return None
+
+
+def is_repeated(field):
+    """
+    Return whether the field descriptor ``field`` is repeated.  protobuf 6.32
+    and later deprecate ``label`` for ``is_repeated``.
+    """
+    try:
+        return field.is_repeated
+    except AttributeError:
+        return field.label == FieldDescriptor.LABEL_REPEATED
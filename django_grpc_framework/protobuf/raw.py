@@ -0,0 +1,96 @@
+"""
+Responses already serialized to their wire bytes.
+
+A handler may return or yield ``RawMessage(data)`` instead of a message, the
+bytes being sent as they are when its servicer is registered on a
+``RawMessageServer``: the ``response_serializer`` of each method registered
+through it is wrapped to pass raw messages through, so that cached or
+precomputed responses are not parsed and serialized again.
+"""
+
+
+class RawMessage:
+    """The wire bytes ``data`` of a response message."""
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __bytes__(self):
+        return self.data
+
+    def __eq__(self, other):
+        if other.__class__ is not RawMessage:
+            return NotImplemented
+        return self.data == other.data
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<RawMessage: %d bytes>' % len(self.data)
+
+
+def raw_serializer(serializer):
+    """
+    Wrap the response ``serializer`` of a method so that it writes the bytes
+    of ``RawMessage`` responses unchanged.
+    """
+    if serializer is None or getattr(serializer, 'accepts_raw', False):
+        return serializer
+
+    def serialize(message):
+        if message.__class__ is RawMessage:
+            return message.data
+        return serializer(message)
+
+    serialize.accepts_raw = True
+    return serialize
+
+
+def accept_raw(method_handler):
+    """
+    Return the ``grpc.RpcMethodHandler`` ``method_handler`` with a response
+    serializer accepting ``RawMessage``, and tell the behavior, if it is the
+    handler of a service, that it may return raw messages.
+    """
+    behavior = (
+        method_handler.unary_unary or method_handler.unary_stream
+        or method_handler.stream_unary or method_handler.stream_stream
+    )
+    if hasattr(behavior, 'raw_responses'):
+        behavior.raw_responses = True
+    return method_handler._replace(
+        response_serializer=raw_serializer(method_handler.response_serializer),
+    )
+
+
+class RawMessageServer:
+    """
+    Wraps a ``grpc.Server`` or ``grpc.aio.Server`` so that the servicers
+    added to it may respond with ``RawMessage``::
+
+        add_PostControllerServicer_to_server(servicer, RawMessageServer(server))
+
+    ``grpcrunserver`` and the test channel pass such a server to the
+    ``ROOT_HANDLERS_HOOK``.
+    """
+    def __init__(self, server):
+        self.server = server
+
+    def __getattr__(self, name):
+        return getattr(self.server, name)
+
+    def add_generic_rpc_handlers(self, generic_rpc_handlers):
+        for generic_handler in generic_rpc_handlers:
+            # Handlers built by grpc.method_handlers_generic_handler().
+            method_handlers = getattr(generic_handler, '_method_handlers', None)
+            if method_handlers is not None:
+                for name, method_handler in method_handlers.items():
+                    method_handlers[name] = accept_raw(method_handler)
+        self.server.add_generic_rpc_handlers(generic_rpc_handlers)
+
+    def add_registered_method_handlers(self, service_name, method_handlers):
+        self.server.add_registered_method_handlers(service_name, {
+            name: accept_raw(method_handler)
+            for name, method_handler in method_handlers.items()
+        })
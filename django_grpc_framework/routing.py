@@ -0,0 +1,94 @@
+"""
+Routing of the read actions of services to database replicas.
+
+The queries of the read actions of a generic service go to one of its
+``read_databases``, chosen for each call by a ``ReplicaBalancer``, the other
+actions keep the default routing and write to the primary.  A client reading
+its own writes tells the time of its last write with the
+``x-last-write-at`` metadata, its reads stay on the primary for
+``read_your_writes_window`` seconds after it, until replicas caught up.
+"""
+import itertools
+import threading
+import time
+
+
+#: The metadata of the Unix time of the last write of the client.
+LAST_WRITE_METADATA_KEY = 'x-last-write-at'
+
+POLICIES = ('round_robin', 'least_connections')
+
+
+class ReplicaBalancer:
+    """
+    Chooses the database of each call among the aliases of a service::
+
+        alias = balancer.choose(('replica1', 'replica2'), 'least_connections')
+        ...
+        balancer.release(alias)
+
+    ``'round_robin'`` cycles through the aliases, ``'least_connections'``
+    takes the alias with the fewest calls in flight, the first one on ties.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cycles = {}
+        self._in_flight = {}
+
+    def choose(self, aliases, policy='round_robin'):
+        """Return the alias of the call, which must be released after it."""
+        with self._lock:
+            if policy == 'round_robin':
+                cycle = self._cycles.get(aliases)
+                if cycle is None:
+                    cycle = self._cycles[aliases] = itertools.cycle(aliases)
+                alias = next(cycle)
+            elif policy == 'least_connections':
+                in_flight = self._in_flight
+                alias = min(aliases, key=lambda alias: in_flight.get(alias, 0))
+            else:
+                raise ValueError(
+                    'Unknown read database policy %r, expected one of %s.'
+                    % (policy, ', '.join(POLICIES))
+                )
+            self._in_flight[alias] = self._in_flight.get(alias, 0) + 1
+        return alias
+
+    def release(self, alias):
+        """Release the alias of a call returned by ``choose()``."""
+        with self._lock:
+            self._in_flight[alias] -= 1
+
+    def in_flight(self):
+        """Return the number of calls in flight by alias."""
+        with self._lock:
+            return {alias: count for alias, count in self._in_flight.items() if count}
+
+
+#: The balancer of the ``read_databases`` of services.
+balancer = ReplicaBalancer()
+
+
+def get_last_write(context):
+    """
+    Return the Unix time of the ``x-last-write-at`` metadata of the call of
+    ``context``, or ``None``.
+    """
+    for key, value in context.invocation_metadata() or ():
+        if key == LAST_WRITE_METADATA_KEY:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+def reads_own_writes(context, window):
+    """
+    Return whether the client of ``context`` wrote less than ``window``
+    seconds ago.
+    """
+    if not window or context is None:
+        return False
+    last_write = get_last_write(context)
+    return last_write is not None and time.time() - last_write < window
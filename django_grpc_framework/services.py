@@ -1,14 +1,28 @@
-import asyncio
+from contextlib import nullcontext
 from functools import update_wrapper
 import inspect
+from types import MappingProxyType
 
 import grpc
 from django.db.models.query import QuerySet
 
-from django_grpc_framework.signals import grpc_request_started, grpc_request_finished
+from django_grpc_framework import deadlines, hooks
+from django_grpc_framework.utils import singleflight
+from django_grpc_framework.utils.loops import loop_runner
 
 
 class Service:
+    # The unary actions whose identical concurrent calls are collapsed into
+    # one, the other callers getting the response of the first one.  Only
+    # for actions whose response does not depend on the caller.
+    singleflight_actions = ()
+    # Whether the action may return or yield ``RawMessage`` responses, set
+    # for each call when the servicer is registered on a ``RawMessageServer``.
+    raw_responses = False
+    # Abort the calls whose deadline has passed, and bound the queries of
+    # sync actions by the time left to the call.
+    propagate_deadlines = True
+
     def __init__(self, **kwargs):
         for key, value in kwargs.items():
             setattr(self, key, value)
@@ -20,6 +34,10 @@ class Service:
 
             servicer = PostService.as_servicer()
             add_PostControllerServicer_to_server(servicer, server)
+
+        The handlers for all service methods are built once here and exposed
+        as plain attributes of the servicer, so looking them up while
+        registering or dispatching does not allocate anything.
         """
         for key in initkwargs:
             if not hasattr(cls, key):
@@ -39,54 +57,206 @@ class Service:
 
             cls.queryset._fetch_all = force_evaluation
 
+        handlers = MappingProxyType({
+            action: _make_handler(cls, action, initkwargs)
+            for action in _get_actions(cls)
+        })
+
         class Servicer:
             def __getattr__(self, action):
+                # Only reached for names that are not precompiled handlers.
                 if not hasattr(cls, action):
                     return not_implemented
+                handler = _make_handler(cls, action, initkwargs)
+                setattr(self, action, handler)
+                return handler
 
-                controller_fn = getattr(cls, action)
+        update_wrapper(Servicer, cls, updated=())
+        Servicer.handlers = handlers
+        servicer = Servicer()
+        servicer.__dict__.update(handlers)
+        return servicer
 
-                async def handler_async(request, context):
-                    grpc_request_started.send(sender=handler_async, request=request, context=context)
-                    try:
-                        self = cls(**initkwargs)
-                        self.request = request
-                        self.context = context
-                        self.action = action
-                        controller = getattr(self, action)
-                        result = controller(request, context)
-                        if inspect.isawaitable(result):
-                            return await result
-                        return result
-                    finally:
-                        grpc_request_finished.send(sender=handler_async)
-
-                def handler_sync(request, context):
-                    grpc_request_started.send(sender=handler_sync, request=request, context=context)
-                    try:
-                        self = cls(**initkwargs)
-                        self.request = request
-                        self.context = context
-                        self.action = action
-                        controller = getattr(self, action)
+    def finalize(self):
+        """
+        Called once the call is over, whether it succeeded or not, to
+        release what the service acquired for it.
+        """
+
+    def get_singleflight_key(self):
+        """
+        Return the key of the call among the concurrent calls of the same
+        action, the identical ones being collapsed.  Defaults to the
+        serialized request.
+        """
+        return self.request.SerializeToString(deterministic=True)
+
+
+def _get_actions(cls):
+    """Return the names of the service methods that look like rpc methods."""
+    return [
+        name for name in dir(cls)
+        if name[:1].isupper() and inspect.isfunction(getattr(cls, name))
+    ]
+
+
+def _make_handler(cls, action, initkwargs):
+    """
+    Build the gRPC handler for ``action``, choosing the sync, async or
+    streaming variant from the kind of the service method.
+    """
+    controller_fn = getattr(cls, action)
+    singleflight_actions = initkwargs.get('singleflight_actions', cls.singleflight_actions)
+    propagate_deadlines = initkwargs.get('propagate_deadlines', cls.propagate_deadlines)
+    deadline_scope = deadlines.deadline_scope if propagate_deadlines else nullcontext
+    started, finished, astarted, afinished = hooks.compile_hooks(
+        inspect.iscoroutinefunction(controller_fn) or inspect.isasyncgenfunction(controller_fn)
+    )
+
+    def get_controller(request, context):
+        self = cls(**initkwargs)
+        self.request = request
+        self.context = context
+        self.action = action
+        self.raw_responses = handler.raw_responses
+        return getattr(self, action)
+
+    def finalize(controller):
+        if controller is not None:
+            controller.__self__.finalize()
+
+    if inspect.isasyncgenfunction(controller_fn):
+
+        async def handler(request, context):
+            for hook in started:
+                hook(handler, request, context)
+            for hook in astarted:
+                await hook(handler, request, context)
+            controller = None
+            try:
+                if propagate_deadlines:
+                    await deadlines.acheck(context)
+                controller = get_controller(request, context)
+                async for response in controller(request, context):
+                    yield response
+            finally:
+                finalize(controller)
+                for hook in finished:
+                    hook(handler)
+                for hook in afinished:
+                    await hook(handler)
+
+    elif inspect.iscoroutinefunction(controller_fn) and action in singleflight_actions:
+
+        async def handler(request, context):
+            for hook in started:
+                hook(handler, request, context)
+            for hook in astarted:
+                await hook(handler, request, context)
+            controller = None
+            try:
+                if propagate_deadlines:
+                    await deadlines.acheck(context)
+                controller = get_controller(request, context)
+                # Keyed by the handler, the servicers of a class may have
+                # different initkwargs, like a restricted queryset.
+                key = (cls, action, handler, controller.__self__.get_singleflight_key())
+
+                async def call():
+                    return await controller(request, context)
+
+                return await singleflight.group.ado(key, call)
+            finally:
+                finalize(controller)
+                for hook in finished:
+                    hook(handler)
+                for hook in afinished:
+                    await hook(handler)
+
+    elif inspect.iscoroutinefunction(controller_fn):
+
+        async def handler(request, context):
+            for hook in started:
+                hook(handler, request, context)
+            for hook in astarted:
+                await hook(handler, request, context)
+            controller = None
+            try:
+                if propagate_deadlines:
+                    await deadlines.acheck(context)
+                controller = get_controller(request, context)
+                result = controller(request, context)
+                if inspect.isawaitable(result):
+                    return await result
+                return result
+            finally:
+                finalize(controller)
+                for hook in finished:
+                    hook(handler)
+                for hook in afinished:
+                    await hook(handler)
+
+    elif inspect.isgeneratorfunction(controller_fn):
+
+        def handler(request, context):
+            for hook in started:
+                hook(handler, request, context)
+            controller = None
+            try:
+                with deadline_scope(context):
+                    controller = get_controller(request, context)
+                    yield from controller(request, context)
+            finally:
+                finalize(controller)
+                for hook in finished:
+                    hook(handler)
+
+    elif action in singleflight_actions:
+
+        def handler(request, context):
+            for hook in started:
+                hook(handler, request, context)
+            controller = None
+            try:
+                with deadline_scope(context):
+                    controller = get_controller(request, context)
+                    key = (cls, action, handler, controller.__self__.get_singleflight_key())
+
+                    def call():
                         result = controller(request, context)
                         if inspect.isawaitable(result):
-                            # No running loop in gRPC sync worker threads; run the coroutine to completion here.
-                            return asyncio.run(result)
+                            return loop_runner.run(result)
                         return result
-                    finally:
-                        grpc_request_finished.send(sender=handler_sync)
 
-                # Choose the appropriate handler based on whether the view method is async.
-                if inspect.iscoroutinefunction(controller_fn):
-                    update_wrapper(handler_async, controller_fn)
-                    return handler_async
-                else:
-                    update_wrapper(handler_sync, controller_fn)
-                    return handler_sync
+                    return singleflight.group.do(key, call)
+            finally:
+                finalize(controller)
+                for hook in finished:
+                    hook(handler)
 
-        update_wrapper(Servicer, cls, updated=())
-        return Servicer()
+    else:
+
+        def handler(request, context):
+            for hook in started:
+                hook(handler, request, context)
+            controller = None
+            try:
+                with deadline_scope(context):
+                    controller = get_controller(request, context)
+                    result = controller(request, context)
+                    if inspect.isawaitable(result):
+                        # No running loop in gRPC sync worker threads; run the
+                        # coroutine to completion on the loop of this thread.
+                        return loop_runner.run(result)
+                    return result
+            finally:
+                finalize(controller)
+                for hook in finished:
+                    hook(handler)
+
+    update_wrapper(handler, controller_fn)
+    handler.raw_responses = False
+    return handler
 
 
 def not_implemented(request, context):
@@ -21,6 +21,12 @@ DEFAULTS = {
 
     # gRPC server configuration
     'SERVER_INTERCEPTORS': None,
+    'CONNECTION_HOUSEKEEPING_INTERVAL': 0,
+
+    # Generic services
+    'DEFAULT_FILTER_BACKENDS': [],
+    'LIST_CHUNK_SIZE': 100,
+    'READ_DATABASES': [],
 }
 
 
@@ -28,6 +34,7 @@ DEFAULTS = {
 IMPORT_STRINGS = [
     'ROOT_HANDLERS_HOOK',
     'SERVER_INTERCEPTORS',
+    'DEFAULT_FILTER_BACKENDS',
 ]
 
 
@@ -1,12 +1,8 @@
 from django.dispatch import Signal
-from django.db import reset_queries, close_old_connections
 
 
+# Sent when a call starts and finishes, for the receivers connected to them.
+# The database connections are managed by the hooks of
+# ``django_grpc_framework.hooks``, which are cheaper to run on every call.
 grpc_request_started = Signal()
 grpc_request_finished = Signal()
-
-
-# db connection state managed similarly to the wsgi handler
-grpc_request_started.connect(reset_queries)
-grpc_request_started.connect(close_old_connections)
-grpc_request_finished.connect(close_old_connections)
\ No newline at end of file
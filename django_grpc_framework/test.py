@@ -1,28 +1,17 @@
-from contextlib import contextmanager
+import time
 
 from django.test import testcases
 import grpc
-from django.db import close_old_connections
 
+from django_grpc_framework.hooks import housekeeping
+from django_grpc_framework.protobuf.raw import RawMessage, RawMessageServer
 from django_grpc_framework.settings import grpc_settings
-from django_grpc_framework.signals import grpc_request_started, grpc_request_finished
-
-
-@contextmanager
-def _disable_close_old_connections():
-    try:
-        grpc_request_started.disconnect(close_old_connections)
-        grpc_request_finished.disconnect(close_old_connections)
-        yield
-    finally:
-        grpc_request_started.connect(close_old_connections)
-        grpc_request_finished.connect(close_old_connections)
 
 
 class Channel:
     def __init__(self):
         server = FakeServer()
-        grpc_settings.ROOT_HANDLERS_HOOK(server)
+        grpc_settings.ROOT_HANDLERS_HOOK(RawMessageServer(server))
         self.server = server
 
     def __enter__(self):
@@ -31,22 +20,40 @@ class Channel:
     def __exit__(self, exc_tp, exc_val, exc_tb):
         pass
 
-    def unary_unary(self, method, *args, **kwargs):
-        return UnaryUnary(self, method)
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None,
+                    *args, **kwargs):
+        return UnaryUnary(self, method, response_deserializer)
 
-    def unary_stream(self, method, *args, **kwargs):
-        return UnaryStream(self, method)
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None,
+                     *args, **kwargs):
+        return UnaryStream(self, method, response_deserializer)
 
-    def stream_unary(self, method, *args, **kwargs):
-        return StreamUnary(self, method)
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None,
+                     *args, **kwargs):
+        return StreamUnary(self, method, response_deserializer)
 
-    def stream_stream(self, method, *args, **kwargs):
-        return StreamStream(self, method)
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None,
+                      *args, **kwargs):
+        return StreamStream(self, method, response_deserializer)
 
 
 class _MultiCallable:
-    def __init__(self, channel, method_full_rpc_name):
+    def __init__(self, channel, method_full_rpc_name, response_deserializer=None):
         self._handler = channel.server._find_method_handler(method_full_rpc_name)
+        self._response_deserializer = response_deserializer
+
+    def _response(self, response):
+        # Parse the raw messages a real channel would receive as bytes.
+        if response.__class__ is RawMessage and self._response_deserializer:
+            return self._response_deserializer(response.data)
+        return response
+
+    def _stream(self, responses):
+        # The handler runs while the responses are iterated, the connections
+        # must not be closed then either.
+        with housekeeping.disabled():
+            for response in responses:
+                yield self._response(response)
 
     def with_call(self, *args, **kwargs):
         raise NotImplementedError
@@ -57,34 +64,32 @@ class _MultiCallable:
 
 class UnaryUnary(_MultiCallable, grpc.UnaryUnaryMultiCallable):
     def __call__(self, request, timeout=None, metadata=None, *args, **kwargs):
-        with _disable_close_old_connections():
-            context = FakeContext()
+        with housekeeping.disabled():
+            context = FakeContext(timeout)
             context._invocation_metadata.extend(metadata or [])
-            return self._handler.unary_unary(request, context)
+            return self._response(self._handler.unary_unary(request, context))
 
 
 class UnaryStream(_MultiCallable, grpc.UnaryStreamMultiCallable):
     def __call__(self, request, timeout=None, metadata=None, *args, **kwargs):
-        with _disable_close_old_connections():
-            context = FakeContext()
-            context._invocation_metadata.extend(metadata or [])
-            return self._handler.unary_stream(request, context)
+        context = FakeContext(timeout)
+        context._invocation_metadata.extend(metadata or [])
+        return self._stream(self._handler.unary_stream(request, context))
 
 
 class StreamUnary(_MultiCallable, grpc.StreamUnaryMultiCallable):
     def __call__(self, request_iterator, timeout=None, metadata=None, *args, **kwargs):
-        with _disable_close_old_connections():
-            context = FakeContext()
+        with housekeeping.disabled():
+            context = FakeContext(timeout)
             context._invocation_metadata.extend(metadata or [])
-            return self._handler.stream_unary(request_iterator, context)
+            return self._response(self._handler.stream_unary(request_iterator, context))
 
 
 class StreamStream(_MultiCallable, grpc.StreamStreamMultiCallable):
     def __call__(self, request_iterator, timeout=None, metadata=None, *args, **kwargs):
-        with _disable_close_old_connections():
-            context = FakeContext()
-            context._invocation_metadata.extend(metadata or [])
-            return self._handler.stream_stream(request_iterator, context)
+        context = FakeContext(timeout)
+        context._invocation_metadata.extend(metadata or [])
+        return self._stream(self._handler.stream_stream(request_iterator, context))
 
 
 class FakeRpcError(grpc.RpcError):
@@ -111,13 +116,19 @@ class FakeServer:
         _validate_generic_rpc_handlers(generic_rpc_handlers)
         self.rpc_method_handlers.update(generic_rpc_handlers[0]._method_handlers)
 
+    def add_registered_method_handlers(self, service_name, method_handlers):
+        # Registered method handlers are also added as generic handlers.
+        pass
+
     def _find_method_handler(self, method_full_rpc_name):
         return self.rpc_method_handlers[method_full_rpc_name]
 
 
 class FakeContext:
-    def __init__(self):
+    def __init__(self, timeout=None):
         self._invocation_metadata = []
+        self._active = True
+        self._deadline = None if timeout is None else time.monotonic() + timeout
 
     def abort(self, code, details):
         raise FakeRpcError(code, details)
@@ -125,6 +136,19 @@ class FakeContext:
     def invocation_metadata(self):
         return self._invocation_metadata
 
+    def is_active(self):
+        remaining = self.time_remaining()
+        return self._active and (remaining is None or remaining > 0)
+
+    def time_remaining(self):
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0)
+
+    def cancel(self):
+        """Act as if the client cancelled the call."""
+        self._active = False
+
 
 class RPCSimpleTestCase(testcases.SimpleTestCase):
     channel_class = Channel
@@ -0,0 +1,9 @@
+try:
+    # Django < 5.0 supports Python versions whose hashlib.md5() does not
+    # accept usedforsecurity.
+    from django.utils.crypto import md5
+except ImportError:
+    from hashlib import md5
+
+
+__all__ = ['md5']
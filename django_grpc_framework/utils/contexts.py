@@ -0,0 +1,15 @@
+import inspect
+
+
+def abort(context, code, details, exception_class):
+    """
+    Abort the call of a sync handler with ``code`` and ``details``.  Sync
+    handlers of ``grpc.aio`` servers cannot await ``abort()``, the status
+    code is set and ``exception_class`` raised instead, the status code set
+    is kept when the handler raises.
+    """
+    if inspect.iscoroutinefunction(context.abort):
+        context.set_code(code)
+        context.set_details(details)
+        raise exception_class(details)
+    context.abort(code, details)
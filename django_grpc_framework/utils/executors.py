@@ -0,0 +1,65 @@
+from concurrent import futures
+import threading
+import time
+
+
+class MeteredThreadPoolExecutor(futures.ThreadPoolExecutor):
+    """
+    A ``ThreadPoolExecutor`` that keeps track of how saturated it is, for
+    running sync handlers::
+
+        executor = MeteredThreadPoolExecutor(max_workers=10)
+        ...
+        executor.metrics()
+        {'max_workers': 10, 'submitted': 1204, 'completed': 1190, 'active': 10,
+         'pending': 4, 'peak_pending': 31, 'saturation': 1.0,
+         'average_wait': 0.0021}
+    """
+    def __init__(self, max_workers=None, thread_name_prefix='', **kwargs):
+        super().__init__(max_workers, thread_name_prefix, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._active = 0
+        self._peak_pending = 0
+        self._wait_time = 0.0
+
+    def submit(self, fn, /, *args, **kwargs):
+        submitted_at = time.monotonic()
+
+        def run():
+            with self._metrics_lock:
+                self._active += 1
+                self._wait_time += time.monotonic() - submitted_at
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._metrics_lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        with self._metrics_lock:
+            self._submitted += 1
+            pending = self._submitted - self._completed - self._active
+            if pending > self._peak_pending:
+                self._peak_pending = pending
+        return super().submit(run)
+
+    def metrics(self):
+        """
+        Return a snapshot of the executor usage.  ``pending`` is the number of
+        calls waiting for a free worker, ``saturation`` the ratio of busy
+        workers and ``average_wait`` the mean seconds a call spent waiting.
+        """
+        with self._metrics_lock:
+            started = self._completed + self._active
+            return {
+                'max_workers': self._max_workers,
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'active': self._active,
+                'pending': self._submitted - started,
+                'peak_pending': self._peak_pending,
+                'saturation': self._active / self._max_workers,
+                'average_wait': self._wait_time / started if started else 0.0,
+            }
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+
+
+class ThreadLoopRunner:
+    """
+    Runs coroutines to completion from synchronous code, keeping one
+    long-lived event loop per thread instead of creating a new loop for every
+    call like ``asyncio.run()`` does.
+
+    Loops are created lazily the first time a thread runs a coroutine, and
+    are all closed by ``close()``, usually when the server shuts down.
+    """
+    def __init__(self):
+        self._local = threading.local()
+        # The loops and the identifier of the thread they belong to.
+        self._loops = {}
+        self._lock = threading.Lock()
+
+    def get_loop(self):
+        """Return the event loop of the current thread, creating it if needed."""
+        loop = getattr(self._local, 'loop', None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            self._local.loop = loop
+            with self._lock:
+                self._loops[loop] = threading.get_ident()
+        return loop
+
+    def run(self, coro):
+        """Run the coroutine on the loop of the current thread."""
+        return self.get_loop().run_until_complete(coro)
+
+    def close(self):
+        """
+        Close all the loops that are not running at the moment.  The
+        asynchronous generators of the loop of the current thread are
+        finalized first, unless another loop is running in this thread, like
+        when called from a coroutine.  The loops of other threads are only
+        closed, never run from here.
+        """
+        with self._lock:
+            loops, self._loops = self._loops, {}
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            in_loop = False
+        else:
+            in_loop = True
+        current = threading.get_ident()
+        for loop, owner in loops.items():
+            if loop.is_running():
+                with self._lock:
+                    self._loops[loop] = owner
+                continue
+            try:
+                if owner == current and not in_loop:
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+
+loop_runner = ThreadLoopRunner()
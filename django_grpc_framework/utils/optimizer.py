@@ -0,0 +1,176 @@
+"""
+Helpers deriving ``select_related()``, ``prefetch_related()`` and ``only()``
+from the fields of a serializer, so that serializing a queryset does not send
+one query per row for each relation.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch, QuerySet
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+
+_cache = {}
+
+
+def optimize_queryset(queryset, serializer, only=True):
+    """
+    Return ``queryset`` with the ``select_related()``, ``prefetch_related()``
+    and, when ``only`` is true, ``only()`` calls that the fields of
+    ``serializer`` need.  Querysets already restricting their columns are
+    not given an ``only()``.
+    """
+    if not isinstance(queryset, QuerySet):
+        return queryset
+    select_related, prefetch_related, only_fields = get_optimizations(
+        serializer, queryset.model
+    )
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        seen = {
+            lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+            for lookup in queryset._prefetch_related_lookups
+        }
+        lookups = [
+            lookup for lookup in prefetch_related
+            if (lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup) not in seen
+        ]
+        if lookups:
+            queryset = queryset.prefetch_related(*lookups)
+    if (only and only_fields is not None
+            and queryset.query.deferred_loading == (frozenset(), True)):
+        queryset = queryset.only(*only_fields)
+    return queryset
+
+
+def get_optimizations(serializer, model):
+    """
+    Return the ``(select_related, prefetch_related, only)`` lookups needed
+    to serialize instances of ``model`` with ``serializer``.  ``only`` is
+    ``None`` when some field reads something else than model fields, such
+    as a method or a property.  They are worked out once per serializer
+    class and set of fields.
+    """
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+    key = (serializer.__class__, model, tuple(serializer.fields))
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+    optimizations = _Optimizations()
+    optimizations.walk(serializer, model, prefix='', select=True)
+    result = _cache[key] = optimizations.result()
+    return result
+
+
+class _Optimizations:
+    def __init__(self):
+        self.select_related = []
+        self.prefetch_related = []
+        self.only = []
+        # Lookup prefixes of the models whose columns cannot be restricted.
+        self.load_all = set()
+
+    def result(self):
+        if '' in self.load_all:
+            only = None
+        else:
+            only = [
+                name for name in self.only
+                if not any(name.startswith(prefix) for prefix in self.load_all)
+            ]
+        return (
+            tuple(self.select_related), tuple(self.prefetch_related),
+            None if only is None else tuple(dict.fromkeys(only)),
+        )
+
+    def add_select_related(self, path):
+        if path not in self.select_related:
+            self.select_related.append(path)
+
+    def add_prefetch_related(self, lookup):
+        path = lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+        for existing in self.prefetch_related:
+            if path == (existing.prefetch_to if isinstance(existing, Prefetch) else existing):
+                return
+        self.prefetch_related.append(lookup)
+
+    def walk(self, serializer, model, prefix, select):
+        """
+        Collect the lookups of the fields of ``serializer`` serializing
+        instances of ``model``, reached through the ``prefix`` lookup path.
+        ``select`` is false past a many relation, where only
+        ``prefetch_related()`` can follow relations.
+        """
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            if field.source == '*':
+                if isinstance(field, BaseSerializer):
+                    self.walk(field, model, prefix, select)
+                else:
+                    # Method fields and the like may read anything.
+                    self.load_all.add(prefix)
+                continue
+            self.walk_field(field, model, prefix, select)
+
+    def walk_field(self, field, model, prefix, select):
+        attrs = field.source_attrs
+        for index, attr in enumerate(attrs):
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                self.load_all.add(prefix)
+                return
+            last = index == len(attrs) - 1
+            path = prefix + model_field.name
+            if not model_field.is_relation:
+                if select:
+                    self.only.append(prefix + model_field.attname)
+                return
+            if not model_field.concrete or model_field.many_to_many:
+                # Many relations and reverse one-to-one relations are not
+                # columns of the row, they are prefetched.
+                if last and _is_pk_only(field):
+                    self.add_prefetch_related(self.pk_prefetch(model_field, path))
+                    return
+                self.add_prefetch_related(path)
+                select = False
+            elif last and _is_pk_only(field):
+                # Primary keys of forward relations are on the row itself.
+                if select:
+                    self.only.append(prefix + model_field.attname)
+                return
+            elif select:
+                self.add_select_related(path)
+                self.only.append(path)
+            else:
+                self.add_prefetch_related(path)
+            model = model_field.related_model
+            prefix = path + '__'
+        child = getattr(field, 'child', None)
+        if isinstance(child, BaseSerializer):
+            field = child
+        if isinstance(field, BaseSerializer):
+            self.walk(field, model, prefix, select)
+        else:
+            # A relation serialized by a field other than a primary key or
+            # a nested serializer, such as its string or a slug.
+            self.load_all.add(prefix)
+
+    def pk_prefetch(self, model_field, path):
+        if model_field.many_to_many:
+            related_model = model_field.related_model
+            return Prefetch(
+                path, queryset=related_model._default_manager.only(
+                    related_model._meta.pk.attname
+                ),
+            )
+        return path
+
+
+def _is_pk_only(field):
+    if isinstance(field, ManyRelatedField):
+        field = field.child_relation
+    return isinstance(field, PrimaryKeyRelatedField) and field.pk_field is None
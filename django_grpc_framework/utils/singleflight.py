@@ -0,0 +1,123 @@
+import asyncio
+import threading
+
+
+_FAILED = object()
+
+
+class _Call:
+    __slots__ = ('event', 'result')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = _FAILED
+
+
+class SingleFlight:
+    """
+    Collapses identical concurrent calls: the first caller of a key runs the
+    function, the callers arriving while it runs wait for its result instead
+    of running it again::
+
+        group = SingleFlight()
+        group.do((PostService, 'Retrieve', key), retrieve)
+        await group.ado((PostService, 'Retrieve', key), aretrieve)
+
+    When the first call raises, the waiting callers run the function
+    themselves, so that each one gets its own error.  Keys are tuples whose
+    first two items, like the service and the action, group the metrics::
+
+        group.metrics()
+        {'calls': 1204, 'collapsed': 1130, 'in_flight': 2,
+         'collapse_ratio': 0.94, 'by_action': {(PostService, 'Retrieve'):
+         {'calls': 1204, 'collapsed': 1130}}}
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_calls = {}
+        self._metrics = {}
+
+    def do(self, key, func):
+        """Return ``func()``, or the result of the identical call in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if leader:
+            self._count(key, collapsed=False)
+            try:
+                call.result = func()
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.event.set()
+            return call.result
+        call.event.wait()
+        if call.result is _FAILED:
+            self._count(key, collapsed=False)
+            return func()
+        self._count(key, collapsed=True)
+        return call.result
+
+    async def ado(self, key, func):
+        """
+        Async version of ``do()``, for a coroutine function ``func``.  Calls
+        are only collapsed with the calls of the same event loop.
+        """
+        loop_key = (asyncio.get_running_loop(), key)
+        future = self._async_calls.get(loop_key)
+        if future is None:
+            future = self._async_calls[loop_key] = asyncio.get_running_loop().create_future()
+            self._count(key, collapsed=False)
+            result = _FAILED
+            try:
+                result = await func()
+            finally:
+                del self._async_calls[loop_key]
+                future.set_result(result)
+            return result
+        result = await asyncio.shield(future)
+        if result is _FAILED:
+            self._count(key, collapsed=False)
+            return await func()
+        self._count(key, collapsed=True)
+        return result
+
+    def _count(self, key, collapsed):
+        group = key[:2]
+        with self._lock:
+            counts = self._metrics.get(group)
+            if counts is None:
+                counts = self._metrics[group] = {'calls': 0, 'collapsed': 0}
+            counts['calls'] += 1
+            if collapsed:
+                counts['collapsed'] += 1
+
+    def metrics(self):
+        """
+        Return a snapshot of the calls made, the ones that got the result of
+        another call, and ``collapse_ratio``, the ratio of the two.
+        """
+        with self._lock:
+            by_action = {group: dict(counts) for group, counts in self._metrics.items()}
+            in_flight = len(self._calls) + len(self._async_calls)
+        calls = sum(counts['calls'] for counts in by_action.values())
+        collapsed = sum(counts['collapsed'] for counts in by_action.values())
+        return {
+            'calls': calls,
+            'collapsed': collapsed,
+            'in_flight': in_flight,
+            'collapse_ratio': collapsed / calls if calls else 0.0,
+            'by_action': by_action,
+        }
+
+    def reset_metrics(self):
+        """Reset the counters of ``metrics()``."""
+        with self._lock:
+            self._metrics = {}
+
+
+#: The group collapsing the calls of the ``singleflight_actions`` of services.
+group = SingleFlight()
@@ -16,18 +16,29 @@ setup(
     author='Shipeng Feng',
     author_email='fsp261@gmail.com',
     packages=find_packages(),
-    install_requires=[],
-    python_requires=">=3.6",
+    install_requires=[
+        'Django>=4.2',
+        'djangorestframework>=3.10.0',
+        'grpcio>=1.16.0',
+        'protobuf>=6.33.0',
+    ],
+    python_requires=">=3.9",
     zip_safe=False,
     classifiers=[
         'Development Status :: 4 - Beta',
+        'Framework :: Django',
+        'Framework :: Django :: 4.2',
+        'Framework :: Django :: 5.0',
+        'Framework :: Django :: 5.1',
+        'Framework :: Django :: 5.2',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: Apache Software License',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Programming Language :: Python :: 3.13',
         'Programming Language :: Python :: 3 :: Only',
     ],
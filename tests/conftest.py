@@ -0,0 +1,48 @@
+import django
+from django.conf import settings
+from django.test.utils import (
+    setup_databases, setup_test_environment, teardown_databases,
+    teardown_test_environment,
+)
+
+
+def pytest_configure(config):
+    settings.configure(
+        DEBUG_PROPAGATE_EXCEPTIONS=True,
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            },
+            # Read replicas, sharing the connection of the default database.
+            'replica1': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+                'TEST': {'MIRROR': 'default'},
+            },
+            'replica2': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+                'TEST': {'MIRROR': 'default'},
+            },
+        },
+        SECRET_KEY='not very secret in tests',
+        USE_TZ=True,
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'django.contrib.auth',
+            'django_grpc_framework',
+            'testapp',
+        ],
+        GRPC_FRAMEWORK={
+            'ROOT_HANDLERS_HOOK': 'testapp.handlers.grpc_handlers',
+        },
+    )
+    django.setup()
+    setup_test_environment()
+    config._old_databases = setup_databases(verbosity=0, interactive=False)
+
+
+def pytest_unconfigure(config):
+    teardown_databases(config._old_databases, verbosity=0)
+    teardown_test_environment()
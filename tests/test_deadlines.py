@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import grpc
+from django.db import connection
+from django.test import TestCase
+
+from django_grpc_framework.services import Service
+from django_grpc_framework.test import FakeContext, FakeRpcError
+
+
+COUNT_SQL = (
+    'WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < %s) '
+    'SELECT COUNT(*) FROM n'
+)
+
+
+class CountService(Service):
+    calls = 0
+
+    def Count(self, request, context):
+        CountService.calls += 1
+        with connection.cursor() as cursor:
+            cursor.execute(COUNT_SQL, [request])
+            return cursor.fetchone()[0], len(connection.execute_wrappers)
+
+    async def AsyncCount(self, request, context):
+        CountService.calls += 1
+        return request
+
+
+class DeadlineTest(TestCase):
+    def setUp(self):
+        CountService.calls = 0
+
+    def test_statement_interrupted(self):
+        servicer = CountService.as_servicer()
+        start = time.monotonic()
+        with self.assertRaises(FakeRpcError) as cm:
+            servicer.Count(10 ** 9, FakeContext(timeout=0.05))
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.DEADLINE_EXCEEDED)
+        self.assertLess(time.monotonic() - start, 2)
+        # The timeout is removed with the call.
+        self.assertEqual(connection.execute_wrappers, [])
+        self.assertEqual(servicer.Count(10 ** 5, FakeContext()), (10 ** 5, 0))
+        self.assertEqual(servicer.Count(10, FakeContext(timeout=10)), (10, 1))
+
+    def test_spent_deadline(self):
+        servicer = CountService.as_servicer()
+        for call in [
+            lambda: servicer.Count(10, FakeContext(timeout=0)),
+            lambda: asyncio.run(servicer.AsyncCount(10, FakeContext(timeout=0))),
+        ]:
+            with self.assertRaises(FakeRpcError) as cm:
+                call()
+            self.assertEqual(cm.exception.code(), grpc.StatusCode.DEADLINE_EXCEEDED)
+        self.assertEqual(CountService.calls, 0)
+        servicer = CountService.as_servicer(propagate_deadlines=False)
+        self.assertEqual(servicer.Count(10, FakeContext(timeout=0)), (10, 0))
@@ -0,0 +1,111 @@
+import grpc
+from django.test import TestCase
+
+from django_grpc_framework import filters
+from django_grpc_framework.test import FakeContext, FakeRpcError
+from testapp import posts_pb2
+from testapp.models import Author, Post
+from testapp.services import NumberedPostService
+
+
+class FilteredPostService(NumberedPostService):
+    filter_backends = [filters.ExpressionFilterBackend]
+    filter_fields = ['id', 'title', 'views', 'is_public', 'published', 'author.name']
+
+
+class ParseFilterTest(TestCase):
+    def test_precedence(self):
+        node, fields = filters.parse_filter('a = 1 b = 2 OR c = 3')
+        self.assertEqual(node, ('and', (
+            ('cmp', 'a', '=', 1),
+            ('or', (('cmp', 'b', '=', 2), ('cmp', 'c', '=', 3))),
+        )))
+        self.assertEqual(fields, {'a', 'b', 'c'})
+        node, fields = filters.parse_filter('NOT (a = 1 AND -b : x)')
+        self.assertEqual(node, ('not', ('and', (
+            ('cmp', 'a', '=', 1), ('not', ('cmp', 'b', ':', 'x')),
+        ))))
+
+    def test_values(self):
+        for expression, value in [
+            ('a = "x y"', 'x y'), ("a = 'it\\'s'", "it's"), ('a = -1.5', -1.5),
+            ('a = 10', 10), ('a = true', True), ('a = null', None), ('a = word', 'word'),
+        ]:
+            node, fields = filters.parse_filter(expression)
+            self.assertEqual(node, ('cmp', 'a', '=', value), expression)
+        node, fields = filters.parse_filter('author.name = tom')
+        self.assertEqual(fields, {'author__name'})
+
+    def test_errors(self):
+        for expression in [
+            '', 'a', 'a =', '= 1', '(a = 1', 'a = 1)', 'a < null', 'AND = 1',
+            'a = 1 OR', 'a ~ 1', '(' * 40 + 'a = 1' + ')' * 40,
+        ]:
+            with self.assertRaises(filters.InvalidFilter, msg=expression):
+                filters.parse_filter(expression)
+
+    def test_parse_order_by(self):
+        self.assertEqual(
+            filters.parse_order_by('views desc, author.name'),
+            (('views', True), ('author__name', False)),
+        )
+        for order_by in ['views down', 'a b c', 'views,,title', '1views']:
+            with self.assertRaises(filters.InvalidFilter, msg=order_by):
+                filters.parse_order_by(order_by)
+
+    def test_uses_index(self):
+        for expression, expected in [
+            ('id = 1', True), ('views = 1', False), ('author.name = tom', False),
+            ('id > 1 views = 1', True), ('id = 1 OR views = 1', False),
+            ('NOT id = 1', False), ('id != 1', False),
+        ]:
+            node, fields = filters.parse_filter(expression)
+            self.assertEqual(filters.uses_index(node, Post), expected, expression)
+        self.assertTrue(filters.is_indexed(Post, 'author'))
+        self.assertTrue(filters.is_indexed(Post, 'tags__name'))
+
+
+class ExpressionFilterBackendTest(TestCase):
+    def setUp(self):
+        tom = Author.objects.create(name='tom')
+        amy = Author.objects.create(name='amy')
+        self.posts = [
+            Post.objects.create(
+                title='post %d' % i, author=tom if i % 2 else amy,
+                views=i, is_public=i % 3 != 0,
+            )
+            for i in range(8)
+        ]
+
+    def list(self, service=FilteredPostService, **kwargs):
+        response = service.as_servicer().List(
+            posts_pb2.ListNumberedPostsRequest(**kwargs), FakeContext(),
+        )
+        return [post.id for post in response.results]
+
+    def test_filter(self):
+        ids = self.list(filter='views >= 2 (author.name = tom OR NOT is_public = true) views < 7')
+        expected = [
+            p.pk for p in self.posts
+            if 2 <= p.views < 7 and (p.author.name == 'tom' or not p.is_public)
+        ]
+        self.assertEqual(ids, expected)
+        self.assertEqual(self.list(filter='title : "t 5"'), [self.posts[5].pk])
+        self.assertEqual(self.list(filter='published = null views = 1'), [self.posts[1].pk])
+
+    def test_invalid_filters(self):
+        for expression in ['views >', 'content = x', 'views = "many"']:
+            with self.assertRaises(FakeRpcError, msg=expression) as cm:
+                self.list(filter=expression)
+            self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+    def test_require_index(self):
+        class IndexedPostService(FilteredPostService):
+            require_index = True
+
+        self.assertEqual(self.list(IndexedPostService, filter='id = %d' % self.posts[1].pk),
+                         [self.posts[1].pk])
+        for kwargs in [{'filter': 'views = 1'}, {'order_by': 'views'}]:
+            with self.assertRaises(FakeRpcError, msg=kwargs) as cm:
+                self.list(IndexedPostService, **kwargs)
+            self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
@@ -0,0 +1,521 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest import mock
+
+import django
+import grpc
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TransactionTestCase, override_settings
+
+from django_grpc_framework import caching, hooks, loaders
+from django_grpc_framework.protobuf.raw import RawMessage, RawMessageServer
+from django_grpc_framework.test import FakeContext, FakeRpcError, FakeServer, RPCTestCase
+from testapp import posts_pb2, posts_pb2_grpc
+from testapp.models import Author, Post, Tag
+from testapp.services import AsyncPostService, PostService
+
+
+class ModelServiceTest(RPCTestCase):
+    def setUp(self):
+        super().setUp()
+        self.author = Author.objects.create(name='tom')
+        self.stub = posts_pb2_grpc.PostControllerStub(self.channel)
+
+    def test_create(self):
+        tag = Tag.objects.create(name='django')
+        response = self.stub.Create(posts_pb2.Post(
+            title='hello', author=self.author.pk, tags=[tag.pk], price='1.50',
+        ))
+        post = Post.objects.get()
+        self.assertEqual(response.id, post.pk)
+        self.assertEqual(response.price, '1.50')
+        self.assertEqual(list(response.tags), [tag.pk])
+        self.assertEqual(post.price, Decimal('1.50'))
+
+    def test_list_and_retrieve(self):
+        posts = [
+            Post.objects.create(title='post %d' % i, author=self.author)
+            for i in range(3)
+        ]
+        response = list(self.stub.List(posts_pb2.PostListRequest()))
+        self.assertEqual([m.id for m in response], [p.pk for p in posts])
+        response = self.stub.Retrieve(posts_pb2.PostRetrieveRequest(id=posts[1].pk))
+        self.assertEqual(response.title, 'post 1')
+
+    def test_stream_keeps_connections(self):
+        Post.objects.create(title='hello', author=self.author)
+        with mock.patch.object(hooks, 'close_old_connections') as close_old_connections:
+            responses = self.stub.List(posts_pb2.PostListRequest())
+            other = self.stub.List(posts_pb2.PostListRequest())
+            next(other)
+            # Ending one stream keeps housekeeping off for the other one.
+            self.assertEqual(len(list(responses)), 1)
+            self.assertEqual(list(other), [])
+        close_old_connections.assert_not_called()
+
+    def test_list_stops_when_cancelled(self):
+        for i in range(5):
+            Post.objects.create(title='post %d' % i, author=self.author)
+        context = FakeContext()
+        queries = []
+        with connection.execute_wrapper(
+                lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+            with override_settings(GRPC_FRAMEWORK={
+                    'ROOT_HANDLERS_HOOK': 'testapp.handlers.grpc_handlers',
+                    'LIST_CHUNK_SIZE': 2}):
+                servicer = PostService.as_servicer(optimize_queryset=True)
+                responses = servicer.List(posts_pb2.PostListRequest(), context)
+                titles = [next(responses).title, next(responses).title]
+            context.cancel()
+            titles += [message.title for message in responses]
+        self.assertEqual(titles, ['post 0', 'post 1'])
+        # The posts, and the tags of the first chunk.
+        self.assertEqual(len(queries), 2)
+        responses = PostService.as_servicer(list_chunk_size=2, propagate_deadlines=False).List(
+            posts_pb2.PostListRequest(), FakeContext(timeout=0),
+        )
+        self.assertEqual(len(list(responses)), 2)
+
+    def test_list_stops_past_deadline_without_is_active(self):
+        # Like the contexts of the sync handlers of grpc.aio servers.
+        class SyncServicerContext:
+            remaining = 10
+
+            def time_remaining(self):
+                return self.remaining
+
+        for i in range(5):
+            Post.objects.create(title='post %d' % i, author=self.author)
+        context = SyncServicerContext()
+        servicer = PostService.as_servicer(list_chunk_size=2, propagate_deadlines=False)
+        responses = servicer.List(posts_pb2.PostListRequest(), context)
+        titles = [next(responses).title]
+        context.remaining = 0
+        titles += [message.title for message in responses]
+        self.assertEqual(titles, ['post 0', 'post 1'])
+
+    def test_retrieve_not_found(self):
+        with self.assertRaises(FakeRpcError) as cm:
+            self.stub.Retrieve(posts_pb2.PostRetrieveRequest(id=404))
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.NOT_FOUND)
+
+    def test_cache_retrieve(self):
+        cache.clear()
+        caching.reset_metrics()
+        post = Post.objects.create(title='hello', author=self.author)
+        servicer = PostService.as_servicer(cache_retrieve=True)
+        request = posts_pb2.PostRetrieveRequest(id=post.pk)
+        queries = []
+        with connection.execute_wrapper(
+                lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+            self.assertEqual(servicer.Retrieve(request, FakeContext()).title, 'hello')
+            queries.clear()
+            self.assertEqual(servicer.Retrieve(request, FakeContext()).title, 'hello')
+            self.assertEqual(queries, [])
+        post.title = 'bye'
+        post.save()
+        self.assertEqual(servicer.Retrieve(request, FakeContext()).title, 'bye')
+        post.delete()
+        with self.assertRaises(FakeRpcError) as cm:
+            servicer.Retrieve(request, FakeContext())
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.NOT_FOUND)
+        self.assertEqual(
+            caching.metrics()['by_service'][PostService], {'hits': 1, 'misses': 3},
+        )
+
+    def test_cache_retrieve_scoped_by_queryset(self):
+        cache.clear()
+        post = Post.objects.create(title='private', author=self.author)
+        request = posts_pb2.PostRetrieveRequest(id=post.pk)
+        admin = PostService.as_servicer(cache_retrieve=True)
+        public = PostService.as_servicer(
+            cache_retrieve=True, queryset=Post.objects.filter(title='public'),
+        )
+
+        class RequestPostService(PostService):
+            def get_queryset(self):
+                return super().get_queryset().filter(title='public')
+
+        request_public = RequestPostService.as_servicer(cache_retrieve=True)
+        self.assertEqual(admin.Retrieve(request, FakeContext()).title, 'private')
+        for servicer in [public, request_public]:
+            with self.assertRaises(FakeRpcError) as cm:
+                servicer.Retrieve(request, FakeContext())
+            self.assertEqual(cm.exception.code(), grpc.StatusCode.NOT_FOUND)
+
+    def test_cache_retrieve_hit_skips_queryset(self):
+        cache.clear()
+        post = Post.objects.create(title='hello', author=self.author)
+        request = posts_pb2.PostRetrieveRequest(id=post.pk)
+        servicer = PostService.as_servicer(cache_retrieve=True, optimize_queryset=True)
+        servicer.Retrieve(request, FakeContext())
+        with mock.patch.object(PostService, 'get_queryset') as get_queryset, \
+                mock.patch.object(PostService, 'get_serializer') as get_serializer:
+            self.assertEqual(servicer.Retrieve(request, FakeContext()).title, 'hello')
+        get_queryset.assert_not_called()
+        get_serializer.assert_not_called()
+
+    def test_cache_retrieve_invalidated_while_computed(self):
+        cache.clear()
+        post = Post.objects.create(title='hello', author=self.author)
+        servicer = PostService.as_servicer(cache_retrieve=True)
+        request = posts_pb2.PostRetrieveRequest(id=post.pk)
+        get_object = PostService.get_object
+
+        def racing_get_object(service):
+            instance = get_object(service)
+            # Saved after the row was read, before its message is cached.
+            Post.objects.filter(pk=post.pk).update(title='bye')
+            Post.objects.get(pk=post.pk).save()
+            return instance
+
+        with mock.patch.object(PostService, 'get_object', racing_get_object):
+            self.assertEqual(servicer.Retrieve(request, FakeContext()).title, 'hello')
+        self.assertEqual(servicer.Retrieve(request, FakeContext()).title, 'bye')
+
+    def test_cache_retrieve_raw(self):
+        cache.clear()
+        post = Post.objects.create(title='hello', author=self.author)
+        server = FakeServer()
+        posts_pb2_grpc.add_PostControllerServicer_to_server(
+            PostService.as_servicer(cache_retrieve=True), RawMessageServer(server),
+        )
+        handler = server._find_method_handler('/testapp.PostController/Retrieve')
+        request = posts_pb2.PostRetrieveRequest(id=post.pk)
+        message = handler.unary_unary(request, FakeContext())
+        self.assertIsInstance(message, posts_pb2.Post)
+        raw = handler.unary_unary(request, FakeContext())
+        self.assertIsInstance(raw, RawMessage)
+        self.assertEqual(handler.response_serializer(raw), message.SerializeToString())
+        self.assertEqual(handler.response_serializer(message), message.SerializeToString())
+        # The test channel parses raw messages like a real one.
+        self.channel.server = server
+        stub = posts_pb2_grpc.PostControllerStub(self.channel)
+        self.assertEqual(stub.Retrieve(request), message)
+
+    def test_batch_retrieve(self):
+        posts = [Post.objects.create(title='post %d' % i, author=self.author) for i in range(4)]
+        ids = [posts[2].pk, 404, posts[0].pk, posts[2].pk, 405]
+        queries = []
+        with connection.execute_wrapper(
+                lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+            servicer = PostService.as_servicer(optimize_queryset=True)
+            response = servicer.BatchRetrieve(
+                posts_pb2.PostBatchRetrieveRequest(id=ids), FakeContext(),
+            )
+        self.assertEqual(
+            [m.title for m in response.results], ['post 2', 'post 0', 'post 2'],
+        )
+        self.assertEqual(list(response.missing), [404, 405])
+        # The posts, and their tags.
+        self.assertEqual(len(queries), 2)
+        with self.assertRaises(FakeRpcError) as cm:
+            PostService.as_servicer(batch_retrieve_max_size=2).BatchRetrieve(
+                posts_pb2.PostBatchRetrieveRequest(id=ids), FakeContext(),
+            )
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+    def test_bulk_create(self):
+        tags = [Tag.objects.create(name=name) for name in ('a', 'b')]
+        messages = [
+            posts_pb2.Post(
+                title='post %d' % i, author=self.author.pk, tags=[t.pk for t in tags[:i]],
+            )
+            for i in range(3)
+        ]
+        messages[1:1] = [
+            posts_pb2.Post(author=self.author.pk), posts_pb2.Post(title='x', author=404),
+        ]
+        inserts = []
+        with connection.execute_wrapper(
+                lambda execute, sql, *args: (sql.startswith('INSERT') and inserts.append(sql))
+                or execute(sql, *args)):
+            servicer = PostService.as_servicer(bulk_create_batch_size=2)
+            response = servicer.BulkCreate(iter(messages), FakeContext())
+        self.assertEqual((response.created, response.failed), (3, 2))
+        self.assertEqual([error.index for error in response.errors], [1, 2])
+        self.assertIn('title', response.errors[0].details)
+        # The posts of three batches, and the tags of the last two.
+        self.assertEqual(len(inserts), 5)
+        posts = Post.objects.order_by('pk')
+        self.assertEqual([p.title for p in posts], ['post 0', 'post 1', 'post 2'])
+        self.assertEqual([p.tags.count() for p in posts], [0, 1, 2])
+
+    def test_bulk_update(self):
+        tags = [Tag.objects.create(name=name) for name in ('a', 'b')]
+        posts = [
+            Post.objects.create(title='post %d' % i, author=self.author, views=i)
+            for i in range(4)
+        ]
+        posts[0].tags.set(tags)
+        messages = [
+            posts_pb2.Post(
+                id=post.pk, title=post.title, author=self.author.pk, price='0.00',
+                views=post.views * 10, is_public=True, tags=[tags[0].pk],
+            )
+            for post in posts
+        ]
+        messages[2].title = ''
+        messages.append(posts_pb2.Post(id=404, title='x', author=self.author.pk))
+        queries = []
+        with connection.execute_wrapper(
+                lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+            servicer = PostService.as_servicer(bulk_update_batch_size=10)
+            response = servicer.BulkUpdate(iter(messages), FakeContext())
+        self.assertEqual((response.updated, response.failed), (3, 2))
+        self.assertEqual([error.index for error in response.errors], [2, 4])
+        self.assertIn('not found', response.errors[1].details)
+        self.assertEqual(sum(sql.startswith('UPDATE') for sql in queries), 1)
+        self.assertEqual(
+            [(p.views, [t.name for t in p.tags.all()]) for p in Post.objects.order_by('pk')],
+            [(0, ['a']), (10, ['a']), (2, []), (30, ['a'])],
+        )
+
+    def test_bulk_update_sends_signals_to_receivers(self):
+        post = Post.objects.create(title='post', author=self.author)
+        saved = []
+
+        def receiver(sender, instance, update_fields, **kwargs):
+            saved.append((instance.pk, sorted(update_fields)))
+
+        post_save.connect(receiver, sender=Post)
+        try:
+            PostService.as_servicer().BulkUpdate(iter([posts_pb2.Post(
+                id=post.pk, title='renamed', author=self.author.pk, price='0.00',
+                is_public=True,
+            )]), FakeContext())
+        finally:
+            post_save.disconnect(receiver, sender=Post)
+        self.assertEqual(saved, [(post.pk, ['title'])])
+
+    def test_bulk_destroy(self):
+        posts = [Post.objects.create(title='post %d' % i, author=self.author) for i in range(5)]
+        requests = [posts_pb2.PostRetrieveRequest(id=post.pk) for post in posts[:3]]
+        requests.insert(1, posts_pb2.PostRetrieveRequest(id=404))
+        servicer = PostService.as_servicer(bulk_destroy_batch_size=2)
+        response = servicer.BulkDestroy(iter(requests), FakeContext())
+        self.assertEqual((response.deleted, response.failed), (3, 1))
+        self.assertEqual([error.index for error in response.errors], [1])
+        self.assertEqual(list(Post.objects.order_by('pk')), posts[3:])
+
+    def test_bulk_invalid_lookup_values(self):
+        posts = [Post.objects.create(title='post %d' % i, author=self.author) for i in range(2)]
+        to_python = Post._meta.pk.to_python
+
+        def strict_to_python(value):
+            # Like a UUID primary key given a malformed value.
+            if value < 0:
+                raise ValidationError('invalid')
+            return to_python(value)
+
+        servicer = PostService.as_servicer()
+        with mock.patch.object(Post._meta.pk, 'to_python', strict_to_python), \
+                mock.patch.object(Post._meta.pk, 'get_prep_value', strict_to_python):
+            response = servicer.BatchRetrieve(
+                posts_pb2.PostBatchRetrieveRequest(id=[posts[0].pk, -1]), FakeContext(),
+            )
+            self.assertEqual([m.id for m in response.results], [posts[0].pk])
+            self.assertEqual(list(response.missing), [-1])
+            response = servicer.BulkUpdate(iter([
+                posts_pb2.Post(id=-1, title='bad'),
+                posts_pb2.Post(id=posts[0].pk, title='updated', author=self.author.pk),
+            ]), FakeContext())
+            self.assertEqual((response.updated, response.failed), (1, 1))
+            self.assertEqual(response.errors[0].details, 'Post: -1 not found!')
+            response = servicer.BulkDestroy(iter([
+                posts_pb2.PostRetrieveRequest(id=-1),
+                posts_pb2.PostRetrieveRequest(id=posts[1].pk),
+            ]), FakeContext())
+            self.assertEqual((response.deleted, response.failed), (1, 1))
+            self.assertEqual([error.index for error in response.errors], [0])
+        self.assertEqual(list(Post.objects.values_list('title', flat=True)), ['updated'])
+
+    def test_optimize_queryset(self):
+        tags = [Tag.objects.create(name=name) for name in ('a', 'b')]
+        for i in range(3):
+            Post.objects.create(title='post %d' % i, author=self.author).tags.set(tags)
+        request = posts_pb2.PostListRequest()
+        # The handlers reset the queries log, count the executed queries.
+        queries = []
+        with connection.execute_wrapper(
+                lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+            list(PostService.as_servicer().List(request, FakeContext()))
+            self.assertEqual(len(queries), 4)
+            queries.clear()
+            servicer = PostService.as_servicer(optimize_queryset=True)
+            response = list(servicer.List(request, FakeContext()))
+            self.assertEqual(len(queries), 2)
+        self.assertEqual([list(m.tags) for m in response], [[t.pk for t in tags]] * 3)
+
+
+class AsyncModelServiceTest(TransactionTestCase):
+    def setUp(self):
+        self.author = Author.objects.create(name='tom')
+        self.servicer = AsyncPostService.as_servicer()
+
+    def call(self, action, request):
+        return asyncio.run(getattr(self.servicer, action)(request, FakeContext()))
+
+    def test_create(self):
+        tag = Tag.objects.create(name='django')
+        response = self.call('Create', posts_pb2.Post(
+            title='hello', author=self.author.pk, tags=[tag.pk], views=2 ** 40,
+        ))
+        post = Post.objects.get()
+        self.assertEqual(response.id, post.pk)
+        self.assertEqual(response.views, 2 ** 40)
+        self.assertEqual(list(post.tags.all()), [tag])
+
+    def test_retrieve_update_destroy(self):
+        post = Post.objects.create(title='hello', author=self.author)
+        response = self.call('Retrieve', posts_pb2.PostRetrieveRequest(id=post.pk))
+        self.assertEqual(response.title, 'hello')
+        response = self.call('PartialUpdate', posts_pb2.Post(id=post.pk, title='bye'))
+        self.assertEqual(response.title, 'bye')
+        post.refresh_from_db()
+        self.assertEqual(post.title, 'bye')
+        self.call('Destroy', posts_pb2.Post(id=post.pk))
+        self.assertFalse(Post.objects.exists())
+
+    def test_retrieve_not_found(self):
+        with self.assertRaises(FakeRpcError) as cm:
+            self.call('Retrieve', posts_pb2.PostRetrieveRequest(id=404))
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.NOT_FOUND)
+
+    def test_cache_retrieve(self):
+        cache.clear()
+        post = Post.objects.create(title='hello', author=self.author)
+        servicer = AsyncPostService.as_servicer(cache_retrieve=True)
+        request = posts_pb2.PostRetrieveRequest(id=post.pk)
+        self.assertEqual(asyncio.run(servicer.Retrieve(request, FakeContext())).title, 'hello')
+        # QuerySet.update() sends no signal, the cached message is returned.
+        Post.objects.filter(pk=post.pk).update(title='updated')
+        self.assertEqual(asyncio.run(servicer.Retrieve(request, FakeContext())).title, 'hello')
+        post.title = 'saved'
+        post.save()
+        self.assertEqual(asyncio.run(servicer.Retrieve(request, FakeContext())).title, 'saved')
+
+    def test_coalesced_retrieve(self):
+        posts = [Post.objects.create(title='post %d' % i, author=self.author) for i in range(3)]
+        servicer = AsyncPostService.as_servicer(coalesce_lookups=True)
+
+        async def retrieve(pk):
+            try:
+                response = await servicer.Retrieve(
+                    posts_pb2.PostRetrieveRequest(id=pk), FakeContext(),
+                )
+                return response.title
+            except FakeRpcError as exc:
+                return exc.code()
+
+        async def retrieve_all(ids):
+            return await asyncio.gather(*[retrieve(pk) for pk in ids])
+
+        ids = [posts[2].pk, 404, posts[0].pk, posts[2].pk]
+        with mock.patch.object(
+                loaders.ObjectLoader, 'fetch', autospec=True,
+                side_effect=loaders.ObjectLoader.fetch) as fetch:
+            titles = asyncio.run(retrieve_all(ids))
+        self.assertEqual(titles, ['post 2', grpc.StatusCode.NOT_FOUND, 'post 0', 'post 2'])
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(sorted(fetch.call_args[0][2]), sorted({posts[0].pk, posts[2].pk, 404}))
+
+    def test_coalesced_retrieve_by_queryset(self):
+        hidden = Post.objects.create(title='hidden', author=self.author, is_public=False)
+        public = AsyncPostService.as_servicer(
+            coalesce_lookups=True, queryset=Post.objects.filter(is_public=True),
+        )
+        admin = AsyncPostService.as_servicer(coalesce_lookups=True)
+
+        async def retrieve(servicer):
+            try:
+                response = await servicer.Retrieve(
+                    posts_pb2.PostRetrieveRequest(id=hidden.pk), FakeContext(),
+                )
+                return response.title
+            except FakeRpcError as exc:
+                return exc.code()
+
+        async def retrieve_all(servicers):
+            return await asyncio.gather(*[retrieve(servicer) for servicer in servicers])
+
+        self.assertEqual(
+            asyncio.run(retrieve_all([public, admin])),
+            [grpc.StatusCode.NOT_FOUND, 'hidden'],
+        )
+        self.assertEqual(
+            asyncio.run(retrieve_all([admin, public])),
+            ['hidden', grpc.StatusCode.NOT_FOUND],
+        )
+
+    def test_list(self):
+        posts = [
+            Post.objects.create(title='post %d' % i, author=self.author)
+            for i in range(5)
+        ]
+
+        async def collect():
+            servicer = AsyncPostService.as_servicer(list_chunk_size=2)
+            return [
+                message async for message in
+                servicer.List(posts_pb2.PostListRequest(), FakeContext())
+            ]
+
+        response = asyncio.run(collect())
+        self.assertEqual([m.id for m in response], [p.pk for p in posts])
+
+    def test_list_prefetch(self):
+        tags = [Tag.objects.create(name='tag %d' % i) for i in range(2)]
+        posts = [
+            Post.objects.create(title='post %d' % i, author=self.author)
+            for i in range(5)
+        ]
+        for post in posts:
+            post.tags.set(tags)
+
+        async def collect():
+            servicer = AsyncPostService.as_servicer(list_chunk_size=2, optimize_queryset=True)
+            return [
+                message async for message in
+                servicer.List(posts_pb2.PostListRequest(), FakeContext())
+            ]
+
+        # Django 4.2 cannot prefetch from aiterator().
+        for version in [django.VERSION, (4, 2, 0, 'final', 0)]:
+            with self.subTest(version=version), mock.patch('django.VERSION', version):
+                response = asyncio.run(collect())
+                self.assertEqual([m.id for m in response], [p.pk for p in posts])
+                self.assertEqual(
+                    [list(m.tags) for m in response], [[t.pk for t in tags]] * 5,
+                )
+
+
+class AioServerTest(TransactionTestCase):
+    def serve(self, servicer, calls):
+        async def run():
+            server = grpc.aio.server(migration_thread_pool=ThreadPoolExecutor(max_workers=2))
+            posts_pb2_grpc.add_PostControllerServicer_to_server(servicer, server)
+            port = server.add_insecure_port('127.0.0.1:0')
+            await server.start()
+            try:
+                async with grpc.aio.insecure_channel('127.0.0.1:%d' % port) as channel:
+                    return await calls(posts_pb2_grpc.PostControllerStub(channel))
+            finally:
+                await server.stop(None)
+        return asyncio.run(run())
+
+    def test_list_sync_handler(self):
+        # The contexts given to the sync handlers have no is_active().
+        author = Author.objects.create(name='tom')
+        posts = [Post.objects.create(title='post %d' % i, author=author) for i in range(5)]
+        servicer = PostService.as_servicer(list_chunk_size=2)
+
+        async def calls(stub):
+            return [m async for m in stub.List(posts_pb2.PostListRequest(), timeout=10)]
+
+        response = self.serve(servicer, calls)
+        self.assertEqual([m.id for m in response], [p.pk for p in posts])
@@ -0,0 +1,116 @@
+import os
+import select
+import signal
+import subprocess
+import sys
+import time
+
+
+# Runs the master of ``grpcrunserver --workers 2``, with workers printing
+# their pid and waiting for a signal instead of serving.
+MASTER = r'''
+import os
+import signal
+
+import django
+from django.conf import settings
+
+settings.configure(GRPC_FRAMEWORK={'ROOT_HANDLERS_HOOK': 'os.getpid'})
+django.setup()
+
+from django_grpc_framework.management.commands.grpcrunserver import Command
+
+
+def serve(self):
+    # One write, the lines of the workers are not interleaved.
+    os.write(1, b'%d\n' % os.getpid())
+    while True:
+        signal.pause()
+
+
+Command.serve = serve
+command = Command()
+command.workers = 2
+command.grace = 1
+command.is_worker = False
+command.serve_forked()
+'''
+
+
+class Master:
+    """The master process, reading the pids of its workers unbuffered."""
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, '-c', MASTER], stdout=subprocess.PIPE,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            # The workers are in the process group of the master.
+            start_new_session=True,
+        )
+        self.fd = self.process.stdout.fileno()
+        self.buffer = b''
+        self.workers = []
+
+    def read_worker(self, timeout=10):
+        deadline = time.monotonic() + timeout
+        while b'\n' not in self.buffer:
+            readable, _, _ = select.select(
+                [self.fd], [], [], max(deadline - time.monotonic(), 0),
+            )
+            assert readable, 'No worker started.'
+            self.buffer += os.read(self.fd, 1024)
+        line, self.buffer = self.buffer.split(b'\n', 1)
+        self.workers.append(int(line))
+        return self.workers[-1]
+
+    def close(self):
+        # Do not leave processes behind when a test failed.
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.process.wait()
+        self.process.stdout.close()
+
+
+def test_forked_workers():
+    master = Master()
+    try:
+        workers = {master.read_worker(), master.read_worker()}
+        killed = workers.pop()
+        os.kill(killed, signal.SIGKILL)
+        # The master restarts the worker that died.
+        respawned = master.read_worker()
+        assert respawned not in workers | {killed}
+        workers.add(respawned)
+        master.process.send_signal(signal.SIGTERM)
+        assert master.process.wait(timeout=10) == 0
+        for pid in workers:
+            # The master reaped the workers before exiting.
+            assert not _exists(pid)
+    finally:
+        master.close()
+
+
+def test_no_worker_forked_while_stopping():
+    master = Master()
+    try:
+        killed = master.read_worker()
+        master.read_worker()
+        # The master waits a second before restarting a worker that died
+        # right after starting, and is asked to stop meanwhile.
+        os.kill(killed, signal.SIGKILL)
+        time.sleep(0.2)
+        master.process.send_signal(signal.SIGTERM)
+        assert master.process.wait(timeout=4) == 0
+        assert len(master.workers) == 2
+        assert master.buffer == b'' and os.read(master.fd, 1024) == b''
+    finally:
+        master.close()
+
+
+def _exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
@@ -0,0 +1,124 @@
+import asyncio
+import datetime
+
+import grpc
+from django.core.cache import cache
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from django_grpc_framework.test import FakeContext, FakeRpcError, RPCTestCase
+from testapp import posts_pb2, posts_pb2_grpc
+from testapp.models import Author, Post
+from testapp.services import AsyncNumberedPostService
+
+
+class CursorPaginatedListTest(RPCTestCase):
+    def setUp(self):
+        super().setUp()
+        author = Author.objects.create(name='tom')
+        start = timezone.now()
+        self.posts = [
+            Post.objects.create(
+                title='post %d' % (i % 4), author=author, views=i % 3,
+                published=None if i % 5 == 0 else start + datetime.timedelta(microseconds=i),
+            )
+            for i in range(23)
+        ]
+        self.stub = posts_pb2_grpc.PagedPostControllerStub(self.channel)
+
+    def list_all(self, **kwargs):
+        ids, token, pages = [], '', 0
+        while True:
+            response = self.stub.List(posts_pb2.ListPostsRequest(page_token=token, **kwargs))
+            ids.extend(post.id for post in response.posts)
+            pages += 1
+            token = response.next_page_token
+            if not token:
+                return ids, pages
+
+    def test_pages(self):
+        ids, pages = self.list_all(page_size=5)
+        self.assertEqual(ids, [post.pk for post in self.posts])
+        self.assertEqual(pages, 5)
+
+    def test_order_by(self):
+        for order_by, key in [
+            ('views desc, title', lambda p: (-p.views, p.title, p.pk)),
+            ('title desc', lambda p: (tuple(-ord(c) for c in p.title), p.pk)),
+            ('published', lambda p: (p.published is None, p.published or 0, p.pk)),
+            ('published desc', lambda p: (
+                p.published is not None, -p.published.timestamp() if p.published else 0, p.pk,
+            )),
+        ]:
+            ids, pages = self.list_all(page_size=4, order_by=order_by)
+            expected = [post.pk for post in sorted(self.posts, key=key)]
+            self.assertEqual(ids, expected, order_by)
+
+    def test_page_size_is_clamped(self):
+        response = self.stub.List(posts_pb2.ListPostsRequest(page_size=5000))
+        self.assertEqual(len(response.posts), 23)
+        self.assertEqual(response.next_page_token, '')
+
+    def test_invalid_requests(self):
+        token = self.stub.List(posts_pb2.ListPostsRequest(page_size=2)).next_page_token
+        for request in [
+            posts_pb2.ListPostsRequest(page_size=-1),
+            posts_pb2.ListPostsRequest(order_by='secret'),
+            posts_pb2.ListPostsRequest(order_by='title sideways'),
+            posts_pb2.ListPostsRequest(page_token='garbage'),
+            posts_pb2.ListPostsRequest(page_token=token, order_by='title'),
+        ]:
+            with self.assertRaises(FakeRpcError) as cm:
+                self.stub.List(request)
+            self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+
+class PageNumberPaginatedListTest(RPCTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        author = Author.objects.create(name='tom')
+        self.posts = [
+            Post.objects.create(title='post %02d' % i, author=author, views=i % 2)
+            for i in range(12)
+        ]
+        self.stub = posts_pb2_grpc.NumberedPostControllerStub(self.channel)
+
+    def test_pages(self):
+        response = self.stub.List(posts_pb2.ListNumberedPostsRequest())
+        self.assertEqual([p.id for p in response.results], [p.pk for p in self.posts[:5]])
+        self.assertEqual((response.count, response.next_page, response.prev_page), (12, 2, 0))
+        response = self.stub.List(posts_pb2.ListNumberedPostsRequest(page=3))
+        self.assertEqual([p.id for p in response.results], [p.pk for p in self.posts[10:]])
+        self.assertEqual((response.count, response.next_page, response.prev_page), (12, 0, 2))
+        response = self.stub.List(posts_pb2.ListNumberedPostsRequest(
+            page=2, order_by='views desc, title desc',
+        ))
+        self.assertEqual([p.title for p in response.results], [
+            'post 01', 'post 10', 'post 08', 'post 06', 'post 04',
+        ])
+
+    def test_count_is_cached(self):
+        request = posts_pb2.ListNumberedPostsRequest(page=2)
+        self.assertEqual(self.stub.List(request).count, 12)
+        Post.objects.create(title='new', author=self.posts[0].author)
+        self.assertEqual(self.stub.List(request).count, 12)
+        cache.clear()
+        self.assertEqual(self.stub.List(request).count, 13)
+
+    def test_invalid_page(self):
+        with self.assertRaises(FakeRpcError) as cm:
+            self.stub.List(posts_pb2.ListNumberedPostsRequest(page=-1))
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+
+class AsyncPageNumberPaginatedListTest(TransactionTestCase):
+    def test_pages(self):
+        author = Author.objects.create(name='tom')
+        posts = [Post.objects.create(title='post', author=author) for i in range(7)]
+        servicer = AsyncNumberedPostService.as_servicer(count_cache_timeout=None)
+        response = asyncio.run(servicer.List(
+            posts_pb2.ListNumberedPostsRequest(page=2), FakeContext(),
+        ))
+        self.assertEqual([p.id for p in response.results], [p.pk for p in posts[5:]])
+        self.assertEqual((response.count, response.next_page, response.prev_page), (7, 0, 1))
@@ -0,0 +1,178 @@
+import datetime
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+from google.protobuf import descriptor_pb2
+from rest_framework import serializers
+
+from django_grpc_framework import proto_serializers
+from django_grpc_framework.protobuf.native import message_to_native
+from testapp import posts_pb2
+from testapp.models import Author, Post, Tag
+from testapp.serializers import CompiledPostProtoSerializer, PostProtoSerializer
+
+
+class CompiledModelProtoSerializerTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = Author.objects.create(name='tom')
+        tags = [Tag.objects.create(name=name) for name in ('a', 'b')]
+        cls.posts = [
+            Post.objects.create(
+                title='first', content='hello', author=author,
+                price=Decimal('12.50'), views=2 ** 40, is_public=False,
+                published=timezone.make_aware(datetime.datetime(2020, 1, 2, 3, 4, 5)),
+            ),
+            Post.objects.create(title='second', author=author),
+        ]
+        cls.posts[0].tags.set(tags)
+
+    def test_same_message_as_model_proto_serializer(self):
+        for post in self.posts:
+            self.assertEqual(
+                CompiledPostProtoSerializer(post).message,
+                PostProtoSerializer(post).message,
+            )
+        queryset = Post.objects.order_by('pk')
+        self.assertEqual(
+            CompiledPostProtoSerializer(queryset, many=True).message,
+            PostProtoSerializer(queryset, many=True).message,
+        )
+
+    def test_declared_fields(self):
+        class TitleSerializer(proto_serializers.CompiledModelProtoSerializer):
+            title = serializers.SerializerMethodField()
+            content = serializers.CharField(source='author.name')
+
+            class Meta:
+                model = Post
+                proto_class = posts_pb2.Post
+                fields = ['id', 'title', 'content', 'views']
+
+            def get_title(self, obj):
+                return obj.title.upper()
+
+        message = TitleSerializer(self.posts[0]).message
+        self.assertEqual(message.title, 'FIRST')
+        self.assertEqual(message.content, 'tom')
+        self.assertEqual(message.views, 2 ** 40)
+
+    def test_saved_instance(self):
+        serializer = CompiledPostProtoSerializer(message=posts_pb2.Post(
+            title='new', author=self.posts[0].author_id, price='3',
+        ))
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        self.assertEqual(serializer.message.id, serializer.instance.pk)
+        self.assertEqual(serializer.message.price, '3.00')
+
+
+class MessageToDataTest(TestCase):
+    def test_native_values(self):
+        message = posts_pb2.Post(
+            title='hello', author=1, tags=[1, 2], views=2 ** 40, is_public=True,
+        )
+        self.assertEqual(PostProtoSerializer().message_to_data(message), {
+            'title': 'hello', 'author': 1, 'tags': [1, 2], 'views': 2 ** 40,
+            'is_public': True,
+        })
+
+    def test_enums_and_nested_messages(self):
+        message = descriptor_pb2.DescriptorProto(name='Post', field=[
+            descriptor_pb2.FieldDescriptorProto(
+                name='views', number=1,
+                type=descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+            ),
+        ])
+        self.assertEqual(message_to_native(message), {
+            'name': 'Post',
+            'field': [{'name': 'views', 'number': 1, 'type': 'TYPE_INT64'}],
+        })
+
+    def test_trust_proto_types(self):
+        class TrustedPostProtoSerializer(PostProtoSerializer):
+            class Meta(PostProtoSerializer.Meta):
+                trust_proto_types = True
+
+        author = Author.objects.create(name='tom')
+        serializer = TrustedPostProtoSerializer(message=posts_pb2.Post(
+            title='new', author=author.pk, price='3', views=2 ** 40,
+            is_public=True,
+        ))
+        serializer.is_valid(raise_exception=True)
+        self.assertEqual(serializer.validated_data['views'], 2 ** 40)
+        self.assertIs(serializer.validated_data['is_public'], True)
+        serializer = TrustedPostProtoSerializer(data={
+            'title': 'new', 'author': author.pk, 'price': '3', 'views': '12',
+        })
+        serializer.is_valid(raise_exception=True)
+        self.assertEqual(serializer.validated_data['views'], 12)
+
+
+class FieldsCacheTest(TestCase):
+    def test_fields_are_built_once(self):
+        class TitleProtoSerializer(proto_serializers.ModelProtoSerializer):
+            class Meta:
+                model = Post
+                proto_class = posts_pb2.Post
+                fields = ['id', 'title', 'tags']
+
+        first, second = TitleProtoSerializer(), TitleProtoSerializer()
+        self.assertEqual(list(first.fields), ['id', 'title', 'tags'])
+        self.assertIsNot(first.fields['title'], second.fields['title'])
+        self.assertIs(first.fields['title'].parent, first)
+        self.assertIs(second.fields['tags'].child_relation.root, second)
+        self.assertIs(
+            first.fields['title'].__class__, second.fields['title'].__class__
+        )
+        TitleProtoSerializer.Meta.fields = ['id', 'content']
+        self.assertEqual(list(TitleProtoSerializer().fields), ['id', 'title', 'tags'])
+        TitleProtoSerializer.clear_fields_cache()
+        self.assertEqual(list(TitleProtoSerializer().fields), ['id', 'content'])
+
+    def test_fields_cache_key(self):
+        class ContextProtoSerializer(proto_serializers.ModelProtoSerializer):
+            class Meta:
+                model = Post
+                proto_class = posts_pb2.Post
+                fields = ['id', 'title']
+
+            def get_fields_cache_key(self):
+                return (self.Meta, self.context.get('read_only'))
+
+            def get_extra_kwargs(self):
+                return {'title': {'read_only': bool(self.context.get('read_only'))}}
+
+        self.assertFalse(ContextProtoSerializer().fields['title'].read_only)
+        serializer = ContextProtoSerializer(context={'read_only': True})
+        self.assertTrue(serializer.fields['title'].read_only)
+
+
+class IterMessageTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = Author.objects.create(name='tom')
+        Post.objects.bulk_create(
+            Post(title='post %d' % i, author=author) for i in range(5)
+        )
+
+    def test_iter_message_chunks(self):
+        expected = PostProtoSerializer(Post.objects.order_by('pk'), many=True).message
+        queryset = Post.objects.order_by('pk')
+        for serializer_class in (PostProtoSerializer, CompiledPostProtoSerializer):
+            serializer = serializer_class(queryset, many=True)
+            chunks = list(serializer.iter_message_chunks(chunk_size=2))
+            self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+            self.assertEqual(sum(chunks, []), expected)
+            self.assertFalse(hasattr(serializer, '_data'))
+            self.assertIsNone(queryset._result_cache)
+
+    def test_iter_message(self):
+        posts = list(Post.objects.order_by('pk'))
+        serializer = PostProtoSerializer(posts, many=True)
+        with self.assertNumQueries(5):
+            messages = list(serializer.iter_message())
+        self.assertEqual([message.title for message in messages], [
+            'post %d' % i for i in range(5)
+        ])
@@ -0,0 +1,81 @@
+import time
+
+from django.db import connections
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from django_grpc_framework import routing
+from django_grpc_framework.test import FakeContext
+from testapp import posts_pb2
+from testapp.models import Author, Post
+from testapp.services import PostService
+
+
+class ReplicaBalancerTest(TestCase):
+    def test_round_robin(self):
+        balancer = routing.ReplicaBalancer()
+        aliases = ('a', 'b', 'c')
+        chosen = [balancer.choose(aliases) for _ in range(4)]
+        self.assertEqual(chosen, ['a', 'b', 'c', 'a'])
+        self.assertEqual(balancer.in_flight(), {'a': 2, 'b': 1, 'c': 1})
+        for alias in chosen:
+            balancer.release(alias)
+        self.assertEqual(balancer.in_flight(), {})
+
+    def test_least_connections(self):
+        balancer = routing.ReplicaBalancer()
+        aliases = ('a', 'b')
+        self.assertEqual(balancer.choose(aliases, 'least_connections'), 'a')
+        self.assertEqual(balancer.choose(aliases, 'least_connections'), 'b')
+        balancer.release('a')
+        self.assertEqual(balancer.choose(aliases, 'least_connections'), 'a')
+        with self.assertRaises(ValueError):
+            balancer.choose(aliases, 'random')
+
+
+class ReadReplicaRoutingTest(TransactionTestCase):
+    databases = {'default', 'replica1', 'replica2'}
+
+    def setUp(self):
+        author = Author.objects.create(name='tom')
+        self.post = Post.objects.create(title='hello', author=author)
+        self.queries = {}
+        for alias in self.databases:
+            wrapper = (
+                lambda execute, sql, params, many, context, alias=alias:
+                self.queries.setdefault(alias, []).append(sql) or
+                execute(sql, params, many, context)
+            )
+            self.enterContext(connections[alias].execute_wrapper(wrapper))
+
+    def retrieve(self, servicer, metadata=()):
+        context = FakeContext()
+        context._invocation_metadata.extend(metadata)
+        return servicer.Retrieve(posts_pb2.PostRetrieveRequest(id=self.post.pk), context)
+
+    def test_read_actions(self):
+        with override_settings(GRPC_FRAMEWORK={
+                'ROOT_HANDLERS_HOOK': 'testapp.handlers.grpc_handlers',
+                'READ_DATABASES': ['replica1', 'replica2']}):
+            servicer = PostService.as_servicer()
+            for _ in range(4):
+                self.assertEqual(self.retrieve(servicer).title, 'hello')
+            messages = servicer.List(posts_pb2.PostListRequest(), FakeContext())
+            self.assertEqual(len(list(messages)), 1)
+            servicer.PartialUpdate(
+                posts_pb2.Post(id=self.post.pk, title='bye'),
+                FakeContext(),
+            )
+        # Two queries per Retrieve, the post and its tags.
+        self.assertEqual(len(self.queries['replica1']), 6)
+        self.assertEqual(len(self.queries['replica2']), 4)
+        self.assertTrue(any(sql.startswith('UPDATE') for sql in self.queries['default']))
+        self.assertEqual(routing.balancer.in_flight(), {})
+
+    def test_read_your_writes(self):
+        servicer = PostService.as_servicer(
+            read_databases=['replica1'], read_your_writes_window=5,
+        )
+        self.retrieve(servicer, [(routing.LAST_WRITE_METADATA_KEY, str(time.time() - 1))])
+        self.assertNotIn('replica1', self.queries)
+        self.retrieve(servicer, [(routing.LAST_WRITE_METADATA_KEY, str(time.time() - 10))])
+        self.assertEqual(len(self.queries['replica1']), 2)
@@ -1,2 +1,253 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from unittest import mock
+
+from django.test import override_settings
+import pytest
+
+from django_grpc_framework import hooks
+from django_grpc_framework.services import Service, not_implemented
+from django_grpc_framework.signals import grpc_request_started
+from django_grpc_framework.utils import singleflight
+from django_grpc_framework.utils.loops import ThreadLoopRunner
+
+
+class PingService(Service):
+    greeting = 'pong'
+
+    def Ping(self, request, context):
+        return (self.greeting, request, self.action)
+
+    async def AsyncPing(self, request, context):
+        return (self.greeting, request, self.action)
+
+    def StreamPing(self, request, context):
+        for i in range(request):
+            yield i
+
+    async def AsyncStreamPing(self, request, context):
+        for i in range(request):
+            yield i
+
+    def lowercase_ping(self, request, context):
+        return request
+
+
 def test_basic_service():
     assert True
+
+
+def test_servicer_precompiles_handlers():
+    servicer = PingService.as_servicer()
+    assert set(servicer.handlers) == {'Ping', 'AsyncPing', 'StreamPing', 'AsyncStreamPing'}
+    for action, handler in servicer.handlers.items():
+        assert servicer.__dict__[action] is handler
+        assert getattr(servicer, action) is handler
+        assert handler.__name__ == action
+
+
+def test_servicer_handler_variants():
+    servicer = PingService.as_servicer(greeting='hi')
+    assert servicer.Ping('req', None) == ('hi', 'req', 'Ping')
+    assert asyncio.run(servicer.AsyncPing('req', None)) == ('hi', 'req', 'AsyncPing')
+    assert list(servicer.StreamPing(3, None)) == [0, 1, 2]
+
+    async def collect():
+        return [i async for i in servicer.AsyncStreamPing(3, None)]
+
+    assert asyncio.run(collect()) == [0, 1, 2]
+
+
+def test_servicer_fallbacks():
+    servicer = PingService.as_servicer()
+    assert servicer.Missing is not_implemented
+    handler = servicer.lowercase_ping
+    assert servicer.lowercase_ping is handler
+    assert handler('req', None) == 'req'
+
+
+def test_servicer_invalid_initkwargs():
+    with pytest.raises(TypeError):
+        PingService.as_servicer(missing=True)
+
+
+def test_thread_loop_runner():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    runner = ThreadLoopRunner()
+    loop = runner.run(current_loop())
+    assert runner.run(current_loop()) is loop
+    other = []
+    thread = threading.Thread(target=lambda: other.append(runner.run(current_loop())))
+    thread.start()
+    thread.join()
+    assert other[0] is not loop
+    runner.close()
+    assert loop.is_closed() and other[0].is_closed()
+    new_loop = runner.run(current_loop())
+    assert new_loop is not loop
+
+    async def close():
+        # Like grpcrunserver, closing from a coroutine of another loop.
+        runner.close()
+
+    asyncio.run(close())
+    assert new_loop.is_closed()
+
+
+def test_sync_handler_runs_awaitable():
+    class AwaitingService(Service):
+        def Ping(self, request, context):
+            return asyncio.sleep(0, result=request)
+
+    assert AwaitingService.as_servicer().Ping('req', None) == 'req'
+
+
+class SlowPingService(Service):
+    singleflight_actions = ('Ping', 'AsyncPing')
+    calls = None
+    release = None
+
+    def get_singleflight_key(self):
+        return self.request
+
+    def Ping(self, request, context):
+        self.calls.append(request)
+        self.release.wait()
+        return [request]
+
+    async def AsyncPing(self, request, context):
+        self.calls.append(request)
+        await asyncio.sleep(0.01)
+        if request == 'fail':
+            raise ValueError(request)
+        return [request]
+
+
+def test_singleflight_sync():
+    singleflight.group.reset_metrics()
+    calls, release = [], threading.Event()
+    servicer = SlowPingService.as_servicer(calls=calls, release=release)
+    waiting = threading.Semaphore(0)
+
+    class WaitedEvent(threading.Event):
+        def wait(self, timeout=None):
+            waiting.release()
+            return super().wait(timeout)
+
+    class WaitedCall(singleflight._Call):
+        __slots__ = ()
+
+        def __init__(self):
+            super().__init__()
+            self.event = WaitedEvent()
+
+    with mock.patch.object(singleflight, '_Call', WaitedCall), \
+            ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(servicer.Ping, 'hot', None) for _ in range(3)]
+        # The leader is held in Ping() until both followers wait for it.
+        for _ in range(2):
+            assert waiting.acquire(timeout=5)
+        release.set()
+        results = [future.result() for future in futures]
+    assert results == [['hot']] * 3
+    assert results[0] is results[1]
+    assert calls == ['hot']
+    metrics = singleflight.group.metrics()
+    assert metrics['by_action'][(SlowPingService, 'Ping')] == {'calls': 3, 'collapsed': 2}
+    assert metrics['in_flight'] == 0
+
+
+def test_singleflight_by_servicer():
+    calls, release = [], threading.Event()
+    servicers = [
+        SlowPingService.as_servicer(calls=calls, release=release),
+        SlowPingService.as_servicer(calls=calls, release=release),
+    ]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(servicer.Ping, 'hot', None) for servicer in servicers]
+        deadline = time.monotonic() + 1
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+    assert results == [['hot']] * 2
+    assert results[0] is not results[1]
+    assert calls == ['hot', 'hot']
+
+
+def test_singleflight_async():
+    singleflight.group.reset_metrics()
+    calls = []
+    servicer = SlowPingService.as_servicer(calls=calls)
+
+    async def ping_all(requests):
+        return await asyncio.gather(
+            *[servicer.AsyncPing(request, None) for request in requests],
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(ping_all(['hot', 'hot', 'cold', 'fail', 'fail']))
+    assert results[:3] == [['hot'], ['hot'], ['cold']]
+    assert all(isinstance(result, ValueError) for result in results[3:])
+    # The second failing call runs on its own after the first one failed.
+    assert calls == ['hot', 'cold', 'fail', 'fail']
+    metrics = singleflight.group.metrics()
+    assert metrics['by_action'][(SlowPingService, 'AsyncPing')] == {'calls': 5, 'collapsed': 1}
+
+
+def test_lifecycle_hooks():
+    events = []
+
+    def started(sender, request, context):
+        events.append(('started', sender.__name__, request))
+
+    async def finished(sender):
+        events.append(('finished', sender.__name__))
+
+    def receiver(sender, **kwargs):
+        events.append(('signal', sender.__name__))
+
+    hooks.request_started(started)
+    hooks.request_finished(finished)
+    try:
+        servicer = PingService.as_servicer()
+    finally:
+        hooks._started.remove(started)
+        hooks._finished.remove(finished)
+    grpc_request_started.connect(receiver)
+    try:
+        servicer.Ping('req', None)
+        asyncio.run(servicer.AsyncPing('req', None))
+    finally:
+        grpc_request_started.disconnect(receiver)
+    assert events == [
+        ('signal', 'Ping'), ('started', 'Ping', 'req'), ('finished', 'Ping'),
+        ('signal', 'AsyncPing'), ('started', 'AsyncPing', 'req'), ('finished', 'AsyncPing'),
+    ]
+    # Hooks registered after as_servicer() are not run by its handlers.
+    events.clear()
+    servicer = PingService.as_servicer()
+    servicer.Ping('req', None)
+    assert events == []
+
+
+def test_connection_housekeeping():
+    servicer = PingService.as_servicer()
+    with mock.patch.object(hooks, 'close_old_connections') as close_old_connections:
+        for _ in range(3):
+            servicer.Ping('req', None)
+        # When each call starts and finishes.
+        assert close_old_connections.call_count == 6
+        close_old_connections.reset_mock()
+        with override_settings(GRPC_FRAMEWORK={'CONNECTION_HOUSEKEEPING_INTERVAL': 60}):
+            for _ in range(3):
+                servicer.Ping('req', None)
+        assert close_old_connections.call_count == 1
+        close_old_connections.reset_mock()
+        with hooks.housekeeping.disabled():
+            servicer.Ping('req', None)
+        assert close_old_connections.call_count == 0
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+from django.test import TestCase
+import grpc
+import pytest
+from rest_framework import serializers
+
+from django_grpc_framework.management.commands.grpcrunserver import PendingLimitInterceptor
+from django_grpc_framework.utils.executors import MeteredThreadPoolExecutor
+from django_grpc_framework.utils.optimizer import get_optimizations, optimize_queryset
+from testapp.models import Author, Post, Tag
+
+
+def test_metered_executor_metrics():
+    release = threading.Event()
+    executor = MeteredThreadPoolExecutor(max_workers=2)
+    blocked = [executor.submit(release.wait) for _ in range(3)]
+    done = executor.submit(lambda x: x * 2, 21)
+    metrics = executor.metrics()
+    assert metrics['submitted'] == 4
+    assert metrics['peak_pending'] >= 2
+    release.set()
+    assert done.result() == 42
+    for future in blocked:
+        future.result()
+    executor.shutdown(wait=True)
+    metrics = executor.metrics()
+    assert metrics['completed'] == 4
+    assert metrics['active'] == 0
+    assert metrics['pending'] == 0
+    assert metrics['saturation'] == 0
+
+
+def test_pending_limit_interceptor():
+    release = threading.Event()
+    executor = MeteredThreadPoolExecutor(max_workers=1)
+
+    def block(request, context):
+        release.wait(5)
+        return request
+
+    async def echo(request, context):
+        return request
+
+    handler = grpc.method_handlers_generic_handler('Test', {
+        'Block': grpc.unary_unary_rpc_method_handler(block),
+        'Echo': grpc.unary_unary_rpc_method_handler(echo),
+    })
+
+    async def run():
+        server = grpc.aio.server(
+            migration_thread_pool=executor, handlers=[handler],
+            interceptors=[PendingLimitInterceptor(executor, 1)],
+        )
+        port = server.add_insecure_port('127.0.0.1:0')
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel('127.0.0.1:%d' % port) as channel:
+                block_call = channel.unary_unary('/Test/Block')
+                calls = [block_call(b'1'), block_call(b'2')]
+                while executor.metrics()['pending'] < 1:
+                    await asyncio.sleep(0.001)
+                with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+                    await block_call(b'3')
+                # Coroutine handlers do not wait for a worker.
+                assert await channel.unary_unary('/Test/Echo')(b'4') == b'4'
+                release.set()
+                assert await asyncio.gather(*calls) == [b'1', b'2']
+                return exc_info.value.code()
+        finally:
+            await server.stop(None)
+
+    assert asyncio.run(run()) == grpc.StatusCode.RESOURCE_EXHAUSTED
+    executor.shutdown(wait=True)
+
+
+class AuthorSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Author
+        fields = ['id', 'name']
+
+
+class TagSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Tag
+        fields = ['name']
+
+
+class PostSerializer(serializers.ModelSerializer):
+    author = AuthorSerializer()
+    tags = TagSerializer(many=True)
+    author_email = serializers.CharField(source='author.email')
+
+    class Meta:
+        model = Post
+        fields = ['id', 'title', 'author', 'tags', 'author_email']
+
+
+class OptimizerTest(TestCase):
+    def test_get_optimizations(self):
+        select_related, prefetch_related, only = get_optimizations(
+            PostSerializer(), Post
+        )
+        self.assertEqual(select_related, ('author',))
+        self.assertEqual(prefetch_related, ('tags',))
+        self.assertEqual(only, (
+            'id', 'title', 'author', 'author__id', 'author__name', 'author__email',
+        ))
+
+    def test_unknown_sources_load_all_columns(self):
+        class MethodPostSerializer(PostSerializer):
+            author = serializers.StringRelatedField()
+            summary = serializers.SerializerMethodField()
+
+            class Meta(PostSerializer.Meta):
+                fields = PostSerializer.Meta.fields + ['summary']
+
+        select_related, prefetch_related, only = get_optimizations(
+            MethodPostSerializer(), Post
+        )
+        self.assertEqual(select_related, ('author',))
+        self.assertIsNone(only)
+
+    def test_no_query_per_row(self):
+        author = Author.objects.create(name='tom', email='tom@example.com')
+        tag = Tag.objects.create(name='django')
+        for i in range(3):
+            Post.objects.create(title='post %d' % i, author=author).tags.add(tag)
+        queryset = optimize_queryset(Post.objects.all(), PostSerializer())
+        with self.assertNumQueries(2):
+            data = PostSerializer(queryset, many=True).data
+        self.assertEqual(data[0]['author'], {'id': author.pk, 'name': 'tom'})
+        self.assertEqual(data[2]['tags'], [{'name': 'django'}])
+        self.assertEqual(data[1]['author_email'], 'tom@example.com')
@@ -0,0 +1,12 @@
+from testapp import posts_pb2_grpc
+from testapp.services import NumberedPostService, PagedPostService, PostService
+
+
+def grpc_handlers(server):
+    posts_pb2_grpc.add_PostControllerServicer_to_server(PostService.as_servicer(), server)
+    posts_pb2_grpc.add_PagedPostControllerServicer_to_server(
+        PagedPostService.as_servicer(), server
+    )
+    posts_pb2_grpc.add_NumberedPostControllerServicer_to_server(
+        NumberedPostService.as_servicer(), server
+    )
@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=100)
+    email = models.EmailField(blank=True)
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=50, unique=True)
+
+
+class Post(models.Model):
+    title = models.CharField(max_length=100)
+    content = models.TextField(blank=True)
+    author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name='posts')
+    tags = models.ManyToManyField(Tag, blank=True, related_name='posts')
+    price = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    published = models.DateTimeField(null=True, blank=True)
+    views = models.BigIntegerField(default=0)
+    is_public = models.BooleanField(default=True)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: testapp/posts.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'testapp/posts.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13testapp/posts.proto\x12\x07testapp\x1a\x1bgoogle/protobuf/empty.proto\"\x94\x01\n\x04Post\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x04 \x01(\x05\x12\x0c\n\x04tags\x18\x05 \x03(\x05\x12\r\n\x05price\x18\x06 \x01(\t\x12\x11\n\tpublished\x18\x07 \x01(\t\x12\r\n\x05views\x18\x08 \x01(\x03\x12\x11\n\tis_public\x18\t \x01(\x08\"\x11\n\x0fPostListRequest\"!\n\x13PostRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"i\n\x10ListPostsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x0c\n\x04skip\x18\x03 \x01(\x05\x12\x10\n\x08order_by\x18\x04 \x01(\t\x12\x0e\n\x06\x66ilter\x18\x05 \x01(\t\"J\n\x11ListPostsResponse\x12\x1c\n\x05posts\x18\x01 \x03(\x0b\x32\r.testapp.Post\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"J\n\x18ListNumberedPostsRequest\x12\x0c\n\x04page\x18\x01 \x01(\x05\x12\x10\n\x08order_by\x18\x02 \x01(\t\x12\x0e\n\x06\x66ilter\x18\x03 \x01(\t\"p\n\x19ListNumberedPostsResponse\x12\x1e\n\x07results\x18\x01 \x03(\x0b\x32\r.testapp.Post\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12\x11\n\tnext_page\x18\x03 \x01(\x05\x12\x11\n\tprev_page\x18\x04 \x01(\x05\"&\n\x18PostBatchRetrieveRequest\x12\n\n\x02id\x18\x01 \x03(\x05\"L\n\x19PostBatchRetrieveResponse\x12\x1e\n\x07results\x18\x01 \x03(\x0b\x32\r.testapp.Post\x12\x0f\n\x07missing\x18\x02 \x03(\x05\"/\n\rPostBulkError\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x0f\n\x07\x64\x65tails\x18\x02 \x01(\t\"a\n\x16PostBulkCreateResponse\x12\x0f\n\x07\x63reated\x18\x01 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x02 \x01(\x05\x12&\n\x06\x65rrors\x18\x03 \x03(\x0b\x32\x16.testapp.PostBulkError\"a\n\x16PostBulkUpdateResponse\x12\x0f\n\x07updated\x18\x01 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x02 \x01(\x05\x12&\n\x06\x65rrors\x18\x03 \x03(\x0b\x32\x16.testapp.PostBulkError\"b\n\x17PostBulkDestroyResponse\x12\x0f\n\x07\x64\x65leted\x18\x01 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x02 \x01(\x05\x12&\n\x06\x65rrors\x18\x03 \x03(\x0b\x32\x16.testapp.PostBulkError2\xea\x04\n\x0ePostController\x12\x33\n\x04List\x12\x18.testapp.PostListRequest\x1a\r.testapp.Post\"\x00\x30\x01\x12(\n\x06\x43reate\x12\r.testapp.Post\x1a\r.testapp.Post\"\x00\x12\x39\n\x08Retrieve\x12\x1c.testapp.PostRetrieveRequest\x1a\r.testapp.Post\"\x00\x12(\n\x06Update\x12\r.testapp.Post\x1a\r.testapp.Post\"\x00\x12/\n\rPartialUpdate\x12\r.testapp.Post\x1a\r.testapp.Post\"\x00\x12\x32\n\x07\x44\x65stroy\x12\r.testapp.Post\x1a\x16.google.protobuf.Empty\"\x00\x12X\n\rBatchRetrieve\x12!.testapp.PostBatchRetrieveRequest\x1a\".testapp.PostBatchRetrieveResponse\"\x00\x12@\n\nBulkCreate\x12\r.testapp.Post\x1a\x1f.testapp.PostBulkCreateResponse\"\x00(\x01\x12@\n\nBulkUpdate\x12\r.testapp.Post\x1a\x1f.testapp.PostBulkUpdateResponse\"\x00(\x01\x12Q\n\x0b\x42ulkDestroy\x12\x1c.testapp.PostRetrieveRequest\x1a .testapp.PostBulkDestroyResponse\"\x00(\x01\x32V\n\x13PagedPostController\x12?\n\x04List\x12\x19.testapp.ListPostsRequest\x1a\x1a.testapp.ListPostsResponse\"\x00\x32i\n\x16NumberedPostController\x12O\n\x04List\x12!.testapp.ListNumberedPostsRequest\x1a\".testapp.ListNumberedPostsResponse\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'testapp.posts_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_POST']._serialized_start=62
+  _globals['_POST']._serialized_end=210
+  _globals['_POSTLISTREQUEST']._serialized_start=212
+  _globals['_POSTLISTREQUEST']._serialized_end=229
+  _globals['_POSTRETRIEVEREQUEST']._serialized_start=231
+  _globals['_POSTRETRIEVEREQUEST']._serialized_end=264
+  _globals['_LISTPOSTSREQUEST']._serialized_start=266
+  _globals['_LISTPOSTSREQUEST']._serialized_end=371
+  _globals['_LISTPOSTSRESPONSE']._serialized_start=373
+  _globals['_LISTPOSTSRESPONSE']._serialized_end=447
+  _globals['_LISTNUMBEREDPOSTSREQUEST']._serialized_start=449
+  _globals['_LISTNUMBEREDPOSTSREQUEST']._serialized_end=523
+  _globals['_LISTNUMBEREDPOSTSRESPONSE']._serialized_start=525
+  _globals['_LISTNUMBEREDPOSTSRESPONSE']._serialized_end=637
+  _globals['_POSTBATCHRETRIEVEREQUEST']._serialized_start=639
+  _globals['_POSTBATCHRETRIEVEREQUEST']._serialized_end=677
+  _globals['_POSTBATCHRETRIEVERESPONSE']._serialized_start=679
+  _globals['_POSTBATCHRETRIEVERESPONSE']._serialized_end=755
+  _globals['_POSTBULKERROR']._serialized_start=757
+  _globals['_POSTBULKERROR']._serialized_end=804
+  _globals['_POSTBULKCREATERESPONSE']._serialized_start=806
+  _globals['_POSTBULKCREATERESPONSE']._serialized_end=903
+  _globals['_POSTBULKUPDATERESPONSE']._serialized_start=905
+  _globals['_POSTBULKUPDATERESPONSE']._serialized_end=1002
+  _globals['_POSTBULKDESTROYRESPONSE']._serialized_start=1004
+  _globals['_POSTBULKDESTROYRESPONSE']._serialized_end=1102
+  _globals['_POSTCONTROLLER']._serialized_start=1105
+  _globals['_POSTCONTROLLER']._serialized_end=1723
+  _globals['_PAGEDPOSTCONTROLLER']._serialized_start=1725
+  _globals['_PAGEDPOSTCONTROLLER']._serialized_end=1811
+  _globals['_NUMBEREDPOSTCONTROLLER']._serialized_start=1813
+  _globals['_NUMBEREDPOSTCONTROLLER']._serialized_end=1918
+# @@protoc_insertion_point(module_scope)
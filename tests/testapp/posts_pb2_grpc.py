@@ -0,0 +1,629 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from testapp import posts_pb2 as testapp_dot_posts__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in testapp/posts_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class PostControllerStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.List = channel.unary_stream(
+                '/testapp.PostController/List',
+                request_serializer=testapp_dot_posts__pb2.PostListRequest.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                _registered_method=True)
+        self.Create = channel.unary_unary(
+                '/testapp.PostController/Create',
+                request_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                _registered_method=True)
+        self.Retrieve = channel.unary_unary(
+                '/testapp.PostController/Retrieve',
+                request_serializer=testapp_dot_posts__pb2.PostRetrieveRequest.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                _registered_method=True)
+        self.Update = channel.unary_unary(
+                '/testapp.PostController/Update',
+                request_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                _registered_method=True)
+        self.PartialUpdate = channel.unary_unary(
+                '/testapp.PostController/PartialUpdate',
+                request_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                _registered_method=True)
+        self.Destroy = channel.unary_unary(
+                '/testapp.PostController/Destroy',
+                request_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
+        self.BatchRetrieve = channel.unary_unary(
+                '/testapp.PostController/BatchRetrieve',
+                request_serializer=testapp_dot_posts__pb2.PostBatchRetrieveRequest.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.PostBatchRetrieveResponse.FromString,
+                _registered_method=True)
+        self.BulkCreate = channel.stream_unary(
+                '/testapp.PostController/BulkCreate',
+                request_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.PostBulkCreateResponse.FromString,
+                _registered_method=True)
+        self.BulkUpdate = channel.stream_unary(
+                '/testapp.PostController/BulkUpdate',
+                request_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.PostBulkUpdateResponse.FromString,
+                _registered_method=True)
+        self.BulkDestroy = channel.stream_unary(
+                '/testapp.PostController/BulkDestroy',
+                request_serializer=testapp_dot_posts__pb2.PostRetrieveRequest.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.PostBulkDestroyResponse.FromString,
+                _registered_method=True)
+
+
+class PostControllerServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def List(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Create(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Retrieve(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Update(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PartialUpdate(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Destroy(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchRetrieve(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BulkCreate(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BulkUpdate(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BulkDestroy(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_PostControllerServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'List': grpc.unary_stream_rpc_method_handler(
+                    servicer.List,
+                    request_deserializer=testapp_dot_posts__pb2.PostListRequest.FromString,
+                    response_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+            ),
+            'Create': grpc.unary_unary_rpc_method_handler(
+                    servicer.Create,
+                    request_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                    response_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+            ),
+            'Retrieve': grpc.unary_unary_rpc_method_handler(
+                    servicer.Retrieve,
+                    request_deserializer=testapp_dot_posts__pb2.PostRetrieveRequest.FromString,
+                    response_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+            ),
+            'Update': grpc.unary_unary_rpc_method_handler(
+                    servicer.Update,
+                    request_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                    response_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+            ),
+            'PartialUpdate': grpc.unary_unary_rpc_method_handler(
+                    servicer.PartialUpdate,
+                    request_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                    response_serializer=testapp_dot_posts__pb2.Post.SerializeToString,
+            ),
+            'Destroy': grpc.unary_unary_rpc_method_handler(
+                    servicer.Destroy,
+                    request_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'BatchRetrieve': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchRetrieve,
+                    request_deserializer=testapp_dot_posts__pb2.PostBatchRetrieveRequest.FromString,
+                    response_serializer=testapp_dot_posts__pb2.PostBatchRetrieveResponse.SerializeToString,
+            ),
+            'BulkCreate': grpc.stream_unary_rpc_method_handler(
+                    servicer.BulkCreate,
+                    request_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                    response_serializer=testapp_dot_posts__pb2.PostBulkCreateResponse.SerializeToString,
+            ),
+            'BulkUpdate': grpc.stream_unary_rpc_method_handler(
+                    servicer.BulkUpdate,
+                    request_deserializer=testapp_dot_posts__pb2.Post.FromString,
+                    response_serializer=testapp_dot_posts__pb2.PostBulkUpdateResponse.SerializeToString,
+            ),
+            'BulkDestroy': grpc.stream_unary_rpc_method_handler(
+                    servicer.BulkDestroy,
+                    request_deserializer=testapp_dot_posts__pb2.PostRetrieveRequest.FromString,
+                    response_serializer=testapp_dot_posts__pb2.PostBulkDestroyResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'testapp.PostController', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('testapp.PostController', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class PostController:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def List(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/testapp.PostController/List',
+            testapp_dot_posts__pb2.PostListRequest.SerializeToString,
+            testapp_dot_posts__pb2.Post.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Create(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/testapp.PostController/Create',
+            testapp_dot_posts__pb2.Post.SerializeToString,
+            testapp_dot_posts__pb2.Post.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Retrieve(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/testapp.PostController/Retrieve',
+            testapp_dot_posts__pb2.PostRetrieveRequest.SerializeToString,
+            testapp_dot_posts__pb2.Post.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Update(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/testapp.PostController/Update',
+            testapp_dot_posts__pb2.Post.SerializeToString,
+            testapp_dot_posts__pb2.Post.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def PartialUpdate(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/testapp.PostController/PartialUpdate',
+            testapp_dot_posts__pb2.Post.SerializeToString,
+            testapp_dot_posts__pb2.Post.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Destroy(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/testapp.PostController/Destroy',
+            testapp_dot_posts__pb2.Post.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchRetrieve(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/testapp.PostController/BatchRetrieve',
+            testapp_dot_posts__pb2.PostBatchRetrieveRequest.SerializeToString,
+            testapp_dot_posts__pb2.PostBatchRetrieveResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BulkCreate(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/testapp.PostController/BulkCreate',
+            testapp_dot_posts__pb2.Post.SerializeToString,
+            testapp_dot_posts__pb2.PostBulkCreateResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BulkUpdate(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/testapp.PostController/BulkUpdate',
+            testapp_dot_posts__pb2.Post.SerializeToString,
+            testapp_dot_posts__pb2.PostBulkUpdateResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BulkDestroy(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/testapp.PostController/BulkDestroy',
+            testapp_dot_posts__pb2.PostRetrieveRequest.SerializeToString,
+            testapp_dot_posts__pb2.PostBulkDestroyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class PagedPostControllerStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.List = channel.unary_unary(
+                '/testapp.PagedPostController/List',
+                request_serializer=testapp_dot_posts__pb2.ListPostsRequest.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.ListPostsResponse.FromString,
+                _registered_method=True)
+
+
+class PagedPostControllerServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def List(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_PagedPostControllerServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'List': grpc.unary_unary_rpc_method_handler(
+                    servicer.List,
+                    request_deserializer=testapp_dot_posts__pb2.ListPostsRequest.FromString,
+                    response_serializer=testapp_dot_posts__pb2.ListPostsResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'testapp.PagedPostController', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('testapp.PagedPostController', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class PagedPostController:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def List(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/testapp.PagedPostController/List',
+            testapp_dot_posts__pb2.ListPostsRequest.SerializeToString,
+            testapp_dot_posts__pb2.ListPostsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class NumberedPostControllerStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.List = channel.unary_unary(
+                '/testapp.NumberedPostController/List',
+                request_serializer=testapp_dot_posts__pb2.ListNumberedPostsRequest.SerializeToString,
+                response_deserializer=testapp_dot_posts__pb2.ListNumberedPostsResponse.FromString,
+                _registered_method=True)
+
+
+class NumberedPostControllerServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def List(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_NumberedPostControllerServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'List': grpc.unary_unary_rpc_method_handler(
+                    servicer.List,
+                    request_deserializer=testapp_dot_posts__pb2.ListNumberedPostsRequest.FromString,
+                    response_serializer=testapp_dot_posts__pb2.ListNumberedPostsResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'testapp.NumberedPostController', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('testapp.NumberedPostController', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class NumberedPostController:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def List(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/testapp.NumberedPostController/List',
+            testapp_dot_posts__pb2.ListNumberedPostsRequest.SerializeToString,
+            testapp_dot_posts__pb2.ListNumberedPostsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
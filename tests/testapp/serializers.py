@@ -0,0 +1,20 @@
+from django_grpc_framework import proto_serializers
+from testapp.models import Post
+from testapp import posts_pb2
+
+
+class PostProtoSerializer(proto_serializers.ModelProtoSerializer):
+    class Meta:
+        model = Post
+        proto_class = posts_pb2.Post
+        fields = [
+            'id', 'title', 'content', 'author', 'tags', 'price', 'published',
+            'views', 'is_public',
+        ]
+
+
+class CompiledPostProtoSerializer(proto_serializers.CompiledModelProtoSerializer):
+    class Meta:
+        model = Post
+        proto_class = posts_pb2.Post
+        fields = PostProtoSerializer.Meta.fields
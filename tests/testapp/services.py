@@ -0,0 +1,42 @@
+from django_grpc_framework import generics, mixins
+from testapp import posts_pb2
+from testapp.models import Post
+from testapp.serializers import PostProtoSerializer
+
+
+class PostService(mixins.PartialUpdateModelMixin, mixins.BatchRetrieveModelMixin,
+                  mixins.BulkCreateModelMixin, mixins.BulkUpdateModelMixin,
+                  mixins.BulkDestroyModelMixin, generics.ModelService):
+    queryset = Post.objects.all().order_by('pk')
+    serializer_class = PostProtoSerializer
+    batch_retrieve_response_class = posts_pb2.PostBatchRetrieveResponse
+    bulk_create_response_class = posts_pb2.PostBulkCreateResponse
+    bulk_update_response_class = posts_pb2.PostBulkUpdateResponse
+    bulk_destroy_response_class = posts_pb2.PostBulkDestroyResponse
+
+
+class AsyncPostService(mixins.AsyncPartialUpdateModelMixin,
+                       generics.AsyncModelService):
+    queryset = Post.objects.all().order_by('pk')
+    serializer_class = PostProtoSerializer
+
+
+class PagedPostService(mixins.CursorPaginatedListMixin, generics.GenericService):
+    queryset = Post.objects.all()
+    serializer_class = PostProtoSerializer
+    list_response_class = posts_pb2.ListPostsResponse
+
+
+class NumberedPostService(mixins.PageNumberPaginatedListMixin, generics.GenericService):
+    queryset = Post.objects.all()
+    serializer_class = PostProtoSerializer
+    list_response_class = posts_pb2.ListNumberedPostsResponse
+    page_size = 5
+
+
+class AsyncNumberedPostService(mixins.AsyncPageNumberPaginatedListMixin,
+                               generics.AsyncGenericService):
+    queryset = Post.objects.all()
+    serializer_class = PostProtoSerializer
+    list_response_class = posts_pb2.ListNumberedPostsResponse
+    page_size = 5